@@ -1,7 +1,9 @@
 from django.contrib import admin
 
 from .models import (
+    Appointment,
     AppointmentEvent,
+    AppointmentEventArchive,
     ContactLink,
     Page,
     Project,
@@ -32,32 +34,32 @@ class ProjectAdmin(admin.ModelAdmin):
     list_display = ("title", "slug", "is_published", "order", "updated_at")
     list_filter = ("is_published",)
     search_fields = ("title", "slug")
-    ordering = ("order", "id")
+    ordering = ("rank", "id")
 
 
 @admin.register(Stat)
 class StatAdmin(admin.ModelAdmin):
     list_display = ("label", "number", "order")
-    ordering = ("order", "id")
+    ordering = ("rank", "id")
 
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
     list_display = ("name", "order")
     search_fields = ("name",)
-    ordering = ("order", "id")
+    ordering = ("rank", "id")
 
 
 @admin.register(SocialLink)
 class SocialLinkAdmin(admin.ModelAdmin):
     list_display = ("name", "url", "order")
-    ordering = ("order", "id")
+    ordering = ("rank", "id")
 
 
 @admin.register(ContactLink)
 class ContactLinkAdmin(admin.ModelAdmin):
     list_display = ("title", "href", "order")
-    ordering = ("order", "id")
+    ordering = ("rank", "id")
 
 
 @admin.register(AppointmentEvent)
@@ -74,3 +76,17 @@ class AppointmentEventAdmin(admin.ModelAdmin):
     )
     search_fields = ("event_id", "appointment_id", "email")
     ordering = ("-occurred_at", "-id")
+
+
+@admin.register(Appointment)
+class AppointmentAdmin(admin.ModelAdmin):
+    list_display = ("appointment_id", "status", "email", "start_time", "event_count", "last_occurred_at")
+    search_fields = ("appointment_id", "email")
+    ordering = ("-last_occurred_at", "-id")
+
+
+@admin.register(AppointmentEventArchive)
+class AppointmentEventArchiveAdmin(admin.ModelAdmin):
+    list_display = ("first_occurred_at", "last_occurred_at", "event_count", "created_at")
+    ordering = ("first_occurred_at", "id")
+    exclude = ("data",)
@@ -1,17 +1,53 @@
 from __future__ import annotations
 
-import json
+import asyncio
+from datetime import datetime
 from typing import Any
+from urllib.parse import urlencode
 
-from django.conf import settings
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate, login, logout
-from django.http import HttpResponse, JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseNotAllowed, StreamingHttpResponse
 from django.middleware.csrf import get_token
-from django.utils.text import slugify
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date, parse_datetime
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_http_methods
 
+from .admin_resources import (
+    AdminField,
+    AdminResource,
+    error_response,
+    integer,
+    parse_json,
+    required,
+    require_admin,
+    requested_fields,
+    tag_list,
+    text,
+)
+from .calendar import MAX_RANGE, find_conflicts, overlapping
+from .changes import CursorError, delta_payload, parse_since
+from . import live, ratelimit
+from .encoding import json_response
+from .exports import EXPORT_CONTENT_TYPES, EXPORT_FORMATS, iter_appointment_export
+from .ics import (
+    FEED_TOKEN_PARAM,
+    ICS_CONTENT_TYPE,
+    cached_feed,
+    feed_etag,
+    feed_marker,
+    feed_token,
+    feed_window_start,
+    iter_caching,
+    iter_feed,
+    user_for_token,
+)
 from .models import (
+    Appointment,
     AppointmentEvent,
     ContactLink,
     Page,
@@ -21,56 +57,18 @@ from .models import (
     SocialLink,
     Stat,
 )
-
-
-ADMIN_CORS_HEADERS = "Content-Type, X-CSRFToken"
-ADMIN_CORS_METHODS = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
-
-
-def _allowed_admin_origins() -> set[str]:
-    origins = getattr(settings, "ADMIN_UI_ORIGINS", [])
-    return set(origins or [])
-
-
-def _apply_admin_cors(response: HttpResponse, request) -> HttpResponse:
-    origin = request.headers.get("Origin")
-    allowed = _allowed_admin_origins()
-    if origin and origin in allowed:
-        response["Access-Control-Allow-Origin"] = origin
-        response["Access-Control-Allow-Credentials"] = "true"
-        response["Access-Control-Allow-Headers"] = ADMIN_CORS_HEADERS
-        response["Access-Control-Allow-Methods"] = ADMIN_CORS_METHODS
-        response["Vary"] = "Origin"
-    return response
-
-
-def _admin_preflight(request) -> HttpResponse:
-    response = HttpResponse(status=204)
-    return _apply_admin_cors(response, request)
-
-
-def _error_response(message: str | list[str], status: int = 400, request=None) -> JsonResponse:
-    errors = message if isinstance(message, list) else [message]
-    response = JsonResponse({"errors": errors}, status=status)
-    return _apply_admin_cors(response, request) if request else response
-
-
-def _parse_json(request) -> tuple[dict[str, Any] | None, JsonResponse | None]:
-    try:
-        payload = json.loads(request.body or b"{}")
-    except json.JSONDecodeError:
-        return None, _error_response("Invalid JSON payload.", status=400, request=request)
-    if not isinstance(payload, dict):
-        return None, _error_response("JSON body must be an object.", status=400, request=request)
-    return payload, None
-
-
-def _require_admin(request) -> JsonResponse | None:
-    if not request.user.is_authenticated:
-        return _error_response("Authentication required.", status=401, request=request)
-    if not request.user.is_staff:
-        return _error_response("Admin access required.", status=403, request=request)
-    return None
+from .search import DEFAULT_PAGE_SIZE, SEARCH_SOURCES, search
+from .serializers import (
+    ADMIN_APPOINTMENT,
+    ADMIN_APPOINTMENT_STATE,
+    ADMIN_CONTACT_LINK,
+    ADMIN_PAGE,
+    ADMIN_PROJECT,
+    ADMIN_SITE_SETTING,
+    ADMIN_SKILL,
+    ADMIN_SOCIAL_LINK,
+    ADMIN_STAT,
+)
 
 
 def _serialize_user(user) -> dict[str, Any]:
@@ -83,174 +81,183 @@ def _serialize_user(user) -> dict[str, Any]:
     }
 
 
-def _serialize_page(page: Page) -> dict[str, Any]:
-    return {
-        "id": page.id,
-        "slug": page.slug,
-        "title": page.title,
-        "body": page.body,
-        "isPublished": page.is_published,
-        "createdAt": page.created_at.isoformat(),
-        "updatedAt": page.updated_at.isoformat(),
-    }
-
-
-def _serialize_project(project: Project) -> dict[str, Any]:
-    return {
-        "id": project.id,
-        "slug": project.slug,
-        "title": project.title,
-        "description": project.description,
-        "tags": project.tags or [],
-        "link": project.link,
-        "github": project.github,
-        "isPublished": project.is_published,
-        "order": project.order,
-        "createdAt": project.created_at.isoformat(),
-        "updatedAt": project.updated_at.isoformat(),
-    }
-
-
-def _serialize_stat(stat: Stat) -> dict[str, Any]:
-    return {
-        "id": stat.id,
-        "number": stat.number,
-        "label": stat.label,
-        "icon": stat.icon,
-        "order": stat.order,
-    }
-
-
-def _serialize_skill(skill: Skill) -> dict[str, Any]:
-    return {
-        "id": skill.id,
-        "name": skill.name,
-        "order": skill.order,
-    }
-
-
-def _serialize_social_link(link: SocialLink) -> dict[str, Any]:
-    return {
-        "id": link.id,
-        "name": link.name,
-        "url": link.url,
-        "icon": link.icon,
-        "order": link.order,
-    }
-
-
-def _serialize_contact_link(link: ContactLink) -> dict[str, Any]:
-    return {
-        "id": link.id,
-        "icon": link.icon,
-        "title": link.title,
-        "description": link.description,
-        "href": link.href,
-        "order": link.order,
-    }
-
-
-def _serialize_site_setting(setting: SiteSetting) -> dict[str, Any]:
-    return {
-        "id": setting.id,
-        "key": setting.key,
-        "value": setting.value,
-    }
-
-
-def _serialize_appointment(event: AppointmentEvent) -> dict[str, Any]:
-    return {
-        "id": event.id,
-        "eventId": event.event_id,
-        "eventType": event.event_type,
-        "occurredAt": event.occurred_at.isoformat(),
-        "appointmentId": event.appointment_id,
-        "userId": event.user_id,
-        "startTime": event.start_time.isoformat(),
-        "endTime": event.end_time.isoformat(),
-        "durationMinutes": event.duration_minutes,
-        "email": event.email,
-        "phoneE164": event.phone_e164,
-        "notifyEmail": event.notify_email,
-        "notifySms": event.notify_sms,
-        "kafkaTopic": event.kafka_topic,
-        "kafkaPartition": event.kafka_partition,
-        "kafkaOffset": event.kafka_offset,
-        "receivedAt": event.received_at.isoformat(),
-    }
-
+PAGES = AdminResource(
+    Page,
+    ADMIN_PAGE,
+    name="page",
+    path="pages",
+    list_key="pages",
+    item_key="page",
+    label="Page",
+    fields=(
+        AdminField("title", "title"),
+        AdminField("body", "body", text),
+        AdminField("isPublished", "is_published", bool, default=True),
+    ),
+    validators=(required("title"),),
+    slug_source="title",
+)
+PROJECTS = AdminResource(
+    Project,
+    ADMIN_PROJECT,
+    name="project",
+    path="projects",
+    list_key="projects",
+    item_key="project",
+    label="Project",
+    fields=(
+        AdminField("title", "title"),
+        AdminField("description", "description", text),
+        AdminField("tags", "tags", tag_list, default=[]),
+        AdminField("link", "link", text),
+        AdminField("github", "github", text),
+        AdminField("isPublished", "is_published", bool, default=True),
+        AdminField("order", "order", integer, default=0),
+    ),
+    validators=(required("title"),),
+    slug_source="title",
+    ranked=True,
+)
+STATS = AdminResource(
+    Stat,
+    ADMIN_STAT,
+    name="stat",
+    path="stats",
+    list_key="stats",
+    item_key="stat",
+    label="Stat",
+    fields=(
+        AdminField("number", "number"),
+        AdminField("label", "label"),
+        AdminField("icon", "icon", text),
+        AdminField("order", "order", integer, default=0),
+    ),
+    validators=(required("number", "label"),),
+    ranked=True,
+)
+SKILLS = AdminResource(
+    Skill,
+    ADMIN_SKILL,
+    name="skill",
+    path="skills",
+    list_key="skills",
+    item_key="skill",
+    label="Skill",
+    fields=(
+        AdminField("name", "name"),
+        AdminField("order", "order", integer, default=0),
+    ),
+    validators=(required("name"),),
+    ranked=True,
+)
+SOCIAL_LINKS = AdminResource(
+    SocialLink,
+    ADMIN_SOCIAL_LINK,
+    name="social-link",
+    path="social-links",
+    list_key="socialLinks",
+    item_key="socialLink",
+    label="Social link",
+    fields=(
+        AdminField("name", "name"),
+        AdminField("url", "url"),
+        AdminField("icon", "icon", text),
+        AdminField("order", "order", integer, default=0),
+    ),
+    validators=(required("name", "url"),),
+    ranked=True,
+)
+CONTACT_LINKS = AdminResource(
+    ContactLink,
+    ADMIN_CONTACT_LINK,
+    name="contact-link",
+    path="contact-links",
+    list_key="contactLinks",
+    item_key="contactLink",
+    label="Contact link",
+    fields=(
+        AdminField("icon", "icon", text),
+        AdminField("title", "title"),
+        AdminField("description", "description", text),
+        AdminField("href", "href"),
+        AdminField("order", "order", integer, default=0),
+    ),
+    validators=(required("title", "href"),),
+    ranked=True,
+)
 
-def _unique_slug(model, base_slug: str, instance_id: int | None = None) -> str:
-    slug = base_slug
-    suffix = 1
-    while model.objects.filter(slug=slug).exclude(id=instance_id).exists():
-        slug = f"{base_slug}-{suffix}"
-        suffix += 1
-    return slug
+# Content types served by the generic list/detail endpoints, in URL order.
+ADMIN_RESOURCES = (PAGES, PROJECTS, STATS, SKILLS, SOCIAL_LINKS, CONTACT_LINKS)
 
 
-@require_http_methods(["GET", "OPTIONS"])
+@require_http_methods(["GET"])
 @ensure_csrf_cookie
 def admin_csrf(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
     token = get_token(request)
-    response = JsonResponse({"csrfToken": token})
-    return _apply_admin_cors(response, request)
+    return json_response({"csrfToken": token})
 
 
-@require_http_methods(["GET", "OPTIONS"])
+@require_http_methods(["GET"])
 def admin_session(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
     if not request.user.is_authenticated:
-        response = JsonResponse({"authenticated": False})
-        return _apply_admin_cors(response, request)
-    response = JsonResponse({"authenticated": True, "user": _serialize_user(request.user)})
-    return _apply_admin_cors(response, request)
+        return json_response({"authenticated": False})
+    return json_response({"authenticated": True, "user": _serialize_user(request.user)})
 
 
-@require_http_methods(["POST", "OPTIONS"])
+@require_http_methods(["POST"])
 def admin_login(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    payload, error = _parse_json(request)
+    # Checked before authenticate(), whose password hashing is the expensive part of a login.
+    retry_after = ratelimit.check(ratelimit.LOGIN_IP, ratelimit.client_ip(request))
+    if retry_after:
+        return ratelimit.too_many_requests(retry_after)
+    payload, error = parse_json(request)
     if error:
         return error
     username = payload.get("username", "")
     password = payload.get("password", "")
+    retry_after = ratelimit.check(ratelimit.LOGIN_USER, str(username).strip().lower())
+    if retry_after:
+        return ratelimit.too_many_requests(retry_after)
     user = authenticate(request, username=username, password=password)
     if user is None:
-        return _error_response("Invalid username or password.", status=401, request=request)
+        return error_response("Invalid username or password.", status=401)
     if not user.is_staff:
-        return _error_response("Admin access required.", status=403, request=request)
+        return error_response("Admin access required.", status=403)
     login(request, user)
-    response = JsonResponse({"authenticated": True, "user": _serialize_user(user)})
-    return _apply_admin_cors(response, request)
+    return json_response({"authenticated": True, "user": _serialize_user(user)})
 
 
-@require_http_methods(["POST", "OPTIONS"])
+@require_http_methods(["POST"])
 def admin_logout(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
     logout(request)
-    response = JsonResponse({"ok": True})
-    return _apply_admin_cors(response, request)
+    return json_response({"ok": True})
+
+
+@require_http_methods(["GET"])
+def admin_rate_limits(request):
+    """This worker's rate limit quotas and allowed/rejected counters since it started."""
+    auth_error = require_admin(request)
+    if auth_error:
+        return auth_error
+    return json_response(ratelimit.snapshot())
 
 
-@require_http_methods(["GET", "POST", "OPTIONS"])
+@require_http_methods(["GET", "POST"])
 def admin_site_settings(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
     if request.method == "GET":
-        settings_list = [_serialize_site_setting(setting) for setting in SiteSetting.objects.all()]
-        response = JsonResponse({"settings": settings_list})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+        serializer, error = requested_fields(request, ADMIN_SITE_SETTING)
+        if error:
+            return error
+        try:
+            since = parse_since(request)
+        except CursorError as exc:
+            return error_response(str(exc))
+        return json_response(delta_payload(SiteSetting, SiteSetting.objects.all(), serializer, "settings", since))
+
+    payload, error = parse_json(request)
     if error:
         return error
 
@@ -267,458 +274,214 @@ def admin_site_settings(request):
             continue
         value = str(item.get("value", ""))
         setting, _ = SiteSetting.objects.update_or_create(key=key, defaults={"value": value})
-        updated.append(_serialize_site_setting(setting))
-
-    response = JsonResponse({"settings": updated})
-    return _apply_admin_cors(response, request)
+        updated.append(ADMIN_SITE_SETTING.serialize(setting))
 
+    return json_response({"settings": updated})
 
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_pages(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
-    if auth_error:
-        return auth_error
-
-    if request.method == "GET":
-        pages = [_serialize_page(page) for page in Page.objects.all()]
-        response = JsonResponse({"pages": pages})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
-    if error:
-        return error
-
-    title = str(payload.get("title", "")).strip()
-    if not title:
-        return _error_response("title is required.", request=request)
-    slug_input = str(payload.get("slug", "")).strip() or slugify(title)
-    slug_value = _unique_slug(Page, slug_input)
-    page = Page.objects.create(
-        title=title,
-        slug=slug_value,
-        body=payload.get("body", "") or "",
-        is_published=bool(payload.get("isPublished", True)),
-    )
-    response = JsonResponse({"page": _serialize_page(page)})
-    return _apply_admin_cors(response, request)
 
-
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_page_detail(request, page_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
-    if auth_error:
-        return auth_error
-
-    page = Page.objects.filter(id=page_id).first()
-    if page is None:
-        return _error_response("Page not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"page": _serialize_page(page)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        page.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
-    if error:
-        return error
-
-    if "title" in payload:
-        page.title = str(payload["title"]).strip()
-    if "slug" in payload:
-        slug_input = str(payload["slug"]).strip()
-        if slug_input:
-            page.slug = _unique_slug(Page, slug_input, instance_id=page.id)
-    if "body" in payload:
-        page.body = payload.get("body", "") or ""
-    if "isPublished" in payload:
-        page.is_published = bool(payload["isPublished"])
-
-    page.save()
-    response = JsonResponse({"page": _serialize_page(page)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_projects(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_appointments(request):
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    if request.method == "GET":
-        projects = [_serialize_project(project) for project in Project.objects.all()]
-        response = JsonResponse({"projects": projects})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+    limit = int(request.GET.get("limit", "100") or 100)
+    serializer, error = requested_fields(request, ADMIN_APPOINTMENT)
     if error:
         return error
-
-    title = str(payload.get("title", "")).strip()
-    if not title:
-        return _error_response("title is required.", request=request)
-    slug_input = str(payload.get("slug", "")).strip() or slugify(title)
-    slug_value = _unique_slug(Project, slug_input)
-
-    tags = payload.get("tags", []) or []
-    if isinstance(tags, str):
-        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-
-    project = Project.objects.create(
-        title=title,
-        slug=slug_value,
-        description=payload.get("description", "") or "",
-        tags=tags,
-        link=payload.get("link", "") or "",
-        github=payload.get("github", "") or "",
-        is_published=bool(payload.get("isPublished", True)),
-        order=int(payload.get("order") or 0),
-    )
-    response = JsonResponse({"project": _serialize_project(project)})
-    return _apply_admin_cors(response, request)
+    events = serializer.serialize_rows(AppointmentEvent.objects.all()[:limit])
+    return json_response({"appointments": events})
 
 
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_project_detail(request, project_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_appointments_current(request):
+    """One row per appointment with its latest state, most recently changed first."""
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    project = Project.objects.filter(id=project_id).first()
-    if project is None:
-        return _error_response("Project not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"project": _serialize_project(project)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        project.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
-    if error:
-        return error
-
-    if "title" in payload:
-        project.title = str(payload["title"]).strip()
-    if "slug" in payload:
-        slug_input = str(payload["slug"]).strip()
-        if slug_input:
-            project.slug = _unique_slug(Project, slug_input, instance_id=project.id)
-    if "description" in payload:
-        project.description = payload.get("description", "") or ""
-    if "tags" in payload:
-        tags = payload.get("tags", []) or []
-        if isinstance(tags, str):
-            tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        project.tags = tags
-    if "link" in payload:
-        project.link = payload.get("link", "") or ""
-    if "github" in payload:
-        project.github = payload.get("github", "") or ""
-    if "isPublished" in payload:
-        project.is_published = bool(payload["isPublished"])
-    if "order" in payload:
-        project.order = int(payload.get("order") or 0)
-
-    project.save()
-    response = JsonResponse({"project": _serialize_project(project)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_stats(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
-    if auth_error:
-        return auth_error
-
-    if request.method == "GET":
-        stats = [_serialize_stat(stat) for stat in Stat.objects.all()]
-        response = JsonResponse({"stats": stats})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+    limit = int(request.GET.get("limit", "100") or 100)
+    serializer, error = requested_fields(request, ADMIN_APPOINTMENT_STATE)
     if error:
         return error
-
-    number = str(payload.get("number", "")).strip()
-    label = str(payload.get("label", "")).strip()
-    if not number or not label:
-        return _error_response("number and label are required.", request=request)
-
-    stat = Stat.objects.create(
-        number=number,
-        label=label,
-        icon=payload.get("icon", "") or "",
-        order=int(payload.get("order") or 0),
-    )
-    response = JsonResponse({"stat": _serialize_stat(stat)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_stat_detail(request, stat_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+    queryset = Appointment.objects.all()
+    status = request.GET.get("status", "").strip()
+    if status:
+        queryset = queryset.filter(status=status)
+    return json_response({"appointments": serializer.serialize_rows(queryset[:limit])})
+
+
+def _parse_instant(value: str):
+    value = value.strip()
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            return None
+        parsed = datetime.combine(day, datetime.min.time())
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _calendar_range(request):
+    start = _parse_instant(request.GET.get("start", ""))
+    end = _parse_instant(request.GET.get("end", ""))
+    if start is None or end is None:
+        return None, error_response("start and end must be ISO dates or datetimes.")
+    if end <= start:
+        return None, error_response("end must be after start.")
+    if end - start > MAX_RANGE:
+        return None, error_response(f"The range may span at most {MAX_RANGE.days} days.")
+    return (start, end), None
+
+
+@require_http_methods(["GET"])
+def admin_appointments_calendar(request):
+    """Active appointments overlapping [start, end)."""
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    stat = Stat.objects.filter(id=stat_id).first()
-    if stat is None:
-        return _error_response("Stat not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"stat": _serialize_stat(stat)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        stat.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+    serializer, error = requested_fields(request, ADMIN_APPOINTMENT_STATE)
     if error:
         return error
-
-    if "number" in payload:
-        stat.number = str(payload["number"]).strip()
-    if "label" in payload:
-        stat.label = str(payload["label"]).strip()
-    if "icon" in payload:
-        stat.icon = payload.get("icon", "") or ""
-    if "order" in payload:
-        stat.order = int(payload.get("order") or 0)
-
-    stat.save()
-    response = JsonResponse({"stat": _serialize_stat(stat)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_skills(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
-    if auth_error:
-        return auth_error
-
-    if request.method == "GET":
-        skills = [_serialize_skill(skill) for skill in Skill.objects.all()]
-        response = JsonResponse({"skills": skills})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+    window, error = _calendar_range(request)
     if error:
         return error
+    start, end = window
+    return json_response({"start": start, "end": end, "appointments": overlapping(start, end, serializer)})
 
-    name = str(payload.get("name", "")).strip()
-    if not name:
-        return _error_response("name is required.", request=request)
 
-    skill = Skill.objects.create(name=name, order=int(payload.get("order") or 0))
-    response = JsonResponse({"skill": _serialize_skill(skill)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_skill_detail(request, skill_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_appointments_conflicts(request):
+    """Pairs of active appointments that overlap each other within [start, end)."""
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    skill = Skill.objects.filter(id=skill_id).first()
-    if skill is None:
-        return _error_response("Skill not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"skill": _serialize_skill(skill)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        skill.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
+    window, error = _calendar_range(request)
     if error:
         return error
-
-    if "name" in payload:
-        skill.name = str(payload["name"]).strip()
-    if "order" in payload:
-        skill.order = int(payload.get("order") or 0)
-
-    skill.save()
-    response = JsonResponse({"skill": _serialize_skill(skill)})
-    return _apply_admin_cors(response, request)
+    start, end = window
+    conflicts = find_conflicts(overlapping(start, end))
+    return json_response({"start": start, "end": end, "total": len(conflicts), "conflicts": conflicts})
+
+
+@require_http_methods(["GET", "HEAD"])
+def admin_appointments_feed(request):
+    """iCalendar feed for calendar clients, authenticated by session or ?token=."""
+    token = request.GET.get(FEED_TOKEN_PARAM, "")
+    if not token or user_for_token(token) is None:
+        auth_error = require_admin(request)
+        if auth_error:
+            return auth_error
+
+    window_start = feed_window_start()
+    marker = feed_marker()
+    if marker is None:
+        # A change is still settling: render it fresh, with nothing to cache or revalidate against.
+        response = StreamingHttpResponse(iter_feed(window_start), content_type=ICS_CONTENT_TYPE)
+    else:
+        etag = feed_etag(marker, window_start)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        cached = cached_feed(etag)
+        if cached is not None:
+            response = HttpResponse(cached, content_type=ICS_CONTENT_TYPE)
+        else:
+            response = StreamingHttpResponse(iter_caching(etag, iter_feed(window_start)), content_type=ICS_CONTENT_TYPE)
+        response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    response["Content-Disposition"] = 'inline; filename="appointments.ics"'
+    return response
 
 
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_social_links(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_appointments_feed_url(request):
+    """Subscription URL (with this admin's token) to paste into a calendar client."""
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    if request.method == "GET":
-        links = [_serialize_social_link(link) for link in SocialLink.objects.all()]
-        response = JsonResponse({"socialLinks": links})
-        return _apply_admin_cors(response, request)
+    path = reverse("admin-appointments-feed")
+    url = request.build_absolute_uri(f"{path}?{urlencode({FEED_TOKEN_PARAM: feed_token(request.user)})}")
+    return json_response({"url": url})
 
-    payload, error = _parse_json(request)
-    if error:
-        return error
-
-    name = str(payload.get("name", "")).strip()
-    url = str(payload.get("url", "")).strip()
-    if not name or not url:
-        return _error_response("name and url are required.", request=request)
 
-    link = SocialLink.objects.create(
-        name=name,
-        url=url,
-        icon=payload.get("icon", "") or "",
-        order=int(payload.get("order") or 0),
-    )
-    response = JsonResponse({"socialLink": _serialize_social_link(link)})
-    return _apply_admin_cors(response, request)
+async def admin_appointments_stream(request):
+    """Server-sent events: every newly stored appointment event, pushed as it is consumed.
 
-
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_social_link_detail(request, link_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+    Reconnecting clients send Last-Event-ID (or ?lastEventId=) to replay what they missed,
+    or get an event: reset frame when that is more than live.MAX_REPLAY events.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    auth_error = await sync_to_async(require_admin)(request)
     if auth_error:
         return auth_error
+    try:
+        last_id = int(request.headers.get("Last-Event-ID") or request.GET.get("lastEventId") or 0)
+    except ValueError:
+        return error_response("Last-Event-ID must be an event id.")
+
+    hub = live.broadcaster
+    # WSGI servers consume the body in the request's thread, after this view's event loop is gone.
+    asgi = isinstance(request, ASGIRequest)
+    # The subscription starts from the replay's settled cursor, so nothing stored since is missed.
+    replay, cursor, sent = await sync_to_async(live.start_stream)(last_id)
+    subscription = hub.subscribe(asyncio.get_running_loop() if asgi else None, cursor, sent)
+    stream = live.iter_events if asgi else live.iter_events_sync
+    response = StreamingHttpResponse(stream(hub, subscription, replay), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
 
-    link = SocialLink.objects.filter(id=link_id).first()
-    if link is None:
-        return _error_response("Social link not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"socialLink": _serialize_social_link(link)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        link.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
-    if error:
-        return error
 
-    if "name" in payload:
-        link.name = str(payload["name"]).strip()
-    if "url" in payload:
-        link.url = str(payload["url"]).strip()
-    if "icon" in payload:
-        link.icon = payload.get("icon", "") or ""
-    if "order" in payload:
-        link.order = int(payload.get("order") or 0)
-
-    link.save()
-    response = JsonResponse({"socialLink": _serialize_social_link(link)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "POST", "OPTIONS"])
-def admin_contact_links(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_appointments_export(request):
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    if request.method == "GET":
-        links = [_serialize_contact_link(link) for link in ContactLink.objects.all()]
-        response = JsonResponse({"contactLinks": links})
-        return _apply_admin_cors(response, request)
+    export_format = request.GET.get("format", "csv").strip().lower() or "csv"
+    if export_format not in EXPORT_FORMATS:
+        return error_response(f"format must be one of: {', '.join(EXPORT_FORMATS)}.")
+    compress = request.GET.get("gzip", "").strip().lower() in {"1", "true", "yes"}
 
-    payload, error = _parse_json(request)
-    if error:
-        return error
+    filename = f"appointments.{export_format}"
+    if compress:
+        filename += ".gz"
+        content_type = "application/gzip"
+    else:
+        content_type = EXPORT_CONTENT_TYPES[export_format]
 
-    title = str(payload.get("title", "")).strip()
-    href = str(payload.get("href", "")).strip()
-    if not title or not href:
-        return _error_response("title and href are required.", request=request)
-
-    link = ContactLink.objects.create(
-        icon=payload.get("icon", "") or "",
-        title=title,
-        description=payload.get("description", "") or "",
-        href=href,
-        order=int(payload.get("order") or 0),
+    response = StreamingHttpResponse(
+        iter_appointment_export(export_format, compress=compress),
+        content_type=content_type,
     )
-    response = JsonResponse({"contactLink": _serialize_contact_link(link)})
-    return _apply_admin_cors(response, request)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
-@require_http_methods(["GET", "PUT", "PATCH", "DELETE", "OPTIONS"])
-def admin_contact_link_detail(request, link_id: int):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
+@require_http_methods(["GET"])
+def admin_search(request):
+    auth_error = require_admin(request)
     if auth_error:
         return auth_error
 
-    link = ContactLink.objects.filter(id=link_id).first()
-    if link is None:
-        return _error_response("Contact link not found.", status=404, request=request)
-
-    if request.method == "GET":
-        response = JsonResponse({"contactLink": _serialize_contact_link(link)})
-        return _apply_admin_cors(response, request)
-    if request.method == "DELETE":
-        link.delete()
-        response = JsonResponse({"ok": True})
-        return _apply_admin_cors(response, request)
-
-    payload, error = _parse_json(request)
-    if error:
-        return error
-
-    if "icon" in payload:
-        link.icon = payload.get("icon", "") or ""
-    if "title" in payload:
-        link.title = str(payload["title"]).strip()
-    if "description" in payload:
-        link.description = payload.get("description", "") or ""
-    if "href" in payload:
-        link.href = str(payload["href"]).strip()
-    if "order" in payload:
-        link.order = int(payload.get("order") or 0)
-
-    link.save()
-    response = JsonResponse({"contactLink": _serialize_contact_link(link)})
-    return _apply_admin_cors(response, request)
-
-
-@require_http_methods(["GET", "OPTIONS"])
-def admin_appointments(request):
-    if request.method == "OPTIONS":
-        return _admin_preflight(request)
-    auth_error = _require_admin(request)
-    if auth_error:
-        return auth_error
+    query = request.GET.get("q", "").strip()
+    kinds = [kind.strip() for kind in request.GET.get("type", "").split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(SEARCH_SOURCES))
+    if unknown:
+        return error_response(f"Unknown type(s): {', '.join(unknown)}. Available: {', '.join(SEARCH_SOURCES)}.")
+    try:
+        page = int(request.GET.get("page") or 1)
+        page_size = int(request.GET.get("pageSize") or DEFAULT_PAGE_SIZE)
+    except ValueError:
+        return error_response("page and pageSize must be integers.")
 
-    limit = int(request.GET.get("limit", "100") or 100)
-    events = AppointmentEvent.objects.all()[:limit]
-    response = JsonResponse({"appointments": [_serialize_appointment(event) for event in events]})
-    return _apply_admin_cors(response, request)
+    result = search(query, kinds or None, page=page, page_size=page_size)
+    return json_response({"query": query, **result})
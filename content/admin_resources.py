@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.http import HttpResponse
+from django.urls import path
+from django.utils.text import slugify
+from django.views.decorators.http import require_http_methods
+
+from .changes import CursorError, delta_payload, parse_since
+from .encoding import json_response
+from .ranking import move, rank_for_order
+from .serializers import FieldSelectionError, Serializer
+
+_MISSING = object()
+
+
+def error_response(message: str | list[str], status: int = 400) -> HttpResponse:
+    errors = message if isinstance(message, list) else [message]
+    return json_response({"errors": errors}, status=status)
+
+
+def parse_json(request) -> tuple[dict[str, Any] | None, HttpResponse | None]:
+    try:
+        payload = json.loads(request.body or b"{}")
+    except json.JSONDecodeError:
+        return None, error_response("Invalid JSON payload.", status=400)
+    if not isinstance(payload, dict):
+        return None, error_response("JSON body must be an object.", status=400)
+    return payload, None
+
+
+def requested_fields(request, serializer: Serializer) -> tuple[Serializer, HttpResponse | None]:
+    try:
+        return serializer.from_request(request), None
+    except FieldSelectionError as exc:
+        return serializer, error_response(str(exc))
+
+
+def require_admin(request) -> HttpResponse | None:
+    if not request.user.is_authenticated:
+        return error_response("Authentication required.", status=401)
+    if not request.user.is_staff:
+        return error_response("Admin access required.", status=403)
+    return None
+
+
+def unique_slug(model, base_slug: str, instance_id: int | None = None) -> str:
+    slug = base_slug
+    suffix = 1
+    while model.objects.filter(slug=slug).exclude(id=instance_id).exists():
+        slug = f"{base_slug}-{suffix}"
+        suffix += 1
+    return slug
+
+
+class FieldValueError(ValueError):
+    pass
+
+
+def stripped(value: Any) -> str:
+    return str(value).strip()
+
+
+def text(value: Any) -> str:
+    return value or ""
+
+
+def integer(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        raise FieldValueError("must be an integer") from None
+
+
+def tag_list(value: Any) -> list[str]:
+    tags = value or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+    return tags
+
+
+@dataclass(frozen=True)
+class AdminField:
+    """One writable payload key, the column it lands in and how its value is cleaned."""
+
+    key: str
+    column: str
+    clean: Callable[[Any], Any] = stripped
+    default: Any = ""
+
+
+def required(*keys: str) -> Callable[[dict[str, Any]], str | None]:
+    message = f"{' and '.join(keys)} {'is' if len(keys) == 1 else 'are'} required."
+
+    def validate(values: dict[str, Any]) -> str | None:
+        return message if any(not values.get(key) for key in keys) else None
+
+    return validate
+
+
+@dataclass(frozen=True)
+class AdminResource:
+    """Declarative admin CRUD endpoints for one model.
+
+    Lists and detail reads go through the serializer's values_list() path and
+    never build instances; updates save only the columns present in the
+    payload; deletes are a single filtered delete. Validators run on create
+    against the cleaned values keyed by payload key.
+    """
+
+    model: type
+    serializer: Serializer
+    name: str
+    path: str
+    list_key: str
+    item_key: str
+    label: str
+    fields: tuple[AdminField, ...]
+    validators: tuple[Callable[[dict[str, Any]], str | None], ...] = ()
+    ordering: tuple[str, ...] = ()
+    slug_source: str | None = None
+    # Rows carry a rank sort key and get a move endpoint (content.ranking).
+    ranked: bool = False
+
+    def queryset(self):
+        queryset = self.model.objects.all()
+        return queryset.order_by(*self.ordering) if self.ordering else queryset
+
+    def _clean(self, payload: dict[str, Any], partial: bool) -> tuple[dict[str, Any], str | None]:
+        values: dict[str, Any] = {}
+        for admin_field in self.fields:
+            raw = payload.get(admin_field.key, _MISSING)
+            if raw is _MISSING:
+                if partial:
+                    continue
+                values[admin_field.key] = admin_field.default
+                continue
+            try:
+                values[admin_field.key] = admin_field.clean(raw)
+            except FieldValueError as exc:
+                return values, f"{admin_field.key} {exc}."
+        return values, None
+
+    def _columns(self, values: dict[str, Any]) -> dict[str, Any]:
+        columns = {admin_field.key: admin_field.column for admin_field in self.fields}
+        return {columns[key]: value for key, value in values.items()}
+
+    def _auto_now_columns(self) -> list[str]:
+        return [
+            model_field.attname
+            for model_field in self.model._meta.concrete_fields
+            if getattr(model_field, "auto_now", False)
+        ]
+
+    def list(self, request) -> HttpResponse:
+        serializer, error = requested_fields(request, self.serializer)
+        if error:
+            return error
+        try:
+            since = parse_since(request)
+        except CursorError as exc:
+            return error_response(str(exc))
+        return json_response(delta_payload(self.model, self.queryset(), serializer, self.list_key, since))
+
+    def create(self, request) -> HttpResponse:
+        payload, error = parse_json(request)
+        if error:
+            return error
+        values, error_message = self._clean(payload, partial=False)
+        if error_message is None:
+            error_message = next((message for validate in self.validators if (message := validate(values))), None)
+        if error_message:
+            return error_response(error_message)
+
+        columns = self._columns(values)
+        if self.slug_source:
+            slug_input = str(payload.get("slug", "")).strip() or slugify(values[self.slug_source])
+            columns["slug"] = unique_slug(self.model, slug_input)
+        instance = self.model.objects.create(**columns)
+        return json_response({self.item_key: self.serializer.serialize(instance)})
+
+    def retrieve(self, request, pk: int) -> HttpResponse:
+        rows = self.serializer.serialize_rows(self.model.objects.filter(pk=pk))
+        if not rows:
+            return self.not_found()
+        return json_response({self.item_key: rows[0]})
+
+    def update(self, request, pk: int) -> HttpResponse:
+        instance = self.model.objects.filter(pk=pk).first()
+        if instance is None:
+            return self.not_found()
+        payload, error = parse_json(request)
+        if error:
+            return error
+        values, error_message = self._clean(payload, partial=True)
+        if error_message:
+            return error_response(error_message)
+
+        columns = self._columns(values)
+        if self.slug_source and "slug" in payload:
+            slug_input = str(payload["slug"]).strip()
+            if slug_input:
+                columns["slug"] = unique_slug(self.model, slug_input, instance_id=instance.pk)
+        if self.ranked and "order" in columns:
+            columns["rank"] = rank_for_order(self.model, columns["order"], exclude_pk=instance.pk)
+        for column, value in columns.items():
+            setattr(instance, column, value)
+        if columns:
+            instance.save(update_fields=[*columns, *self._auto_now_columns()])
+        return json_response({self.item_key: self.serializer.serialize(instance)})
+
+    def destroy(self, request, pk: int) -> HttpResponse:
+        deleted, _ = self.model.objects.filter(pk=pk).delete()
+        if not deleted:
+            return self.not_found()
+        return json_response({"ok": True})
+
+    def move(self, request, pk: int) -> HttpResponse:
+        """Place the row right before or after another one: {"before": id} or {"after": id}."""
+        instance = self.model.objects.filter(pk=pk).first()
+        if instance is None:
+            return self.not_found()
+        payload, error = parse_json(request)
+        if error:
+            return error
+        anchors = {key: payload[key] for key in ("before", "after") if payload.get(key) is not None}
+        if len(anchors) != 1:
+            return error_response("Send exactly one of before or after.")
+        key, anchor = next(iter(anchors.items()))
+        try:
+            anchor = int(anchor)
+        except (TypeError, ValueError):
+            return error_response(f"{key} must be an id.")
+        if anchor == instance.pk:
+            return error_response(f"{key} must be another {self.label.lower()}.")
+        try:
+            move(instance, **{key: anchor})
+        except self.model.DoesNotExist:
+            return error_response(f"{key} {self.label.lower()} not found.")
+        return json_response({self.item_key: self.serializer.serialize(instance)})
+
+    def not_found(self) -> HttpResponse:
+        return error_response(f"{self.label} not found.", status=404)
+
+    def list_view(self) -> Callable[..., HttpResponse]:
+        @require_http_methods(["GET", "POST"])
+        def view(request):
+            auth_error = require_admin(request)
+            if auth_error:
+                return auth_error
+            return self.list(request) if request.method == "GET" else self.create(request)
+
+        return view
+
+    def detail_view(self) -> Callable[..., HttpResponse]:
+        @require_http_methods(["GET", "PUT", "PATCH", "DELETE"])
+        def view(request, pk: int):
+            auth_error = require_admin(request)
+            if auth_error:
+                return auth_error
+            if request.method == "GET":
+                return self.retrieve(request, pk)
+            if request.method == "DELETE":
+                return self.destroy(request, pk)
+            return self.update(request, pk)
+
+        return view
+
+    def move_view(self) -> Callable[..., HttpResponse]:
+        @require_http_methods(["POST"])
+        def view(request, pk: int):
+            auth_error = require_admin(request)
+            if auth_error:
+                return auth_error
+            return self.move(request, pk)
+
+        return view
+
+    def urls(self) -> list:
+        """URL patterns for api/admin/<path> and api/admin/<path>/<pk>, named admin-<path> and admin-<name>-detail.
+
+        Ranked resources add api/admin/<path>/<pk>/move, named admin-<name>-move.
+        """
+        patterns = [
+            path(f"api/admin/{self.path}", self.list_view(), name=f"admin-{self.path}"),
+            path(f"api/admin/{self.path}/<int:pk>", self.detail_view(), name=f"admin-{self.name}-detail"),
+        ]
+        if self.ranked:
+            patterns.append(
+                path(f"api/admin/{self.path}/<int:pk>/move", self.move_view(), name=f"admin-{self.name}-move")
+            )
+        return patterns
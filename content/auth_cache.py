@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.contrib import auth
+from django.core.cache import cache
+
+USER_CACHE_PREFIX = "auth:user"
+USER_GENERATION_PREFIX = "auth:user-generation"
+
+
+def user_cache_timeout() -> int:
+    return getattr(settings, "ADMIN_USER_CACHE_TIMEOUT", 60)
+
+
+def _user_generation(user_id) -> int:
+    key = f"{USER_GENERATION_PREFIX}:{user_id}"
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, 1, timeout=None)
+        generation = cache.get(key, 1)
+    return generation
+
+
+def _user_cache_key(session_key: str, user_id) -> str:
+    # Signed-cookie session keys are long; hash them so any cache backend accepts the key.
+    digest = hashlib.sha1(session_key.encode("utf-8")).hexdigest()
+    return f"{USER_CACHE_PREFIX}:{user_id}:{_user_generation(user_id)}:{digest}"
+
+
+def get_cached_user(request):
+    """Resolve request.user, caching the authenticated user per session for a short TTL.
+
+    A miss goes through django.contrib.auth.get_user(), so the backend lookup and
+    the session hash check still run once per session and generation.
+    """
+    timeout = user_cache_timeout()
+    session = request.session
+    user_id = session.get(auth.SESSION_KEY)
+    if not timeout or user_id is None or not session.session_key:
+        return auth.get_user(request)
+
+    key = _user_cache_key(session.session_key, user_id)
+    user = cache.get(key)
+    if user is None:
+        user = auth.get_user(request)
+        if user.is_authenticated:
+            cache.set(key, user, timeout=timeout)
+    return user
+
+
+def forget_session_user(request) -> None:
+    session = getattr(request, "session", None)
+    user_id = session.get(auth.SESSION_KEY) if session is not None else None
+    if user_id is not None and session.session_key:
+        cache.delete(_user_cache_key(session.session_key, user_id))
+
+
+def invalidate_user(user_id) -> None:
+    """Drop every cached session entry for the user by moving to a new generation."""
+    key = f"{USER_GENERATION_PREFIX}:{user_id}"
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+        cache.incr(key)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+
+BUNDLE_MAGIC = b"PFBUNDLE1\n"
+HEADER_LENGTH_DIGITS = 10
+
+PORTFOLIO_CONTENT_KEY = "portfolio-content"
+PROJECTS_KEY = "projects"
+TAGS_KEY = "tags"
+
+
+def project_slug_key(slug: str) -> str:
+    return f"project/slug/{slug}"
+
+
+def projects_tag_key(tag: str) -> str:
+    return f"projects/tag/{tag}"
+
+
+def write_bundle(path: Path, entries: dict[str, bytes]) -> None:
+    """Write serialized payloads to a bundle file.
+
+    Layout: magic line, fixed-width header length, JSON index of
+    key -> [offset, length] relative to the end of the header, then the
+    payload bytes. Keys that share the same bytes object point at a single
+    copy.
+    """
+    index: dict[str, list[int]] = {}
+    placed: dict[int, list[int]] = {}
+    bodies: list[bytes] = []
+    position = 0
+    for key, body in entries.items():
+        if id(body) not in placed:
+            placed[id(body)] = [position, len(body)]
+            bodies.append(body)
+            position += len(body)
+        index[key] = placed[id(body)]
+
+    header = json.dumps({"entries": index}, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(BUNDLE_MAGIC)
+        handle.write(str(len(header)).zfill(HEADER_LENGTH_DIGITS).encode("ascii") + b"\n")
+        handle.write(header)
+        for body in bodies:
+            handle.write(body)
+    os.replace(tmp_path, path)
+
+
+class ContentBundle:
+    """Read-only view over a bundle file, memory-mapped so payloads are served without parsing."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(BUNDLE_MAGIC)] != BUNDLE_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a content bundle: {path}")
+        start = len(BUNDLE_MAGIC)
+        header_length = int(self._mmap[start : start + HEADER_LENGTH_DIGITS])
+        header_start = start + HEADER_LENGTH_DIGITS + 1
+        header = json.loads(self._mmap[header_start : header_start + header_length])
+        self._body_start = header_start + header_length
+        self._entries: dict[str, list[int]] = header["entries"]
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._body_start + offset
+        return self._mmap[start : start + length]
+
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+_bundle: ContentBundle | None = None
+_bundle_lock = threading.Lock()
+
+
+def get_content_bundle() -> ContentBundle | None:
+    """Return the configured bundle when the BFF runs in static content mode."""
+    global _bundle
+    path_value = getattr(settings, "CONTENT_BUNDLE_PATH", "")
+    if not path_value:
+        return None
+    path = Path(path_value)
+    if _bundle is not None and _bundle.path == path:
+        return _bundle
+    with _bundle_lock:
+        if _bundle is None or _bundle.path != path:
+            _bundle = ContentBundle(path)
+        return _bundle
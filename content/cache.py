@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import F
+
+from .bundle import get_content_bundle
+from .db_router import PRIMARY, primary
+from .models import ContentVersion
+
+logger = logging.getLogger(__name__)
+
+CONTENT_VERSION_PK = 1
+# Entries older than the soft TTL are served while one refresh runs in the background;
+# the hard TTL is the cache timeout, after which a request has to rebuild.
+DEFAULT_SOFT_TTL = 60 * 5
+DEFAULT_HARD_TTL = 60 * 60 * 24
+# Lookups that found nothing are remembered this long, so probing unknown slugs does not hit the database.
+DEFAULT_NEGATIVE_TTL = 30
+# How long a request waits for another request's rebuild before building itself.
+FLIGHT_WAIT_SECONDS = 10
+
+
+# (version, monotonic time it was read) in this process.
+_version: tuple[int, float] | None = None
+
+
+def version_check_interval() -> float:
+    return getattr(settings, "CONTENT_VERSION_CHECK_INTERVAL", 1)
+
+
+def get_content_version() -> int:
+    """The content version, read from the primary at most once per check interval per process.
+
+    The counter lives in the database rather than the cache, so bumps from
+    other processes (workers, the seed command) are seen even with a
+    per-process cache.
+    """
+    global _version
+    if get_content_bundle() is not None:
+        # Static content mode serves a bundle that cannot change while the process runs.
+        return 0
+    if _version is not None and time.monotonic() - _version[1] < version_check_interval():
+        return _version[0]
+    version = ContentVersion.objects.using(PRIMARY).filter(pk=CONTENT_VERSION_PK).values_list("version", flat=True)
+    _version = (version.first() or 0, time.monotonic())
+    return _version[0]
+
+
+def bump_content_version() -> int:
+    """Increment the version in the writer's transaction, so it only becomes visible with the edit."""
+    versions = ContentVersion.objects.using(PRIMARY)
+    if not versions.filter(pk=CONTENT_VERSION_PK).update(version=F("version") + 1):
+        versions.get_or_create(pk=CONTENT_VERSION_PK)
+        versions.filter(pk=CONTENT_VERSION_PK).update(version=F("version") + 1)
+    # Re-read on next use, and again once committed in case another thread read the old value meanwhile.
+    forget_content_version()
+    transaction.on_commit(forget_content_version, using=PRIMARY)
+    return versions.values_list("version", flat=True).get(pk=CONTENT_VERSION_PK)
+
+
+def forget_content_version() -> None:
+    """Drop this process's copy of the version so the next read goes to the database."""
+    global _version
+    _version = None
+
+
+def soft_ttl() -> int:
+    return getattr(settings, "CONTENT_CACHE_SOFT_TTL", DEFAULT_SOFT_TTL)
+
+
+def hard_ttl() -> int:
+    return getattr(settings, "CONTENT_CACHE_HARD_TTL", DEFAULT_HARD_TTL)
+
+
+def negative_ttl() -> int:
+    return getattr(settings, "CONTENT_CACHE_NEGATIVE_TTL", DEFAULT_NEGATIVE_TTL)
+
+
+def background_refresh_enabled() -> bool:
+    return getattr(settings, "CONTENT_CACHE_BACKGROUND_REFRESH", True)
+
+
+@dataclass
+class _Flight:
+    """One in-process rebuild of a key that other requests can wait on."""
+
+    version: int
+    done: threading.Event = field(default_factory=threading.Event)
+    value: bytes | None = None
+
+
+_flights: dict[str, _Flight] = {}
+_flights_lock = threading.Lock()
+
+
+def _entry_key(key: str) -> str:
+    return f"content:entry:{key}"
+
+
+def _build(build: Callable[[], bytes]) -> bytes:
+    # Always from the primary: a lagging replica's rows would stay cached under the new version.
+    with primary():
+        return build()
+
+
+def _store(key: str, build: Callable[[], bytes], flight: _Flight) -> bytes:
+    try:
+        value = _build(build)
+        cache.set(_entry_key(key), (flight.version, time.time(), value), timeout=hard_ttl())
+        flight.value = value
+        return value
+    finally:
+        with _flights_lock:
+            if _flights.get(key) is flight:
+                del _flights[key]
+        flight.done.set()
+
+
+def _build_once(key: str, build: Callable[[], bytes], version: int) -> bytes:
+    """Build key for version, sharing one in-flight build among concurrent callers in this process."""
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None or flight.version != version
+        if leader:
+            flight = _flights[key] = _Flight(version)
+    if leader:
+        return _store(key, build, flight)
+    if flight.done.wait(FLIGHT_WAIT_SECONDS) and flight.value is not None:
+        return flight.value
+    # The leader failed or is stuck; do not make this request fail with it.
+    return _build(build)
+
+
+def _refresh_in_background(key: str, build: Callable[[], bytes], version: int) -> None:
+    with _flights_lock:
+        if key in _flights:
+            return
+        flight = _flights[key] = _Flight(version)
+
+    def run():
+        try:
+            _store(key, build, flight)
+        except Exception:
+            logger.exception("Background refresh of %s failed.", key)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, name=f"content-refresh:{key}", daemon=True).start()
+
+
+def get_or_build_entry(key: str, build: Callable[[], bytes], version: int | None = None) -> tuple[bytes, int]:
+    """Return (bytes, version built for) for key, rebuilding with single-flight and stale-while-revalidate.
+
+    - Current version and younger than the soft TTL: served from the cache.
+    - Current version but past the soft TTL: served stale while one background
+      thread per key refreshes it.
+    - Older version (content was edited): served stale only while another
+      request in this process is already rebuilding it; otherwise this request
+      rebuilds, and concurrent requests for the same key wait on that build.
+    """
+    if version is None:
+        version = get_content_version()
+    entry = cache.get(_entry_key(key))
+    if entry is not None:
+        entry_version, built_at, value = entry
+        if entry_version == version:
+            if time.time() - built_at < soft_ttl():
+                return value, entry_version
+            if background_refresh_enabled():
+                _refresh_in_background(key, build, version)
+                return value, entry_version
+        else:
+            with _flights_lock:
+                rebuilding = key in _flights
+            if rebuilding:
+                return value, entry_version
+    return _build_once(key, build, version), version
+
+
+def _missing_key(key: str) -> str:
+    return f"content:missing:{key}"
+
+
+def is_known_missing(key: str, version: int) -> bool:
+    """Whether a lookup for key found nothing at this content version within the negative TTL."""
+    return cache.get(_missing_key(key)) == version
+
+
+def remember_missing(key: str, version: int) -> None:
+    # Keyed by version like the entries, so creating the missing row invalidates it with the next bump.
+    cache.set(_missing_key(key), version, timeout=negative_ttl())
+
+
+def get_or_build(key: str, build: Callable[[], bytes], version: int | None = None) -> bytes:
+    return get_or_build_entry(key, build, version)[0]
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import DurationField, ExpressionWrapper, F, Max, Q
+from django.utils import timezone
+
+from .models import Appointment, AppointmentDurationBound
+from .serializers import ADMIN_APPOINTMENT_STATE, Serializer
+
+# Bumped on every projection write; the in-process hot index rebuilds when it changes.
+CALENDAR_VERSION_KEY = "appointments:calendar-version"
+# Longest appointment ever projected. Overlap queries only scan start_time in
+# [start - longest, end), so they stay a bounded index range scan. Writers widen
+# the AppointmentDurationBound row; readers cache it for APPOINTMENT_HOT_INDEX_TTL,
+# since other processes' bookings only widen it in their own cache.
+LONGEST_KEY = "appointments:longest"
+LONGEST_PK = 1
+CANCELLED_SUFFIXES = (".cancelled", ".canceled")
+ACTIVE = ~Q(status__endswith=CANCELLED_SUFFIXES[0]) & ~Q(status__endswith=CANCELLED_SUFFIXES[1])
+MAX_RANGE = timedelta(days=366)
+
+
+def calendar_version() -> int:
+    return cache.get(CALENDAR_VERSION_KEY, 0)
+
+
+def longest_appointment() -> timedelta:
+    longest = cache.get(LONGEST_KEY)
+    if longest is None:
+        stored = AppointmentDurationBound.objects.filter(pk=LONGEST_PK).values_list("longest", flat=True).first()
+        longest = stored or timedelta(0)
+        cache.set(LONGEST_KEY, longest, timeout=settings.APPOINTMENT_HOT_INDEX_TTL)
+    return longest
+
+
+def widen_longest(duration: timedelta) -> None:
+    """Raise the stored bound to duration in the writer's transaction.
+
+    The bound never shrinks, so a cached value is never above the stored one and
+    durations within it need no query.
+    """
+    if duration <= longest_appointment():
+        return
+    bounds = AppointmentDurationBound.objects
+    if not bounds.filter(pk=LONGEST_PK, longest__lt=duration).update(longest=duration):
+        bound, created = bounds.get_or_create(pk=LONGEST_PK, defaults={"longest": duration})
+        if not created and bound.longest < duration:
+            bounds.filter(pk=LONGEST_PK, longest__lt=duration).update(longest=duration)
+
+
+def widen_longest_from_projection() -> None:
+    """Widen the bound over every projection row, for bulk writes that skip apply_event()."""
+    duration = ExpressionWrapper(F("end_time") - F("start_time"), output_field=DurationField())
+    longest = Appointment.objects.aggregate(longest=Max(duration))["longest"]
+    if longest:
+        widen_longest(longest)
+
+
+def note_change(start_time: datetime | None = None, end_time: datetime | None = None) -> None:
+    """Record a committed projection write: widen the cached longest duration and invalidate hot indexes.
+
+    Without times (bulk rebuilds) the longest duration is re-read on next use.
+    """
+    if start_time is None or end_time is None:
+        cache.delete(LONGEST_KEY)
+    elif end_time - start_time > longest_appointment():
+        cache.set(LONGEST_KEY, end_time - start_time, timeout=settings.APPOINTMENT_HOT_INDEX_TTL)
+    try:
+        cache.incr(CALENDAR_VERSION_KEY)
+    except ValueError:
+        cache.add(CALENDAR_VERSION_KEY, 1, timeout=None)
+
+
+def _project(rows: list[dict], serializer: Serializer) -> list[dict]:
+    if serializer is ADMIN_APPOINTMENT_STATE:
+        return rows
+    return [{key: row[key] for key in serializer.keys} for row in rows]
+
+
+def query_overlapping(start: datetime, end: datetime, serializer: Serializer = ADMIN_APPOINTMENT_STATE) -> list[dict]:
+    """Active appointments with start_time < end and end_time > start, from the database."""
+    queryset = Appointment.objects.filter(
+        ACTIVE,
+        start_time__gte=start - longest_appointment(),
+        start_time__lt=end,
+        end_time__gt=start,
+    ).order_by("start_time", "id")
+    return serializer.serialize_rows(queryset)
+
+
+class IntervalIndex:
+    """Appointments overlapping [window_start, window_end), sorted by start for bisect lookups."""
+
+    def __init__(self, rows: list[dict], window_start: datetime, window_end: datetime, version: int):
+        self.rows = sorted(rows, key=lambda row: (row["startTime"], row["id"]))
+        self.starts = [row["startTime"] for row in self.rows]
+        self.longest = max((row["endTime"] - row["startTime"] for row in self.rows), default=timedelta(0))
+        self.window_start = window_start
+        self.window_end = window_end
+        self.version = version
+        self.built_at = time.monotonic()
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.window_start <= start and end <= self.window_end
+
+    def overlapping(self, start: datetime, end: datetime) -> list[dict]:
+        low = bisect_left(self.starts, start - self.longest)
+        high = bisect_left(self.starts, end)
+        return [row for row in self.rows[low:high] if row["endTime"] > start]
+
+
+_hot: IntervalIndex | None = None
+_hot_lock = threading.Lock()
+
+
+def hot_index() -> IntervalIndex:
+    """The upcoming window's index, rebuilt when the projection changed or the index expired."""
+    global _hot
+    version = calendar_version()
+    index = _hot
+    if (
+        index is not None
+        and index.version == version
+        and time.monotonic() - index.built_at < settings.APPOINTMENT_HOT_INDEX_TTL
+    ):
+        return index
+    with _hot_lock:
+        if _hot is not index:
+            return _hot
+        window_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        window_end = window_start + timedelta(days=settings.APPOINTMENT_HOT_WINDOW_DAYS + 1)
+        _hot = IntervalIndex(query_overlapping(window_start, window_end), window_start, window_end, version)
+        return _hot
+
+
+def overlapping(start: datetime, end: datetime, serializer: Serializer = ADMIN_APPOINTMENT_STATE) -> list[dict]:
+    """Active appointments overlapping [start, end), from the hot index when it covers the range."""
+    if settings.APPOINTMENT_HOT_WINDOW_DAYS > 0:
+        index = hot_index()
+        if index.covers(start, end):
+            return _project(index.overlapping(start, end), serializer)
+    return query_overlapping(start, end, serializer)
+
+
+def find_conflicts(rows: Iterable[dict]) -> list[dict]:
+    """Every pair of overlapping appointments, by sweeping rows in start order (O(n log n + pairs log pairs))."""
+    # Min-heap of rows still open, keyed on end_time; visited in heap order and sorted once at the end.
+    found: list[tuple[tuple, dict]] = []
+    active: list[tuple[datetime, int, dict]] = []
+    for position, row in enumerate(sorted(rows, key=lambda row: (row["startTime"], row["id"]))):
+        while active and active[0][0] <= row["startTime"]:
+            heapq.heappop(active)
+        for end_time, other_position, other in active:
+            found.append(
+                (
+                    (position, other_position),
+                    {
+                        "appointmentIds": [other["appointmentId"], row["appointmentId"]],
+                        "start": row["startTime"],
+                        "end": min(end_time, row["endTime"]),
+                    },
+                )
+            )
+        heapq.heappush(active, (row["endTime"], position, row))
+    found.sort(key=lambda item: item[0])
+    return [conflict for _, conflict in found]
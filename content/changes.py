@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import ChangeLog
+from .serializers import Serializer
+
+SINCE_PARAM = "since"
+
+
+class CursorError(ValueError):
+    pass
+
+
+def change_kind(model) -> str:
+    return model._meta.label_lower
+
+
+def record_changes(model, ids: Iterable[int], deleted: bool = False) -> None:
+    """Move each object's change-log entry to a new cursor position (delete + insert)."""
+    ids = list(ids)
+    if not ids:
+        return
+    kind = change_kind(model)
+    with transaction.atomic():
+        ChangeLog.objects.filter(kind=kind, object_id__in=ids).delete()
+        ChangeLog.objects.bulk_create([ChangeLog(kind=kind, object_id=pk, deleted=deleted) for pk in ids])
+
+
+def current_cursor() -> int:
+    """The newest change-log id that is CHANGE_LOG_SETTLE_SECONDS old.
+
+    Ids are allocated at insert time, so a transaction holding a lower id can
+    commit after a higher one has been read. Stopping short of recent entries
+    means the next delta sends them again instead of skipping a late commit.
+    """
+    horizon = timezone.now() - timedelta(seconds=settings.CHANGE_LOG_SETTLE_SECONDS)
+    cursor = ChangeLog.objects.filter(changed_at__lte=horizon).order_by("-id").values_list("id", flat=True).first()
+    return cursor or 0
+
+
+def parse_since(request) -> int | None:
+    """The ?since= cursor, or None for a full listing; raises CursorError when malformed."""
+    raw = request.GET.get(SINCE_PARAM, "").strip()
+    if not raw:
+        return None
+    if not raw.isdigit():
+        raise CursorError(f"{SINCE_PARAM} must be a cursor returned by a previous listing.")
+    return int(raw)
+
+
+def changes_since(model, since: int) -> tuple[list[int], list[int]]:
+    """(changed ids, deleted ids) of model's rows written after the since cursor."""
+    changed: list[int] = []
+    deleted: list[int] = []
+    entries = ChangeLog.objects.filter(kind=change_kind(model), id__gt=since).order_by("id")
+    for object_id, is_deleted in entries.values_list("object_id", "deleted"):
+        (deleted if is_deleted else changed).append(object_id)
+    return changed, deleted
+
+
+def delta_payload(model, queryset, serializer, list_key: str, since: int | None) -> dict:
+    """List payload with its cursor: every row, or only rows changed after since plus tombstones.
+
+    The cursor lags the newest changes (see current_cursor()), so clients get
+    recently changed rows again and must merge delta rows by id; id is always
+    included in them, whatever ?fields= asked for.
+    """
+    cursor = current_cursor()
+    if since is None:
+        return {list_key: serializer.serialize_rows(queryset), "cursor": cursor}
+    if "id" not in serializer.keys:
+        serializer = Serializer(serializer.model, (("id", "id"), *serializer.fields), serializer.transforms)
+    changed, deleted = changes_since(model, since)
+    rows = serializer.serialize_rows(queryset.filter(pk__in=changed)) if changed else []
+    return {list_key: rows, "deleted": deleted, "cursor": cursor}
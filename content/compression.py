@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import gzip
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from .cache import get_or_build_entry, hard_ttl
+from .encoding import JSON_CONTENT_TYPE
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+def _gzip(body: bytes) -> bytes:
+    # mtime=0 keeps the output deterministic so cached variants are byte-identical across workers.
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    COMPRESSORS["br"] = lambda body: brotli.compress(body, quality=5)
+
+# Preferred first when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ("br", "gzip")
+
+
+def min_compress_length() -> int:
+    return getattr(settings, "RESPONSE_COMPRESSION_MIN_LENGTH", 512)
+
+
+def negotiate_encoding(request) -> str | None:
+    """Pick the best supported content-coding from the Accept-Encoding header."""
+    header = request.headers.get("Accept-Encoding", "")
+    if not header:
+        return None
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in COMPRESSORS:
+            continue
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_response(response: HttpResponse, encoding: str) -> HttpResponse:
+    response.content = COMPRESSORS[encoding](response.content)
+    response["Content-Encoding"] = encoding
+    response["Content-Length"] = str(len(response.content))
+    return response
+
+
+def _variant(key: str, encoding: str, body: bytes, version: int) -> bytes:
+    """body compressed with encoding, cached once per key and encoding with the version it was built from.
+
+    An edit replaces the entry instead of leaving the old version's variant
+    behind, and a stale body (an older version) never replaces a newer variant.
+    """
+    variant_key = f"content:variant:{key}:{encoding}"
+    cached = cache.get(variant_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    value = COMPRESSORS[encoding](body)
+    if cached is None or cached[0] < version:
+        cache.set(variant_key, (version, value), timeout=hard_ttl())
+    return value
+
+
+def cached_json_response(request, key: str, build: Callable[[], bytes]) -> HttpResponse:
+    """Serve a cacheable public JSON body, reusing precompressed variants per content version."""
+    body, version = get_or_build_entry(key, build)
+    encoding = negotiate_encoding(request) if len(body) >= min_compress_length() else None
+    if encoding is None:
+        response = HttpResponse(body, content_type=JSON_CONTENT_TYPE)
+    else:
+        response = HttpResponse(_variant(key, encoding, body, version), content_type=JSON_CONTENT_TYPE)
+        response["Content-Encoding"] = encoding
+    response["Content-Length"] = str(len(response.content))
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+
+PRIMARY = "default"
+
+
+@dataclass
+class RoutingState:
+    """Per-request routing decision, plus whether the request wrote anything."""
+
+    use_replica: bool = False
+    wrote: bool = False
+
+
+_routing: ContextVar[RoutingState | None] = ContextVar("content_db_routing", default=None)
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def activate(state: RoutingState):
+    return _routing.set(state)
+
+
+def deactivate(token) -> None:
+    _routing.reset(token)
+
+
+@contextmanager
+def primary() -> Iterator[None]:
+    """Read from the primary inside the block, whatever the surrounding request was routed to."""
+    token = _routing.set(RoutingState())
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+def iter_with_routing(state: RoutingState, iterable) -> Iterator:
+    """Keep the request's routing for a streamed body, which is produced after the middleware returns."""
+    iterator = iter(iterable)
+    while True:
+        token = _routing.set(state)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _routing.reset(token)
+        yield chunk
+
+
+class ReplicaRouter:
+    """Send reads to a replica only inside requests the middleware marked as replica-safe."""
+
+    def db_for_read(self, model, **hints):
+        state = _routing.get()
+        replicas = replica_aliases()
+        if state is None or not state.use_replica or not replicas:
+            return PRIMARY
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _routing.get()
+        if state is not None:
+            state.wrote = True
+            # Reads later in a writing request must see the write.
+            state.use_replica = False
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in replica_aliases()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_stdlib(data: Any) -> bytes:
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def encode_orjson(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+ENCODERS: dict[str, Callable[[Any], bytes]] = {"stdlib": encode_stdlib}
+if orjson is not None:
+    ENCODERS["orjson"] = encode_orjson
+
+
+def get_encoder(name: str | None = None) -> Callable[[Any], bytes]:
+    """Resolve RESPONSE_JSON_ENCODER: "auto", a registered name, or a dotted path to a callable."""
+    name = name or getattr(settings, "RESPONSE_JSON_ENCODER", "auto")
+    if name == "auto":
+        return ENCODERS.get("orjson", encode_stdlib)
+    if name in ENCODERS:
+        return ENCODERS[name]
+    if "." in name:
+        return import_string(name)
+    raise ValueError(f"Unknown RESPONSE_JSON_ENCODER: {name!r}")
+
+
+def encode_json(data: Any) -> bytes:
+    return get_encoder()(data)
+
+
+def json_response(data: Any, status: int = 200, **kwargs) -> HttpResponse:
+    """Drop-in for JsonResponse that encodes with the configured encoder.
+
+    Datetimes are rendered with isoformat() by every encoder, so serializers
+    can hand them over as-is.
+    """
+    kwargs.setdefault("content_type", JSON_CONTENT_TYPE)
+    return HttpResponse(encode_json(data), status=status, **kwargs)
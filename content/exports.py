@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import csv
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import Any
+
+from .keyset import iter_keyset
+from .models import AppointmentEvent
+from .serializers import ADMIN_APPOINTMENT
+
+EXPORT_FORMATS = ("csv", "ndjson")
+DEFAULT_CHUNK_SIZE = 2000
+
+# Same columns and names as the admin appointment list.
+APPOINTMENT_EXPORT_COLUMNS = ADMIN_APPOINTMENT.fields
+
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class _Echo:
+    """File-like object whose write() hands the line straight back to the caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _plain(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_appointment_rows(queryset=None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[tuple]:
+    if queryset is None:
+        queryset = AppointmentEvent.objects.all()
+    fields = [field for _, field in APPOINTMENT_EXPORT_COLUMNS]
+    # Seek through the clustered primary key chunk by chunk; a cursor is no option under PyMySQL.
+    return iter_keyset(queryset, fields, chunk_size=chunk_size)
+
+
+def iter_csv(rows: Iterable[tuple], batch_size: int = 500) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in APPOINTMENT_EXPORT_COLUMNS])
+    batch: list[str] = []
+    for row in rows:
+        batch.append(writer.writerow([_plain(value) for value in row]))
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+def iter_ndjson(rows: Iterable[tuple], batch_size: int = 500) -> Iterator[str]:
+    names = [name for name, _ in APPOINTMENT_EXPORT_COLUMNS]
+    batch: list[str] = []
+    for row in rows:
+        record = {name: _plain(value) for name, value in zip(names, row)}
+        batch.append(json.dumps(record, separators=(",", ":")) + "\n")
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+
+
+def iter_gzip(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def iter_appointment_export(
+    export_format: str,
+    queryset=None,
+    compress: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str | bytes]:
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format!r}")
+    rows = iter_appointment_rows(queryset, chunk_size=chunk_size)
+    chunks = iter_csv(rows) if export_format == "csv" else iter_ndjson(rows)
+    return iter_gzip(chunks) if compress else chunks
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from .calendar import CANCELLED_SUFFIXES
+from .keyset import iter_keyset
+from .models import Appointment
+
+ICS_CONTENT_TYPE = "text/calendar; charset=utf-8"
+FEED_TOKEN_PARAM = "token"
+DEFAULT_CHUNK_SIZE = 500
+FEED_COLUMNS = (
+    "appointment_id",
+    "status",
+    "start_time",
+    "end_time",
+    "email",
+    "event_count",
+    "last_occurred_at",
+    # Keyset tie-breaker; not rendered.
+    "id",
+)
+
+
+def feed_token(user) -> str:
+    """Per-user token for calendar clients, which cannot keep a session; a password change revokes it."""
+    digest = salted_hmac("content.ics.feed", f"{user.pk}:{user.password}", algorithm="sha256").hexdigest()
+    return f"{user.pk}-{digest[:32]}"
+
+
+def user_for_token(token: str):
+    user_id, _, _ = token.partition("-")
+    if not user_id.isdigit():
+        return None
+    user = get_user_model().objects.filter(pk=int(user_id), is_active=True, is_staff=True).first()
+    if user is None or not constant_time_compare(feed_token(user), token):
+        return None
+    return user
+
+
+def feed_marker() -> str | None:
+    """Newest projection change and row count, or None while that change is still settling.
+
+    The feed is rendered from the projection, so applied events and rebuilds
+    both move the marker. A transaction that stamped an earlier updated_at can
+    commit after a later one, so within APPOINTMENT_FEED_SETTLE_SECONDS of the
+    newest change the marker is not trusted and the feed is not cached.
+    """
+    state = Appointment.objects.aggregate(changed=Max("updated_at"), rows=Count("id"))
+    changed = state["changed"]
+    if changed is None:
+        return "0-0"
+    if timezone.now() - changed < timedelta(seconds=settings.APPOINTMENT_FEED_SETTLE_SECONDS):
+        return None
+    return f"{int(changed.timestamp() * 1_000_000)}-{state['rows']}"
+
+
+def feed_window_start() -> datetime:
+    today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=settings.APPOINTMENT_FEED_PAST_DAYS)
+
+
+def feed_etag(marker: str, window_start: datetime) -> str:
+    return f'"appointments-{marker}-{window_start:%Y%m%d}"'
+
+
+def _cache_key(etag: str) -> str:
+    return "appointments:ics:" + etag.strip('"')
+
+
+def _escape(value: str) -> str:
+    value = value.replace("\r\n", "\n").replace("\r", "\n")
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _stamp(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> str:
+    """Split content lines longer than 75 octets, as RFC 5545 requires."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts = []
+    while encoded:
+        cut = 75 if not parts else 74
+        # Never split inside a multi-byte character.
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _vevent(row: tuple) -> str:
+    appointment_id, status, start_time, end_time, email, event_count, last_occurred_at, _ = row
+    summary = f"Appointment with {email}" if email else "Appointment"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{_escape(appointment_id)}@portfolio-bff",
+        f"DTSTAMP:{_stamp(last_occurred_at)}",
+        f"LAST-MODIFIED:{_stamp(last_occurred_at)}",
+        f"SEQUENCE:{max(event_count - 1, 0)}",
+        f"DTSTART:{_stamp(start_time)}",
+        f"DTEND:{_stamp(end_time)}",
+        f"SUMMARY:{_escape(summary)}",
+        f"STATUS:{'CANCELLED' if status.endswith(CANCELLED_SUFFIXES) else 'CONFIRMED'}",
+        "END:VEVENT",
+    ]
+    return "".join(_fold(line) for line in lines)
+
+
+def iter_feed(window_start: datetime, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """VCALENDAR text for appointments ending after window_start, streamed in chunks of VEVENTs."""
+    yield "".join(
+        _fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//portfolio-bff//appointments//EN",
+            "CALSCALE:GREGORIAN",
+        )
+    )
+    rows = iter_keyset(
+        Appointment.objects.filter(end_time__gte=window_start),
+        FEED_COLUMNS,
+        order=("start_time", "id"),
+        chunk_size=chunk_size,
+    )
+    batch: list[str] = []
+    for row in rows:
+        batch.append(_vevent(row))
+        if len(batch) >= chunk_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
+    yield _fold("END:VCALENDAR")
+
+
+def cached_feed(etag: str) -> bytes | None:
+    return cache.get(_cache_key(etag))
+
+
+def iter_caching(etag: str, chunks: Iterable[str]) -> Iterator[bytes]:
+    """Stream the encoded feed and cache it once complete; an aborted download caches nothing."""
+    parts = []
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        parts.append(data)
+        yield data
+    cache.set(_cache_key(etag), b"".join(parts), timeout=settings.APPOINTMENT_FEED_CACHE_TIMEOUT)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _after(order: Sequence[str], values: Sequence) -> Q:
+    """Rows sorting after values in order: (a > x) OR (a = x AND b > y) OR ..."""
+    return reduce(
+        or_,
+        (
+            Q(**{field: value for field, value in zip(order[:index], values)}, **{f"{order[index]}__gt": values[index]})
+            for index in range(len(order))
+        ),
+    )
+
+
+def iter_keyset(
+    queryset, columns: Sequence[str], order: Sequence[str] = ("id",), chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple]:
+    """Yield values_list(*columns) rows of queryset in order, one chunk_size query at a time.
+
+    Each query seeks past the last row seen instead of holding a cursor open, so
+    memory stays bounded even where the driver cannot stream (PyMySQL buffers
+    whole result sets). order must be unique, non-null and included in columns.
+    """
+    positions = [list(columns).index(field) for field in order]
+    rows = queryset.order_by(*order).values_list(*columns)
+    last = None
+    while True:
+        chunk = list((rows if last is None else rows.filter(_after(order, last)))[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        last = [chunk[-1][position] for position in positions]
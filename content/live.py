@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import Max
+from django.utils import timezone
+
+from .encoding import encode_json
+from .models import AppointmentEvent
+from .serializers import ADMIN_APPOINTMENT
+
+logger = logging.getLogger(__name__)
+
+# Events read per tick; a larger backlog drains over the following ticks.
+BATCH_SIZE = 200
+# At most this many missed events are replayed to a client reconnecting with Last-Event-ID.
+MAX_REPLAY = 500
+
+
+def settle_horizon() -> datetime:
+    """Events received before this can no longer have lower-id events still waiting to commit.
+
+    Ids are allocated at insert time, so a slow transaction can commit an
+    event below one already streamed; cursors only move past settled events.
+    """
+    return timezone.now() - timedelta(seconds=settings.APPOINTMENT_STREAM_SETTLE)
+
+
+def settled_event_id() -> int:
+    return AppointmentEvent.objects.filter(received_at__lte=settle_horizon()).aggregate(last=Max("id"))["last"] or 0
+
+
+def events_after(event_id: int, limit: int = BATCH_SIZE) -> list[dict]:
+    """Stored events newer than event_id, oldest first; AppointmentEvent.id is the change cursor."""
+    return ADMIN_APPOINTMENT.serialize_rows(AppointmentEvent.objects.filter(id__gt=event_id).order_by("id")[:limit])
+
+
+def _settled_id(rows: list[dict], default: int) -> int:
+    horizon = settle_horizon()
+    return max((row["id"] for row in rows if row["receivedAt"] <= horizon), default=default)
+
+
+def start_stream(last_id: int) -> tuple[list[dict] | None, int, set[int]]:
+    """Where a client's stream starts: (replay, cursor, replayed ids above the cursor).
+
+    A new client starts from the settled events, so events still settling are
+    pushed to it too. A client reconnecting with last_id gets what it missed
+    replayed; past MAX_REPLAY missed events, replay is None and the client is
+    told to reset instead.
+    """
+    if not last_id:
+        return [], settled_event_id(), set()
+    replay = events_after(last_id, MAX_REPLAY + 1)
+    if len(replay) > MAX_REPLAY:
+        return None, settled_event_id(), set()
+    cursor = _settled_id(replay, last_id)
+    return replay, cursor, {row["id"] for row in replay if row["id"] > cursor}
+
+
+class Subscription:
+    """One connected client; batches are handed over from the polling thread.
+
+    Under ASGI the client's stream awaits an asyncio queue on its event loop;
+    under WSGI (loop=None) its worker thread blocks on a thread-safe queue.
+    Every event up to cursor has been sent, as have the ids in sent.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None, cursor: int = 0, sent: Iterable[int] = ()):
+        self.loop = loop
+        self.queue: asyncio.Queue | queue.Queue = asyncio.Queue() if loop else queue.Queue()
+        self.cursor = cursor
+        self.sent = set(sent)
+
+    def deliver(self, batch: list[dict]) -> None:
+        if self.loop is None:
+            self.queue.put(batch)
+        else:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, batch)
+
+    def offer(self, batch: list[dict], settled: int) -> None:
+        """Deliver the events of batch not sent yet, then move the cursor up to the settled id."""
+        fresh = [row for row in batch if row["id"] > self.cursor and row["id"] not in self.sent]
+        if fresh:
+            self.sent.update(row["id"] for row in fresh)
+            self.deliver(fresh)
+        if settled > self.cursor:
+            self.cursor = settled
+            self.sent = {event_id for event_id in self.sent if event_id > settled}
+
+
+class EventBroadcaster:
+    """Polls for new appointment events once per tick and fans each batch out to every subscriber.
+
+    A single daemon thread per process runs while anyone is subscribed, so
+    the database sees one cheap primary-key range query per tick no matter
+    how many dashboards are connected. The query starts at the lowest
+    subscriber cursor and so re-reads events that have not settled yet.
+    """
+
+    def __init__(self, fetch: Callable[[int, int], list[dict]] = events_after, autostart: bool = True):
+        self.fetch = fetch
+        self.autostart = autostart
+        self.subscribers: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(
+        self, loop: asyncio.AbstractEventLoop | None = None, cursor: int = 0, sent: Iterable[int] = ()
+    ) -> Subscription:
+        subscription = Subscription(loop, cursor, sent)
+        with self._lock:
+            self.subscribers.add(subscription)
+            if self.autostart and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(target=self._run, name="appointment-stream", daemon=True)
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self.subscribers.discard(subscription)
+
+    def poll_once(self) -> int:
+        """Run one tick: fetch events after the lowest cursor and offer them to all subscribers."""
+        with self._lock:
+            subscribers = list(self.subscribers)
+        if not subscribers:
+            return 0
+        batch = self.fetch(min(subscription.cursor for subscription in subscribers), BATCH_SIZE)
+        if not batch:
+            return 0
+        settled = _settled_id(batch, 0)
+        for subscription in subscribers:
+            subscription.offer(batch, settled)
+        return len(batch)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self.subscribers:
+                        self._thread = None
+                        return
+                close_old_connections()
+                try:
+                    self.poll_once()
+                except Exception:
+                    logger.exception("Polling appointment events failed.")
+                time.sleep(settings.APPOINTMENT_STREAM_INTERVAL)
+        finally:
+            connections.close_all()
+
+
+broadcaster = EventBroadcaster()
+
+
+def sse_frame(row: dict) -> str:
+    return f"id: {row['id']}\nevent: appointment\ndata: {encode_json(row).decode()}\n\n"
+
+
+def reset_frame(cursor: int) -> str:
+    """Tells a client that missed more than MAX_REPLAY events to reload; its stream resumes after cursor."""
+    return f"id: {cursor}\nevent: reset\ndata: {{}}\n\n"
+
+
+def _retry() -> str:
+    return f"retry: {int(settings.APPOINTMENT_STREAM_INTERVAL * 1000)}\n\n"
+
+
+def _frames(batch: list[dict]) -> str:
+    return "".join(sse_frame(row) for row in batch)
+
+
+def _opening(subscription: Subscription, replay: list[dict] | None) -> str:
+    return reset_frame(subscription.cursor) if replay is None else _frames(replay)
+
+
+async def iter_events(
+    hub: EventBroadcaster, subscription: Subscription, replay: list[dict] | None
+) -> AsyncIterator[str]:
+    """SSE stream: replayed events (or a reset), then every broadcast batch, with keep-alives while idle."""
+    try:
+        yield _retry()
+        text = _opening(subscription, replay)
+        if text:
+            yield text
+        while True:
+            try:
+                batch = await asyncio.wait_for(subscription.queue.get(), settings.APPOINTMENT_STREAM_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield _frames(batch)
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def iter_events_sync(hub: EventBroadcaster, subscription: Subscription, replay: list[dict] | None) -> Iterator[str]:
+    """The same stream for WSGI servers, holding one worker thread per connected client."""
+    try:
+        yield _retry()
+        text = _opening(subscription, replay)
+        if text:
+            yield text
+        while True:
+            try:
+                batch = subscription.queue.get(timeout=settings.APPOINTMENT_STREAM_HEARTBEAT)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            yield _frames(batch)
+    finally:
+        hub.unsubscribe(subscription)
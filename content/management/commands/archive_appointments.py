@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from content.models import AppointmentEvent, AppointmentEventArchive
+from content.payload_storage import compress_json, decode_payload
+from content.search import suspend_indexing, unindex_ids
+
+ARCHIVE_FIELDS = (
+    "event_id",
+    "event_type",
+    "occurred_at",
+    "kafka_topic",
+    "kafka_partition",
+    "kafka_offset",
+    "appointment_id",
+    "user_id",
+    "start_time",
+    "end_time",
+    "duration_minutes",
+    "email",
+    "phone_e164",
+    "notify_email",
+    "notify_sms",
+    "received_at",
+)
+
+
+def _archive_record(event: AppointmentEvent) -> dict:
+    record = {}
+    for field in ARCHIVE_FIELDS:
+        value = getattr(event, field)
+        record[field] = value.isoformat() if hasattr(value, "isoformat") else value
+    record["payload"] = decode_payload(event)
+    return record
+
+
+class Command(BaseCommand):
+    help = (
+        "Move appointment events older than N days out of the hot table, in batches, "
+        "into compressed archive rows (or gzip NDJSON files with --output-dir)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=90,
+            help="Archive events whose occurred_at is older than this many days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of events moved per transaction.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="Write each batch to a .ndjson.gz file here instead of the archive table.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many events would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 0:
+            raise CommandError("--older-than-days must not be negative.")
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be positive.")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        expired = AppointmentEvent.objects.filter(occurred_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{expired.count()} events older than {cutoff.isoformat()} would be archived.")
+            return
+
+        output_dir = Path(options["output_dir"]).expanduser() if options["output_dir"] else None
+        if output_dir is not None:
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        total = 0
+        while True:
+            moved = self._archive_batch(expired, options["batch_size"], output_dir)
+            if not moved:
+                break
+            total += moved
+            self.stdout.write(f"Archived {total} events...")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {total} events older than {cutoff.isoformat()}."))
+
+    def _archive_batch(self, expired, batch_size: int, output_dir: Path | None) -> int:
+        with transaction.atomic():
+            events = list(expired.order_by("occurred_at", "id")[:batch_size])
+            if not events:
+                return 0
+
+            records = [_archive_record(event) for event in events]
+            first, last = events[0].occurred_at, events[-1].occurred_at
+            if output_dir is None:
+                AppointmentEventArchive.objects.create(
+                    first_occurred_at=first,
+                    last_occurred_at=last,
+                    event_count=len(records),
+                    data=compress_json(records),
+                )
+            else:
+                filename = f"appointments-{first:%Y%m%dT%H%M%S}-{events[0].id}-{events[-1].id}.ndjson.gz"
+                with gzip.open(output_dir / filename, "wt", encoding="utf-8") as handle:
+                    for record in records:
+                        handle.write(json.dumps(record, separators=(",", ":")))
+                        handle.write("\n")
+
+            event_ids = [event.id for event in events]
+            # The search receiver would delete each event's tokens separately; drop the batch's in one statement.
+            with suspend_indexing():
+                AppointmentEvent.objects.filter(id__in=event_ids).delete()
+            unindex_ids("appointment", event_ids)
+        return len(events)
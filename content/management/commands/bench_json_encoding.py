@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+from django.utils import timezone
+
+from content.bundle import PORTFOLIO_CONTENT_KEY
+from content.encoding import ENCODERS
+from content.management.commands.build_content_bundle import build_bundle_entries
+from content.models import AppointmentEvent
+from content.seed import DATA_PATH, load_seed_data
+from content.serializers import ADMIN_APPOINTMENT
+
+
+def _legacy_appointment(event: AppointmentEvent) -> dict:
+    # The pre-encoder serializer shape: isoformat() per datetime, then JsonResponse.
+    payload = ADMIN_APPOINTMENT.serialize(event)
+    for key in ("occurredAt", "startTime", "endTime", "receivedAt"):
+        payload[key] = payload[key].isoformat()
+    return payload
+
+
+def _sample_appointments(count: int) -> list[AppointmentEvent]:
+    now = timezone.now()
+    return [
+        AppointmentEvent(
+            id=index,
+            event_id=f"evt-{index}",
+            event_type="appointments.created",
+            occurred_at=now - timedelta(minutes=index),
+            kafka_topic="appointments.created",
+            kafka_partition=0,
+            kafka_offset=index,
+            appointment_id=f"appt-{index}",
+            user_id=f"user-{index % 50}",
+            start_time=now + timedelta(days=index % 30),
+            end_time=now + timedelta(days=index % 30, minutes=30),
+            duration_minutes=30,
+            email=f"guest{index}@example.com",
+            phone_e164="+15555550100",
+            notify_email=True,
+            notify_sms=bool(index % 2),
+            received_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Microbenchmark JSON response encoding for large appointment lists and the portfolio payload."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000, help="Appointments in the list payload.")
+        parser.add_argument("--iterations", type=int, default=20, help="Timed runs per case.")
+
+    def handle(self, *args, **options):
+        events = _sample_appointments(options["rows"])
+        # The exact /api/portfolio-content payload for the shipped seed data.
+        portfolio = json.loads(build_bundle_entries(load_seed_data(DATA_PATH))[PORTFOLIO_CONTENT_KEY])
+        iterations = options["iterations"]
+
+        cases = {
+            f"appointments x{len(events)}": (
+                lambda: {"appointments": [_legacy_appointment(event) for event in events]},
+                lambda: {"appointments": [ADMIN_APPOINTMENT.serialize(event) for event in events]},
+            ),
+            "portfolio-content": (lambda: portfolio, lambda: portfolio),
+        }
+
+        self.stdout.write(f"{'case':<24} {'encoder':<22} {'ms/op':>10}")
+        for case, (legacy_builder, builder) in cases.items():
+            timings = {
+                "JsonResponse (legacy)": lambda: JsonResponse(legacy_builder()).content,
+            }
+            for name, encoder in ENCODERS.items():
+                timings[name] = lambda encoder=encoder: encoder(builder())
+            for name, func in timings.items():
+                seconds = min(timeit.repeat(func, number=1, repeat=iterations))
+                self.stdout.write(f"{case:<24} {name:<22} {seconds * 1000:>10.3f}")
+
+        if "orjson" not in ENCODERS:
+            self.stdout.write(self.style.WARNING("orjson is not installed; only the stdlib encoder was measured."))
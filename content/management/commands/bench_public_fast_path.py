@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.test.utils import override_settings
+
+# The stock stack the fast-path middleware replaces, for comparison.
+STOCK_MIDDLEWARE = {
+    "content.middleware.FastPathSessionMiddleware": "django.contrib.sessions.middleware.SessionMiddleware",
+    "content.middleware.FastPathCsrfViewMiddleware": "django.middleware.csrf.CsrfViewMiddleware",
+    "content.middleware.FastPathAuthenticationMiddleware": "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "content.middleware.FastPathMessageMiddleware": "django.contrib.messages.middleware.MessageMiddleware",
+}
+
+
+def _time_requests(client: Client, path: str, count: int) -> float:
+    client.get(path)  # warm the content cache and the middleware chain
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get(path)
+    return (time.perf_counter() - start) / count
+
+
+class Command(BaseCommand):
+    help = "Measure per-request overhead removed by the public fast-path middleware."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=2000, help="Requests per path and stack.")
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="Public path to request (repeatable; default: portfolio content and projects list).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or ["/api/portfolio-content", "/api/projects"]
+        count = options["requests"]
+        stock_middleware = [STOCK_MIDDLEWARE.get(entry, entry) for entry in settings.MIDDLEWARE]
+
+        self.stdout.write(f"{'path':<28} {'stock us/req':>14} {'fast us/req':>14} {'saved':>10}")
+        # The test client always sends Host: testserver.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for path in paths:
+                with override_settings(MIDDLEWARE=stock_middleware):
+                    stock = _time_requests(Client(), path, count)
+                fast = _time_requests(Client(), path, count)
+                saved = (stock - fast) / stock * 100 if stock else 0.0
+                self.stdout.write(f"{path:<28} {stock * 1e6:>14.1f} {fast * 1e6:>14.1f} {saved:>9.1f}%")
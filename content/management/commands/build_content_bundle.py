@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.bundle import (
+    PORTFOLIO_CONTENT_KEY,
+    PROJECTS_KEY,
+    TAGS_KEY,
+    project_slug_key,
+    projects_tag_key,
+    write_bundle,
+)
+from content.encoding import encode_json
+from content.models import ContactLink, Project, SocialLink, Stat
+from content.seed import REPO_ROOT, SeedValidationError, load_seed_data, resolve_seed_path, seed_rows
+from content.serializers import BUNDLED_PROJECT, PUBLIC_CONTACT_LINK, PUBLIC_SOCIAL_LINK, PUBLIC_STAT
+from content.tags import normalize_tags, tag_cloud_from_projects
+from content.views import _portfolio_payload, _site_payload
+
+DEFAULT_BUNDLE_PATH = REPO_ROOT / "content" / "data" / "build" / "portfolio-content.bundle"
+
+
+def build_bundle_entries(data: dict) -> dict[str, bytes]:
+    """Serialize the public payloads for seed data as the views would from the database.
+
+    Projects carry no id: database ids are assigned on insert and would not
+    match the ones a bundle could invent, so the bundle is keyed by slug.
+    """
+    rows = seed_rows(data)
+    projects = [Project(**row) for row in rows["projects"]]
+    site = _site_payload({row["key"]: row["value"] for row in rows["site"]})
+    serialized = [BUNDLED_PROJECT.serialize(project) for project in projects]
+
+    entries = {
+        PORTFOLIO_CONTENT_KEY: encode_json(
+            _portfolio_payload(
+                site,
+                serialized,
+                [PUBLIC_STAT.serialize(Stat(**row)) for row in rows["stats"]],
+                [row["name"] for row in rows["skills"]],
+                [PUBLIC_SOCIAL_LINK.serialize(SocialLink(**row)) for row in rows["socialLinks"]],
+                [PUBLIC_CONTACT_LINK.serialize(ContactLink(**row)) for row in rows["contactLinks"]],
+            )
+        ),
+        PROJECTS_KEY: encode_json({"projects": serialized}),
+        TAGS_KEY: encode_json({"tags": tag_cloud_from_projects(serialized)}),
+    }
+    tagged: dict[str, list[dict]] = {}
+    for project in serialized:
+        for slug in normalize_tags(project["tags"]):
+            tagged.setdefault(slug, []).append(project)
+    for slug, tag_projects in tagged.items():
+        entries[projects_tag_key(slug)] = encode_json({"projects": tag_projects})
+    for project in serialized:
+        entries[project_slug_key(project["slug"])] = encode_json(project)
+    return entries
+
+
+class Command(BaseCommand):
+    help = (
+        "Validate the seed JSON and precompile the public content payloads into a bundle "
+        "that the BFF can serve from disk (CONTENT_BUNDLE_PATH)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=str(DEFAULT_BUNDLE_PATH),
+            help="Bundle file to write.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only validate the seed data; do not write a bundle.",
+        )
+
+    def handle(self, *args, **options):
+        data_path = resolve_seed_path()
+        if not data_path.exists():
+            raise CommandError(f"Seed data not found: {data_path}")
+
+        try:
+            data = load_seed_data(data_path)
+        except SeedValidationError as exc:
+            raise CommandError(
+                "Seed data failed validation:\n" + "\n".join(f"- {error}" for error in exc.errors)
+            ) from exc
+
+        if options["check"]:
+            self.stdout.write(self.style.SUCCESS(f"Seed data is valid: {data_path}"))
+            return
+
+        entries = build_bundle_entries(data)
+        output = Path(options["output"]).expanduser()
+        write_bundle(output, entries)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {len(entries)} payloads from {data_path} to {output}."))
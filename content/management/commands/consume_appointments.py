@@ -4,9 +4,12 @@ import json
 from datetime import datetime, timezone
 
 from django.core.management.base import BaseCommand
+from django.db import IntegrityError, transaction
 from kafka import KafkaConsumer
 
-from content.models import AppointmentEvent
+from content.models import AppointmentEvent, AppointmentEventKey
+from content.payload_storage import encode_payload
+from content.projections import apply_event
 
 
 def _trim_fractional_seconds(value: str) -> str:
@@ -147,31 +150,66 @@ class Command(BaseCommand):
             )
             return False
 
-        AppointmentEvent.objects.update_or_create(
-            event_id=event_id,
-            defaults={
-                "event_type": event_type,
-                "occurred_at": occurred_at,
+        columns = {
+            "event_id": event_id,
+            "event_type": event_type,
+            "occurred_at": occurred_at,
+            "appointment_id": appointment_id,
+            "user_id": appointment.get("user_id", "") or "",
+            "start_time": start_time,
+            "end_time": end_time,
+            "duration_minutes": int(appointment.get("duration_minutes") or 0),
+            "email": appointment.get("email", "") or "",
+            "phone_e164": appointment.get("phone_e164", "") or "",
+            "notify_email": bool(notify.get("email")),
+            "notify_sms": bool(notify.get("sms")),
+        }
+        defaults = {key: value for key, value in columns.items() if key != "event_id"}
+        defaults.update(
+            {
                 "kafka_topic": message.topic or "",
                 "kafka_partition": message.partition,
                 "kafka_offset": message.offset,
-                "appointment_id": appointment_id,
-                "user_id": appointment.get("user_id", "") or "",
-                "start_time": start_time,
-                "end_time": end_time,
-                "duration_minutes": int(appointment.get("duration_minutes") or 0),
-                "email": appointment.get("email", "") or "",
-                "phone_e164": appointment.get("phone_e164", "") or "",
-                "notify_email": bool(notify.get("email")),
-                "notify_sms": bool(notify.get("sms")),
-                "payload": payload,
-            },
+            }
         )
+        defaults.update(encode_payload(payload, columns))
 
-        self.stdout.write(self.style.SUCCESS(f"Stored event {event_id} (offset {message.offset})."))
+        with transaction.atomic():
+            event, created = _store_event(event_id, defaults)
+            if event is not None:
+                apply_event(event, new=created)
+
+        if event is None:
+            self.stdout.write(f"Skipped event {event_id} (offset {message.offset}); it was already archived.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Stored event {event_id} (offset {message.offset})."))
         return True
 
 
+def _store_event(event_id: str, defaults: dict) -> tuple[AppointmentEvent | None, bool]:
+    """Insert the event, or update it in place when event_id was consumed before.
+
+    The unique AppointmentEventKey row decides which delivery is first: a
+    concurrent consumer blocks on it and then sees the redelivery. Returns
+    (None, False) for a redelivered event that has since been archived.
+    """
+    try:
+        with transaction.atomic():
+            event = AppointmentEvent.objects.create(event_id=event_id, **defaults)
+            AppointmentEventKey.objects.create(event_id=event_id, event_pk=event.pk)
+        return event, True
+    except IntegrityError:
+        pass
+    key = AppointmentEventKey.objects.get(event_id=event_id)
+    event = AppointmentEvent.objects.filter(pk=key.event_pk).first()
+    if event is None:
+        return None, False
+    for field, value in defaults.items():
+        setattr(event, field, value)
+    event.save()
+    return event, False
+
+
 def _get_env(key: str, default: str) -> str:
     import os
 
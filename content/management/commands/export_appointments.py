@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.exports import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, iter_appointment_export
+
+
+class Command(BaseCommand):
+    help = "Stream appointment events as CSV or NDJSON without loading the table into memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            default="csv",
+            help="Output format.",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Gzip-compress the output.",
+        )
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="File to write to (default: stdout).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows fetched from the database per round trip.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] <= 0:
+            raise CommandError("--chunk-size must be positive.")
+
+        chunks = iter_appointment_export(
+            options["format"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["output"] == "-":
+            if options["gzip"]:
+                for chunk in chunks:
+                    sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+            else:
+                for chunk in chunks:
+                    self.stdout.write(chunk, ending="")
+            return
+
+        mode = "wb" if options["gzip"] else "w"
+        encoding = None if options["gzip"] else "utf-8"
+        with open(options["output"], mode, encoding=encoding, newline="" if encoding else None) as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"Exported appointments to {options['output']}."))
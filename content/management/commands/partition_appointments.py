@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+
+from content.models import AppointmentEvent
+from content.partitions import (
+    DEFAULT_MONTHS_AHEAD,
+    drop_partition,
+    ensure_future_partitions,
+    expired_partitions,
+    list_partitions,
+    partition_table,
+    partitioning_supported,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage monthly range partitions of the appointment event table on MySQL: "
+        "init partitions the table, ensure creates upcoming months, prune drops "
+        "(or archives) expired months and status lists them. A no-op on other databases."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=("init", "ensure", "prune", "status"))
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=DEFAULT_MONTHS_AHEAD,
+            help="Months past the current one that must already have a partition (init/ensure).",
+        )
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=90,
+            help="Prune monthly partitions whose events are all older than this many days.",
+        )
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help="Swap each pruned partition into its own table instead of dropping its rows.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report which partitions would be pruned.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias to manage.")
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if options["months_ahead"] < 0:
+            raise CommandError("--months-ahead must not be negative.")
+        if options["older_than_days"] < 0:
+            raise CommandError("--older-than-days must not be negative.")
+        if not partitioning_supported(using):
+            self.stdout.write("Partitioning is only supported on MySQL; nothing to do.")
+            return
+
+        action = options["action"]
+        if action == "status":
+            self._status(using)
+        elif action == "init":
+            created = partition_table(options["months_ahead"], using)
+            if not created:
+                self.stdout.write("Table is already partitioned; use ensure to add months.")
+                return
+            self.stdout.write(
+                self.style.SUCCESS(f"Partitioned table into {len(created)} months ({created[0]}..{created[-1]}).")
+            )
+        else:
+            if not list_partitions(using):
+                raise CommandError("Table is not partitioned yet; run init first.")
+            if action == "ensure":
+                created = ensure_future_partitions(options["months_ahead"], using)
+                names = ", ".join(created) or "none needed"
+                self.stdout.write(self.style.SUCCESS(f"Created {len(created)} partitions ({names})."))
+            else:
+                self._prune(options, using)
+
+    def _status(self, using: str) -> None:
+        partitions = list_partitions(using)
+        if not partitions:
+            self.stdout.write("Table is not partitioned.")
+            return
+        for partition in partitions:
+            bound = partition.less_than.isoformat() if partition.less_than else "MAXVALUE"
+            self.stdout.write(f"{partition.name}\t< {bound}\t~{partition.rows} rows")
+
+    def _prune(self, options, using: str) -> None:
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        expired = expired_partitions(cutoff, using)
+        if options["dry_run"]:
+            names = ", ".join(partition.name for partition in expired) or "none"
+            self.stdout.write(f"Partitions older than {cutoff.isoformat()} that would be pruned: {names}.")
+            return
+        for partition in expired:
+            archive_table = f"{AppointmentEvent._meta.db_table}_{partition.name}" if options["archive"] else None
+            drop_partition(partition, archive_table, using)
+            self.stdout.write(
+                f"{'Archived' if archive_table else 'Dropped'} {partition.name} (~{partition.rows} rows)."
+            )
+        self.stdout.write(self.style.SUCCESS(f"Pruned {len(expired)} partitions older than {cutoff.isoformat()}."))
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.projections import rebuild_projection
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the current-state Appointment projection from the appointment event log. "
+        "Rows are updated in place under row locks, so the consumer can keep running."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Appointments recomputed per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] <= 0:
+            raise CommandError("--chunk-size must be positive.")
+        rebuilt = rebuild_projection(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} appointments."))
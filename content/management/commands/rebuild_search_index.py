@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from content.search import SEARCH_SOURCES, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the admin search token index from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            action="append",
+            dest="kinds",
+            choices=sorted(SEARCH_SOURCES),
+            help="Only rebuild this result type (repeatable; default: all).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows read and tokens written per batch.")
+
+    def handle(self, *args, **options):
+        for kind in options["kinds"] or SEARCH_SOURCES:
+            indexed = rebuild_index(kind, chunk_size=options["chunk_size"])
+            self.stdout.write(f"{kind}: indexed {indexed} rows")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -1,24 +1,122 @@
 from __future__ import annotations
 
-import json
 import os
-from pathlib import Path
+from dataclasses import dataclass
+from typing import Any
 
 from django.contrib.auth import get_user_model
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from django.utils.text import slugify
+from django.utils import timezone
 
+from content.cache import bump_content_version
+from content.changes import record_changes
 from content.models import ContactLink, Project, SiteSetting, Skill, SocialLink, Stat
+from content.ranking import REBALANCE_LENGTH, rank_for_order, schedule_rebalance
+from content.search import rebuild_index
+from content.seed import DATA_PATH, SeedValidationError, load_seed_data, resolve_seed_path, seed_rows
+from content.tags import rebuild_tag_index
+
+
+@dataclass
+class SyncResult:
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.created} created, {self.updated} updated, "
+            f"{self.deleted} deleted, {self.unchanged} unchanged"
+        )
 
-REPO_ROOT = Path(__file__).resolve().parents[3]
-DATA_PATH = REPO_ROOT / "content" / "data" / "portfolio-content.json"
-OPS_REPO_NAMES = ("ntakemori-deploy", "ntakemori-deployment")
-OPS_SEED_FILENAME = "portfolio-content.json"
 
-SITE_NAME_KEY = "site.name"
-DISPLAY_NAME_KEY = "site.display_name"
-CONTACT_EMAIL_KEY = "site.contact_email"
+def _sync_rows(model, key_field: str, rows: list[dict[str, Any]], prune: bool) -> SyncResult:
+    """Bring a model's rows in line with the seed rows using one query per operation."""
+    desired: dict[Any, dict[str, Any]] = {}
+    for row in rows:
+        if row[key_field] in desired:
+            raise CommandError(f"{model.__name__}: the seed data repeats {key_field} {row[key_field]!r}.")
+        desired[row[key_field]] = row
+
+    # Not every key field is unique in the database (Stat.label); refuse rather than update one row of several.
+    existing: dict[Any, Any] = {}
+    for obj in model.objects.order_by():
+        key = getattr(obj, key_field)
+        if key in existing:
+            raise CommandError(f"{model.__name__}: several rows have {key_field} {key!r}; remove the duplicates first.")
+        existing[key] = obj
+    field_names = {field.name for field in model._meta.concrete_fields}
+    touches_updated_at = "updated_at" in field_names
+
+    result = SyncResult()
+    to_create = []
+    to_update = []
+    # Keys of rows that need a rank: new rows and rows whose seed order changed, in seed order.
+    to_place = []
+    update_fields: set[str] = set()
+    for key, row in desired.items():
+        obj = existing.get(key)
+        if obj is None:
+            to_create.append(model(**row))
+            to_place.append(key)
+            continue
+        changed_fields = [field for field, value in row.items() if getattr(obj, field) != value]
+        if not changed_fields:
+            result.unchanged += 1
+            continue
+        for field in changed_fields:
+            setattr(obj, field, row[field])
+        update_fields.update(changed_fields)
+        to_update.append(obj)
+        if "order" in changed_fields:
+            to_place.append(key)
+
+    created_pks: dict[Any, int] = {}
+    if to_create:
+        model.objects.bulk_create(to_create)
+        result.created = len(to_create)
+        # bulk_create() does not set primary keys on every backend; look them up by key.
+        created_keys = [getattr(obj, key_field) for obj in to_create]
+        created_pks = dict(model.objects.filter(**{f"{key_field}__in": created_keys}).values_list(key_field, "pk"))
+        record_changes(model, created_pks.values())
+    if to_update:
+        if touches_updated_at:
+            now = timezone.now()
+            for obj in to_update:
+                obj.updated_at = now
+            update_fields.add("updated_at")
+        model.objects.bulk_update(to_update, sorted(update_fields))
+        result.updated = len(to_update)
+        # Bulk writes skip the change-log signals (deletes below still send them).
+        record_changes(model, [obj.pk for obj in to_update])
+    if prune:
+        stale_ids = [obj.pk for key, obj in existing.items() if key not in desired]
+        if stale_ids:
+            model.objects.filter(pk__in=stale_ids).delete()
+            result.deleted = len(stale_ids)
+    if to_place and "rank" in field_names:
+        _place(model, [created_pks[key] if key in created_pks else existing[key].pk for key in to_place])
+    return result
+
+
+def _place(model, pks: list[int]) -> None:
+    """Rank rows by their seed order among the others, leaving the ranks of untouched rows (and admin moves) alone."""
+    # Clear the old ranks first so a row that is about to move cannot serve as another row's anchor.
+    model.objects.filter(pk__in=pks).update(rank="")
+    orders = dict(model.objects.filter(pk__in=pks).values_list("pk", "order"))
+    longest = 0
+    for pk in pks:
+        rank = rank_for_order(model, orders[pk], exclude_pk=pk)
+        model.objects.filter(pk=pk).update(rank=rank)
+        longest = max(longest, len(rank))
+    if longest > REBALANCE_LENGTH:
+        transaction.on_commit(lambda: schedule_rebalance(model))
 
 
 class Command(BaseCommand):
@@ -31,89 +129,52 @@ class Command(BaseCommand):
         parser.add_argument(
             "--reset",
             action="store_true",
-            help="Delete existing content before seeding.",
+            help="Delete content rows that are not present in the seed data.",
         )
 
     def handle(self, *args, **options):
-        data_path = _resolve_seed_path()
+        data_path = resolve_seed_path()
         if not data_path.exists():
             raise FileNotFoundError(f"Seed data not found: {data_path}")
 
         if data_path != DATA_PATH:
             self.stdout.write(self.style.WARNING(f"Using seed override: {data_path}"))
 
-        with data_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        try:
+            data = load_seed_data(data_path)
+        except SeedValidationError as exc:
+            raise CommandError(
+                "Seed data failed validation:\n" + "\n".join(f"- {error}" for error in exc.errors)
+            ) from exc
 
+        prune = options["reset"]
         with transaction.atomic():
-            if options["reset"]:
-                Project.objects.all().delete()
-                Stat.objects.all().delete()
-                Skill.objects.all().delete()
-                SocialLink.objects.all().delete()
-                ContactLink.objects.all().delete()
-
-            site = data.get("site", {})
-            SiteSetting.objects.update_or_create(key=SITE_NAME_KEY, defaults={"value": site.get("name", "Portfolio")})
-            SiteSetting.objects.update_or_create(key=DISPLAY_NAME_KEY, defaults={"value": site.get("displayName", "Your Name")})
-            SiteSetting.objects.update_or_create(key=CONTACT_EMAIL_KEY, defaults={"value": site.get("contactEmail", "hello@example.com")})
-
-            for index, project in enumerate(data.get("projects", [])):
-                slug = project.get("slug") or slugify(project.get("title", ""))
-                Project.objects.update_or_create(
-                    slug=slug,
-                    defaults={
-                        "title": project.get("title", ""),
-                        "description": project.get("description", ""),
-                        "tags": project.get("tags", []),
-                        "link": project.get("link", ""),
-                        "github": project.get("github", ""),
-                        "is_published": True,
-                        "order": index,
-                    },
-                )
-
-            for index, stat in enumerate(data.get("stats", [])):
-                Stat.objects.update_or_create(
-                    label=stat.get("label", ""),
-                    defaults={
-                        "number": stat.get("number", ""),
-                        "icon": stat.get("icon", ""),
-                        "order": index,
-                    },
-                )
-
-            for index, skill_name in enumerate(data.get("skills", [])):
-                Skill.objects.update_or_create(
-                    name=skill_name,
-                    defaults={
-                        "order": index,
-                    },
-                )
-
-            for index, link in enumerate(data.get("socialLinks", [])):
-                SocialLink.objects.update_or_create(
-                    name=link.get("name", ""),
-                    defaults={
-                        "url": link.get("url", ""),
-                        "icon": link.get("icon", ""),
-                        "order": index,
-                    },
-                )
-
-            for index, link in enumerate(data.get("contactLinks", [])):
-                ContactLink.objects.update_or_create(
-                    title=link.get("title", ""),
-                    defaults={
-                        "icon": link.get("icon", ""),
-                        "description": link.get("description", ""),
-                        "href": link.get("href", ""),
-                        "order": index,
-                    },
-                )
+            rows = seed_rows(data)
+            projects = _sync_rows(Project, "slug", rows["projects"], prune=prune)
+            if projects.changed:
+                rebuild_index("project")
+                rebuild_tag_index()
+            summary = [
+                ("site settings", _sync_rows(SiteSetting, "key", rows["site"], prune=False)),
+                ("projects", projects),
+                ("stats", _sync_rows(Stat, "label", rows["stats"], prune=prune)),
+                ("skills", _sync_rows(Skill, "name", rows["skills"], prune=prune)),
+                ("social links", _sync_rows(SocialLink, "name", rows["socialLinks"], prune=prune)),
+                ("contact links", _sync_rows(ContactLink, "title", rows["contactLinks"], prune=prune)),
+            ]
 
             self._maybe_seed_dev_superuser()
 
+        changed = False
+        for label, result in summary:
+            if result.changed:
+                changed = True
+                self.stdout.write(f"{label}: {result}")
+        if changed:
+            # Bulk writes skip model signals, so invalidate cached payloads explicitly.
+            bump_content_version()
+        else:
+            self.stdout.write("Content already up to date; nothing changed.")
         self.stdout.write(self.style.SUCCESS("Seed data loaded successfully."))
 
     def _maybe_seed_dev_superuser(self) -> None:
@@ -140,19 +201,3 @@ def _is_production_env() -> bool:
             return True
     return False
 
-
-def _resolve_seed_path() -> Path:
-    env_path = os.getenv("BFF_SEED_DATA_PATH")
-    if env_path:
-        candidate = Path(env_path).expanduser()
-        if candidate.is_file():
-            return candidate
-
-    bases = [REPO_ROOT.parent.parent, REPO_ROOT.parent]
-    for base in bases:
-        for repo_name in OPS_REPO_NAMES:
-            candidate = base / repo_name / OPS_SEED_FILENAME
-            if candidate.is_file():
-                return candidate
-
-    return DATA_PATH
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from content.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        "Open database connections and prebuild every public payload in the cache. "
+        "With a shared cache (REDIS_URL) this warms all workers; otherwise set WARMUP_ON_START."
+    )
+
+    def handle(self, *args, **options):
+        report = warm_up()
+        self.stdout.write(self.style.SUCCESS(f"Warmed up {report}."))
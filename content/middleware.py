@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import SimpleLazyObject
+
+from . import ratelimit
+from .auth_cache import get_cached_user
+from .db_router import RoutingState, activate, deactivate, iter_with_routing, replica_aliases
+from .compression import min_compress_length, compress_response, negotiate_encoding
+
+
+class JsonCompressionMiddleware:
+    """Compress JSON responses with the best encoding the client accepts (br or gzip).
+
+    Responses that already carry a Content-Encoding, such as the precompressed
+    public payloads, are passed through untouched.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+        if not response.get("Content-Type", "").startswith("application/json"):
+            return response
+        if len(response.content) < min_compress_length():
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request)
+        if encoding is None:
+            return response
+        return compress_response(response, encoding)
+
+
+DEFAULT_PUBLIC_PATH_PREFIXES = ("/api/portfolio-content", "/api/projects", "/api/tags", "/api/ready", "/projects/")
+SAFE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def public_path_prefixes() -> tuple[str, ...]:
+    return tuple(getattr(settings, "PUBLIC_FAST_PATH_PREFIXES", DEFAULT_PUBLIC_PATH_PREFIXES))
+
+
+class PublicFastPathMixin:
+    """Skip a stock middleware for anonymous, read-only requests to public content routes.
+
+    Public JSON never reads the session, the user or messages, and GETs need no
+    CSRF check, so those layers are pure overhead there. Admin routes keep the
+    full behaviour.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.public_prefixes = public_path_prefixes()
+
+    def is_fast_path(self, request) -> bool:
+        return request.method in SAFE_METHODS and request.path_info.startswith(self.public_prefixes)
+
+    def __call__(self, request):
+        if self.is_fast_path(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class FastPathSessionMiddleware(PublicFastPathMixin, SessionMiddleware):
+    pass
+
+
+class FastPathCsrfViewMiddleware(PublicFastPathMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if self.is_fast_path(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class FastPathAuthenticationMiddleware(PublicFastPathMixin, AuthenticationMiddleware):
+    def process_request(self, request):
+        super().process_request(request)
+        # Serve the session's user from the short-lived per-session cache.
+        request.user = SimpleLazyObject(lambda: get_cached_user(request))
+
+
+class FastPathMessageMiddleware(PublicFastPathMixin, MessageMiddleware):
+    pass
+
+
+class PublicRateLimitMiddleware:
+    """Apply the RATE_LIMIT_PUBLIC quota per client IP to RATE_LIMIT_PUBLIC_PREFIXES.
+
+    Runs before any cache or database access, so a flood of public requests
+    is turned away without building or reading payloads.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.limited_prefixes = tuple(settings.RATE_LIMIT_PUBLIC_PREFIXES)
+
+    def __call__(self, request):
+        if request.path_info.startswith(self.limited_prefixes):
+            retry_after = ratelimit.check(ratelimit.PUBLIC, ratelimit.client_ip(request))
+            if retry_after:
+                return ratelimit.too_many_requests(retry_after)
+        return self.get_response(request)
+
+
+ADMIN_API_PREFIX = "/api/admin/"
+ADMIN_CORS_HEADERS = "Content-Type, X-CSRFToken"
+ADMIN_CORS_METHODS = "GET, POST, PUT, PATCH, DELETE, OPTIONS"
+
+
+class AdminCorsMiddleware:
+    """CORS for the admin API, with the allowed origins frozen at startup.
+
+    Preflight (OPTIONS) requests are answered here, before the session, CSRF
+    and auth layers or the view run, and carry Access-Control-Max-Age so the
+    browser can reuse them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.allowed_origins = frozenset(getattr(settings, "ADMIN_UI_ORIGINS", None) or ())
+        self.max_age = str(getattr(settings, "ADMIN_CORS_MAX_AGE", 7200))
+
+    def __call__(self, request):
+        if not request.path_info.startswith(ADMIN_API_PREFIX):
+            return self.get_response(request)
+        if request.method == "OPTIONS":
+            response = HttpResponse(status=204)
+            if self._apply(request, response):
+                response["Access-Control-Allow-Headers"] = ADMIN_CORS_HEADERS
+                response["Access-Control-Allow-Methods"] = ADMIN_CORS_METHODS
+                response["Access-Control-Max-Age"] = self.max_age
+            return response
+        response = self.get_response(request)
+        self._apply(request, response)
+        return response
+
+    def _apply(self, request, response) -> bool:
+        patch_vary_headers(response, ("Origin",))
+        origin = request.headers.get("Origin")
+        if origin not in self.allowed_origins:
+            return False
+        response["Access-Control-Allow-Origin"] = origin
+        response["Access-Control-Allow-Credentials"] = "true"
+        return True
+
+
+PRIMARY_PIN_COOKIE = "bff_read_primary"
+
+
+class ReplicaRoutingMiddleware:
+    """Route safe reads under REPLICA_READ_PREFIXES to DB_REPLICAS.
+
+    A request that writes pins the client (via a cookie) to the primary for
+    REPLICA_PIN_SECONDS, so the writer reads its own writes while replicas
+    catch up. Cached content is always rebuilt from the primary
+    (content.cache), whichever process wrote it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.replicas = replica_aliases()
+        self.prefixes = tuple(getattr(settings, "REPLICA_READ_PREFIXES", ()))
+        self.pin_seconds = getattr(settings, "REPLICA_PIN_SECONDS", 5)
+
+    def __call__(self, request):
+        if not self.replicas:
+            return self.get_response(request)
+
+        state = RoutingState(use_replica=self._replica_safe(request))
+        token = activate(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            deactivate(token)
+        # Async streams (server-sent events) query from their own thread, outside the request's routing.
+        if response.streaming and not response.is_async:
+            response.streaming_content = iter_with_routing(state, response.streaming_content)
+        if state.wrote and self.pin_seconds > 0:
+            until = time.time() + self.pin_seconds
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                f"{until:.3f}",
+                max_age=self.pin_seconds,
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+    def _replica_safe(self, request) -> bool:
+        if request.method not in SAFE_METHODS or not request.path_info.startswith(self.prefixes):
+            return False
+        try:
+            return float(request.COOKIES.get(PRIMARY_PIN_COOKIE, 0)) <= time.time()
+        except ValueError:
+            return True
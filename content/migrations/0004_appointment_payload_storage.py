@@ -0,0 +1,56 @@
+# Generated by Django 4.2 on 2026-10-19 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0003_appointmentevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentEventArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("first_occurred_at", models.DateTimeField()),
+                ("last_occurred_at", models.DateTimeField()),
+                ("event_count", models.PositiveIntegerField(default=0)),
+                ("data", models.BinaryField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["first_occurred_at", "id"],
+            },
+        ),
+        migrations.AddField(
+            model_name="appointmentevent",
+            name="payload_blob",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="appointmentevent",
+            name="payload_encoding",
+            field=models.CharField(default="json", max_length=10),
+        ),
+        migrations.AlterField(
+            model_name="appointmentevent",
+            name="payload",
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="appointmentevent",
+            index=models.Index(
+                fields=["occurred_at", "id"], name="content_appt_occurred_idx"
+            ),
+        ),
+    ]
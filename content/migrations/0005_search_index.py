@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0004_appointment_payload_storage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchToken",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("object_id", models.BigIntegerField()),
+                ("token", models.CharField(max_length=64)),
+                ("weight", models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["token", "kind", "object_id", "weight"],
+                        name="content_search_lookup_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="searchtoken",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "object_id", "token"), name="content_search_token_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 4.2 on 2026-10-19 13:00
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def backfill_project_tags(apps, schema_editor):
+    Project = apps.get_model("content", "Project")
+    Tag = apps.get_model("content", "Tag")
+    ProjectTag = apps.get_model("content", "ProjectTag")
+    tag_ids = {}
+    links = []
+    for project_id, tags in Project.objects.values_list("id", "tags"):
+        for name in tags or []:
+            slug = slugify(str(name))
+            if not slug:
+                continue
+            if slug not in tag_ids:
+                tag_ids[slug] = Tag.objects.get_or_create(
+                    slug=slug, defaults={"name": str(name).strip()}
+                )[0].id
+            links.append((project_id, tag_ids[slug]))
+    ProjectTag.objects.bulk_create(
+        [
+            ProjectTag(project_id=project_id, tag_id=tag_id)
+            for project_id, tag_id in dict.fromkeys(links)
+        ]
+    )
+
+
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0005_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("slug", models.SlugField(max_length=100, unique=True)),
+                ("name", models.CharField(max_length=100)),
+            ],
+            options={
+                "ordering": ["slug"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectTag",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_links",
+                        to="content.project",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_links",
+                        to="content.tag",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="projecttag",
+            constraint=models.UniqueConstraint(
+                fields=("tag", "project"), name="content_project_tag_uniq"
+            ),
+        ),
+        migrations.RunPython(backfill_project_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2 on 2026-10-19 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0006_project_tags"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Appointment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("appointment_id", models.CharField(max_length=100, unique=True)),
+                ("status", models.CharField(max_length=100)),
+                ("user_id", models.CharField(blank=True, max_length=100)),
+                ("start_time", models.DateTimeField()),
+                ("end_time", models.DateTimeField()),
+                ("duration_minutes", models.PositiveIntegerField(default=0)),
+                ("email", models.EmailField(blank=True, max_length=254)),
+                ("phone_e164", models.CharField(blank=True, max_length=30)),
+                ("notify_email", models.BooleanField(default=False)),
+                ("notify_sms", models.BooleanField(default=False)),
+                ("event_count", models.PositiveIntegerField(default=0)),
+                ("first_occurred_at", models.DateTimeField()),
+                ("last_event_id", models.CharField(max_length=100)),
+                ("last_occurred_at", models.DateTimeField()),
+                ("last_offset", models.BigIntegerField(default=-1)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["-last_occurred_at", "-id"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="appointmentevent",
+            index=models.Index(
+                fields=["appointment_id", "occurred_at"], name="content_appt_stream_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["last_occurred_at", "id"], name="content_appt_state_recent_idx"
+            ),
+        ),
+    ]
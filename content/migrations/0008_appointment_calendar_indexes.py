@@ -0,0 +1,23 @@
+# Generated by Django 4.2 on 2026-10-19 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0007_appointment_projection"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["start_time", "end_time"], name="content_appt_state_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(fields=["end_time"], name="content_appt_state_end_idx"),
+        ),
+    ]
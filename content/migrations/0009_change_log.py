@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-19 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0008_appointment_calendar_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeLog",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("kind", models.CharField(max_length=50)),
+                ("object_id", models.BigIntegerField()),
+                ("deleted", models.BooleanField(default=False)),
+                ("changed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["kind", "id"], name="content_change_log_cursor_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="changelog",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "object_id"), name="content_change_log_object_uniq"
+            ),
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 4.2 on 2026-10-19 18:00
+
+from django.db import migrations, models
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANKED_MODELS = ("ContactLink", "Project", "Skill", "SocialLink", "Stat")
+
+
+def evenly_spaced(count):
+    # Frozen copy of content.ranking.evenly_spaced.
+    width = 1
+    while len(DIGITS) ** width <= count:
+        width += 1
+    step = len(DIGITS) ** width // (count + 1)
+    keys = []
+    for position in range(1, count + 1):
+        value = step * position
+        key = []
+        for _ in range(width):
+            value, digit = divmod(value, len(DIGITS))
+            key.append(DIGITS[digit])
+        keys.append("".join(reversed(key)).rstrip(DIGITS[0]))
+    return keys
+
+
+def backfill_ranks(apps, schema_editor):
+    for name in RANKED_MODELS:
+        model = apps.get_model("content", name)
+        ids = list(model.objects.order_by("order", "id").values_list("id", flat=True))
+        model.objects.bulk_update(
+            [model(id=pk, rank=rank) for pk, rank in zip(ids, evenly_spaced(len(ids)))],
+            ["rank"],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0009_change_log"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="contactlink",
+            options={"ordering": ["rank", "id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="project",
+            options={"ordering": ["rank", "id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="skill",
+            options={"ordering": ["rank", "id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="sociallink",
+            options={"ordering": ["rank", "id"]},
+        ),
+        migrations.AlterModelOptions(
+            name="stat",
+            options={"ordering": ["rank", "id"]},
+        ),
+        migrations.AddField(
+            model_name="contactlink",
+            name="rank",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="rank",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="skill",
+            name="rank",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="sociallink",
+            name="rank",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="stat",
+            name="rank",
+            field=models.CharField(default="", max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name="contactlink",
+            index=models.Index(
+                fields=["rank", "id"], name="content_contact_link_rank_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["rank", "id"], name="content_project_rank_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="skill",
+            index=models.Index(fields=["rank", "id"], name="content_skill_rank_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="sociallink",
+            index=models.Index(
+                fields=["rank", "id"], name="content_social_link_rank_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stat",
+            index=models.Index(fields=["rank", "id"], name="content_stat_rank_idx"),
+        ),
+        migrations.RunPython(backfill_ranks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,115 @@
+# Generated by Django 4.2 on 2026-10-19 20:00
+
+from django.db import migrations, models
+
+# Unique key partition_appointments added before event ids moved to AppointmentEventKey.
+LEGACY_PARTITIONED_KEY = "content_appt_event_occurred_uniq"
+BATCH_SIZE = 1000
+
+
+def _partitioned(schema_editor, table):
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL",
+            [table],
+        )
+        return cursor.fetchone()[0] > 0
+
+
+def _plain_event_id():
+    field = models.CharField(max_length=100)
+    field.set_attributes_from_name("event_id")
+    return field
+
+
+def drop_event_id_unique(apps, schema_editor):
+    model = apps.get_model("content", "AppointmentEvent")
+    table = model._meta.db_table
+    if not _partitioned(schema_editor, table):
+        schema_editor.alter_field(
+            model, model._meta.get_field("event_id"), _plain_event_id()
+        )
+        return
+    # Partitioning already replaced event_id's unique key with (event_id, occurred_at).
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    if LEGACY_PARTITIONED_KEY in constraints:
+        quote = connection.ops.quote_name
+        schema_editor.execute(
+            f"ALTER TABLE {quote(table)} DROP INDEX {quote(LEGACY_PARTITIONED_KEY)}"
+        )
+
+
+def restore_event_id_unique(apps, schema_editor):
+    model = apps.get_model("content", "AppointmentEvent")
+    if not _partitioned(schema_editor, model._meta.db_table):
+        schema_editor.alter_field(
+            model, _plain_event_id(), model._meta.get_field("event_id")
+        )
+
+
+def backfill_event_keys(apps, schema_editor):
+    event_model = apps.get_model("content", "AppointmentEvent")
+    key_model = apps.get_model("content", "AppointmentEventKey")
+    last_id = 0
+    while True:
+        rows = list(
+            event_model.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "event_id")[:BATCH_SIZE]
+        )
+        if not rows:
+            return
+        key_model.objects.bulk_create(
+            [key_model(event_id=event_id, event_pk=pk) for pk, event_id in rows],
+            ignore_conflicts=True,
+        )
+        last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0011_content_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentEventKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.CharField(max_length=100, unique=True)),
+                ("event_pk", models.BigIntegerField()),
+            ],
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="appointmentevent",
+                    name="event_id",
+                    field=models.CharField(max_length=100),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(drop_event_id_unique, restore_event_id_unique),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="appointmentevent",
+            index=models.Index(fields=["event_id"], name="content_appt_event_id_idx"),
+        ),
+        migrations.RunPython(backfill_event_keys, migrations.RunPython.noop),
+    ]
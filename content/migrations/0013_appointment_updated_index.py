@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-19 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0012_appointment_event_key"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["updated_at"], name="content_appt_state_updated_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2 on 2026-10-19 22:00
+
+import datetime
+from django.db import migrations, models
+from django.db.models import DurationField, ExpressionWrapper, F, Max
+
+
+def backfill_longest(apps, schema_editor):
+    appointment_model = apps.get_model("content", "Appointment")
+    bound_model = apps.get_model("content", "AppointmentDurationBound")
+    duration = ExpressionWrapper(
+        F("end_time") - F("start_time"), output_field=DurationField()
+    )
+    longest = appointment_model.objects.aggregate(longest=Max(duration))["longest"]
+    bound_model.objects.update_or_create(
+        pk=1, defaults={"longest": longest or datetime.timedelta(0)}
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("content", "0013_appointment_updated_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentDurationBound",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("longest", models.DurationField(default=datetime.timedelta(0))),
+            ],
+        ),
+        migrations.RunPython(backfill_longest, migrations.RunPython.noop),
+    ]
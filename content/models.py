@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db import models
 
 
@@ -37,24 +39,55 @@ class Project(models.Model):
     github = models.CharField(max_length=500, blank=True)
     is_published = models.BooleanField(default=True)
     order = models.PositiveIntegerField(default=0)
+    # Sort key (see content.ranking); order is only used to place rows that have no rank yet.
+    rank = models.CharField(max_length=64, default="")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["order", "id"]
+        ordering = ["rank", "id"]
+        indexes = [models.Index(fields=["rank", "id"], name="content_project_rank_idx")]
 
     def __str__(self) -> str:
         return self.title
 
 
+class Tag(models.Model):
+    """Normalized project tag; slug is the lookup key, name the first spelling seen."""
+
+    slug = models.SlugField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ["slug"]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class ProjectTag(models.Model):
+    """Through-table mirroring Project.tags so tag filters and counts hit an index."""
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="tag_links")
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="project_links")
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["tag", "project"], name="content_project_tag_uniq")]
+
+    def __str__(self) -> str:
+        return f"{self.project_id}:{self.tag_id}"
+
+
 class Stat(models.Model):
     number = models.CharField(max_length=50)
     label = models.CharField(max_length=100)
     icon = models.CharField(max_length=10, blank=True)
     order = models.PositiveIntegerField(default=0)
+    rank = models.CharField(max_length=64, default="")
 
     class Meta:
-        ordering = ["order", "id"]
+        ordering = ["rank", "id"]
+        indexes = [models.Index(fields=["rank", "id"], name="content_stat_rank_idx")]
 
     def __str__(self) -> str:
         return f"{self.label} ({self.number})"
@@ -63,9 +96,11 @@ class Stat(models.Model):
 class Skill(models.Model):
     name = models.CharField(max_length=100, unique=True)
     order = models.PositiveIntegerField(default=0)
+    rank = models.CharField(max_length=64, default="")
 
     class Meta:
-        ordering = ["order", "id"]
+        ordering = ["rank", "id"]
+        indexes = [models.Index(fields=["rank", "id"], name="content_skill_rank_idx")]
 
     def __str__(self) -> str:
         return self.name
@@ -76,9 +111,11 @@ class SocialLink(models.Model):
     url = models.URLField()
     icon = models.CharField(max_length=50, blank=True)
     order = models.PositiveIntegerField(default=0)
+    rank = models.CharField(max_length=64, default="")
 
     class Meta:
-        ordering = ["order", "id"]
+        ordering = ["rank", "id"]
+        indexes = [models.Index(fields=["rank", "id"], name="content_social_link_rank_idx")]
 
     def __str__(self) -> str:
         return self.name
@@ -90,16 +127,19 @@ class ContactLink(models.Model):
     description = models.CharField(max_length=200, blank=True)
     href = models.CharField(max_length=500)
     order = models.PositiveIntegerField(default=0)
+    rank = models.CharField(max_length=64, default="")
 
     class Meta:
-        ordering = ["order", "id"]
+        ordering = ["rank", "id"]
+        indexes = [models.Index(fields=["rank", "id"], name="content_contact_link_rank_idx")]
 
     def __str__(self) -> str:
         return self.title
 
 
 class AppointmentEvent(models.Model):
-    event_id = models.CharField(max_length=100, unique=True)
+    # Deduplicated through AppointmentEventKey: a partitioned table cannot hold a unique key without occurred_at.
+    event_id = models.CharField(max_length=100)
     event_type = models.CharField(max_length=100)
     occurred_at = models.DateTimeField()
     kafka_topic = models.CharField(max_length=200, blank=True)
@@ -114,11 +154,137 @@ class AppointmentEvent(models.Model):
     phone_e164 = models.CharField(max_length=30, blank=True)
     notify_email = models.BooleanField(default=False)
     notify_sms = models.BooleanField(default=False)
-    payload = models.JSONField()
+    payload = models.JSONField(null=True, blank=True)
+    payload_encoding = models.CharField(max_length=10, default="json")
+    payload_blob = models.BinaryField(null=True, blank=True)
     received_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-occurred_at", "-id"]
+        indexes = [
+            models.Index(fields=["occurred_at", "id"], name="content_appt_occurred_idx"),
+            models.Index(fields=["event_id"], name="content_appt_event_id_idx"),
+            # Streams each appointment's events in order when rebuilding the projection.
+            models.Index(fields=["appointment_id", "occurred_at"], name="content_appt_stream_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.event_type} ({self.event_id})"
+
+
+class AppointmentEventKey(models.Model):
+    """One row per consumed event_id; kept when its event is archived or its partition dropped."""
+
+    event_id = models.CharField(max_length=100, unique=True)
+    # AppointmentEvent.id; not a foreign key, since partitioned MySQL tables cannot be referenced.
+    event_pk = models.BigIntegerField()
+
+    def __str__(self) -> str:
+        return self.event_id
+
+
+class Appointment(models.Model):
+    """Latest state of one appointment, projected from its AppointmentEvent log."""
+
+    appointment_id = models.CharField(max_length=100, unique=True)
+    status = models.CharField(max_length=100)
+    user_id = models.CharField(max_length=100, blank=True)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    duration_minutes = models.PositiveIntegerField(default=0)
+    email = models.EmailField(blank=True)
+    phone_e164 = models.CharField(max_length=30, blank=True)
+    notify_email = models.BooleanField(default=False)
+    notify_sms = models.BooleanField(default=False)
+    event_count = models.PositiveIntegerField(default=0)
+    first_occurred_at = models.DateTimeField()
+    last_event_id = models.CharField(max_length=100)
+    last_occurred_at = models.DateTimeField()
+    # Kafka offset of the last applied event (-1 when unknown); breaks occurred_at ties.
+    last_offset = models.BigIntegerField(default=-1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-last_occurred_at", "-id"]
+        indexes = [
+            models.Index(fields=["last_occurred_at", "id"], name="content_appt_state_recent_idx"),
+            # Overlap queries range-scan start_time (bounded by the longest appointment) and check end_time.
+            models.Index(fields=["start_time", "end_time"], name="content_appt_state_start_idx"),
+            models.Index(fields=["end_time"], name="content_appt_state_end_idx"),
+            # The iCalendar feed's marker is the newest updated_at.
+            models.Index(fields=["updated_at"], name="content_appt_state_updated_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.appointment_id} ({self.status})"
+
+
+class AppointmentDurationBound(models.Model):
+    """Single row holding the longest appointment duration ever projected; it only grows."""
+
+    longest = models.DurationField(default=timedelta(0))
+
+    def __str__(self) -> str:
+        return str(self.longest)
+
+
+class AppointmentEventArchive(models.Model):
+    first_occurred_at = models.DateTimeField()
+    last_occurred_at = models.DateTimeField()
+    event_count = models.PositiveIntegerField(default=0)
+    data = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["first_occurred_at", "id"]
+
+    def __str__(self) -> str:
+        return f"{self.event_count} events ({self.first_occurred_at:%Y-%m-%d} - {self.last_occurred_at:%Y-%m-%d})"
+
+
+class SearchToken(models.Model):
+    """Inverted index row: one token found in one searchable object, with its summed field weight."""
+
+    kind = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    token = models.CharField(max_length=64)
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id", "token"], name="content_search_token_uniq"),
+        ]
+        indexes = [models.Index(fields=["token", "kind", "object_id", "weight"], name="content_search_lookup_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.token} -> {self.kind}:{self.object_id}"
+
+
+class ChangeLog(models.Model):
+    """Latest change to one admin-editable row; the id is the delta-sync cursor.
+
+    Each write replaces the row's previous entry, so the table holds one entry
+    per changed object plus a tombstone (deleted=True) per deleted one.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    deleted = models.BooleanField(default=False)
+    changed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=["kind", "object_id"], name="content_change_log_object_uniq")]
+        indexes = [models.Index(fields=["kind", "id"], name="content_change_log_cursor_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.id}: {self.kind}:{self.object_id}{' (deleted)' if self.deleted else ''}"
+
+
+class ContentVersion(models.Model):
+    """Single row counting content edits, shared by every process that writes or serves content."""
+
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return str(self.version)
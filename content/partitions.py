@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Min, Subquery
+from django.utils import timezone
+
+from .models import AppointmentEvent, SearchToken
+
+PARTITION_COLUMN = "occurred_at"
+# Catch-all partition above the newest month; it stays empty while ensure_future_partitions() runs ahead.
+MAX_PARTITION = "pmax"
+DEFAULT_MONTHS_AHEAD = 3
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    # First day of the month after the partition; None for the MAXVALUE partition.
+    less_than: date | None
+    rows: int = 0
+
+
+def partitioning_supported(using: str = DEFAULT_DB_ALIAS) -> bool:
+    return connections[using].vendor == "mysql"
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _table(using: str) -> str:
+    return connections[using].ops.quote_name(AppointmentEvent._meta.db_table)
+
+
+def _definitions(months: list[date]) -> str:
+    """PARTITION clauses for each month, followed by the catch-all partition."""
+    clauses = [
+        f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d} 00:00:00')"
+        for month in months
+    ]
+    clauses.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ", ".join(clauses)
+
+
+def _months_between(first: date, last: date) -> list[date]:
+    months = []
+    month = first
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+    return months
+
+
+def _parse_bound(description: str | None) -> date | None:
+    if not description or description == "MAXVALUE":
+        return None
+    return date.fromisoformat(description.strip("'")[:10])
+
+
+def list_partitions(using: str = DEFAULT_DB_ALIAS) -> list[Partition]:
+    """The table's partitions in range order; empty when it is not partitioned (or not on MySQL)."""
+    if not partitioning_supported(using):
+        return []
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION",
+            [AppointmentEvent._meta.db_table],
+        )
+        return [Partition(name, _parse_bound(description), rows or 0) for name, description, rows in cursor.fetchall()]
+
+
+def _key_statements(using: str) -> list[str]:
+    """MySQL requires every unique key of a partitioned table to include the partitioning column.
+
+    The primary key becomes (id, occurred_at) and any other unique key is
+    dropped; event ids are deduplicated in the unpartitioned AppointmentEventKey
+    table instead, so a redelivery is caught whatever its occurred_at.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, AppointmentEvent._meta.db_table)
+    statements = ["DROP PRIMARY KEY", f"ADD PRIMARY KEY (id, {PARTITION_COLUMN})"]
+    for name, constraint in constraints.items():
+        if constraint["unique"] and not constraint["primary_key"] and PARTITION_COLUMN not in constraint["columns"]:
+            statements.append(f"DROP INDEX {connection.ops.quote_name(name)}")
+    return statements
+
+
+def partition_table(months_ahead: int = DEFAULT_MONTHS_AHEAD, using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Partition the table by occurred_at month, from its oldest event to months_ahead past today.
+
+    Rebuilds the table once; returns the partitions created, or [] when the
+    table is already partitioned or the database is not MySQL.
+    """
+    if not partitioning_supported(using) or list_partitions(using):
+        return []
+    current = month_start(timezone.now())
+    oldest = AppointmentEvent.objects.using(using).aggregate(oldest=Min(PARTITION_COLUMN))["oldest"]
+    months = _months_between(
+        min(month_start(oldest), current) if oldest else current, add_months(current, months_ahead)
+    )
+    table = _table(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table} {', '.join(_key_statements(using))}")
+        cursor.execute(f"ALTER TABLE {table} PARTITION BY RANGE COLUMNS({PARTITION_COLUMN}) ({_definitions(months)})")
+    return [partition_name(month) for month in months]
+
+
+def ensure_future_partitions(months_ahead: int = DEFAULT_MONTHS_AHEAD, using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Split new monthly partitions off the (empty) catch-all so the next months_ahead months exist."""
+    bounds = [partition.less_than for partition in list_partitions(using) if partition.less_than]
+    if not bounds:
+        return []
+    months = _months_between(max(bounds), add_months(month_start(timezone.now()), months_ahead))
+    if not months:
+        return []
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"ALTER TABLE {_table(using)} REORGANIZE PARTITION {MAX_PARTITION} INTO ({_definitions(months)})"
+        )
+    return [partition_name(month) for month in months]
+
+
+def expired_partitions(cutoff: datetime, using: str = DEFAULT_DB_ALIAS) -> list[Partition]:
+    """Monthly partitions whose every row is older than cutoff; the newest month is never included."""
+    bounds = [partition for partition in list_partitions(using) if partition.less_than]
+    return [partition for partition in bounds[:-1] if partition.less_than <= cutoff.date()]
+
+
+def drop_partition(partition: Partition, archive_table: str | None = None, using: str = DEFAULT_DB_ALIAS) -> None:
+    """Remove one partition's rows without a row-by-row DELETE.
+
+    With archive_table, the partition is first swapped (EXCHANGE PARTITION,
+    a metadata-only operation) into a new standalone table of that name, which
+    can be dumped or dropped later.
+    """
+    connection = connections[using]
+    table = _table(using)
+    bound = timezone.make_aware(datetime.combine(partition.less_than, datetime.min.time()), dt_timezone.utc)
+    expired_ids = AppointmentEvent.objects.using(using).filter(**{f"{PARTITION_COLUMN}__lt": bound}).values("id")
+    # Signals do not fire for dropped partitions; drop their search tokens in one statement.
+    SearchToken.objects.using(using).filter(kind="appointment", object_id__in=Subquery(expired_ids)).delete()
+    with connection.cursor() as cursor:
+        if archive_table:
+            archive = connection.ops.quote_name(archive_table)
+            cursor.execute(f"CREATE TABLE {archive} LIKE {table}")
+            cursor.execute(f"ALTER TABLE {archive} REMOVE PARTITIONING")
+            cursor.execute(f"ALTER TABLE {table} EXCHANGE PARTITION {partition.name} WITH TABLE {archive}")
+        cursor.execute(f"ALTER TABLE {table} DROP PARTITION {partition.name}")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+
+
+PAYLOAD_STORAGE_FULL = "full"
+PAYLOAD_STORAGE_NONE = "none"
+PAYLOAD_STORAGE_COMPRESSED = "compressed"
+PAYLOAD_STORAGE_DIFF = "diff"
+PAYLOAD_STORAGE_MODES = (
+    PAYLOAD_STORAGE_FULL,
+    PAYLOAD_STORAGE_NONE,
+    PAYLOAD_STORAGE_COMPRESSED,
+    PAYLOAD_STORAGE_DIFF,
+)
+
+ENCODING_JSON = "json"
+ENCODING_NONE = "none"
+ENCODING_ZLIB = "zlib"
+ENCODING_DIFF = "diff"
+
+_MODE_ENCODINGS = {
+    PAYLOAD_STORAGE_FULL: ENCODING_JSON,
+    PAYLOAD_STORAGE_NONE: ENCODING_NONE,
+    PAYLOAD_STORAGE_COMPRESSED: ENCODING_ZLIB,
+    PAYLOAD_STORAGE_DIFF: ENCODING_DIFF,
+}
+
+_COLUMN_FIELDS = (
+    "event_id",
+    "event_type",
+    "occurred_at",
+    "appointment_id",
+    "user_id",
+    "start_time",
+    "end_time",
+    "duration_minutes",
+    "email",
+    "phone_e164",
+    "notify_email",
+    "notify_sms",
+)
+
+# Marks keys that the canonical payload has but the original message did not.
+ABSENT_KEYS = "$absent"
+
+
+def get_payload_storage_mode() -> str:
+    mode = getattr(settings, "APPOINTMENT_PAYLOAD_STORAGE", PAYLOAD_STORAGE_FULL)
+    if mode not in PAYLOAD_STORAGE_MODES:
+        raise ValueError(f"Unknown APPOINTMENT_PAYLOAD_STORAGE mode: {mode!r}")
+    return mode
+
+
+def compress_json(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def decompress_json(data: bytes) -> Any:
+    return json.loads(zlib.decompress(bytes(data)).decode("utf-8"))
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def canonical_payload(columns: dict[str, Any]) -> dict[str, Any]:
+    """Rebuild the message shape the consumer extracts columns from."""
+    return {
+        "event_id": columns["event_id"],
+        "event_type": columns["event_type"],
+        "occurred_at": _iso(columns["occurred_at"]),
+        "appointment": {
+            "appointment_id": columns["appointment_id"],
+            "user_id": columns["user_id"],
+            "start_time": _iso(columns["start_time"]),
+            "end_time": _iso(columns["end_time"]),
+            "duration_minutes": columns["duration_minutes"],
+            "email": columns["email"],
+            "phone_e164": columns["phone_e164"],
+        },
+        "notify": {
+            "email": columns["notify_email"],
+            "sms": columns["notify_sms"],
+        },
+    }
+
+
+def diff_payload(original: dict[str, Any], canonical: dict[str, Any]) -> dict[str, Any]:
+    delta: dict[str, Any] = {}
+    for key, value in original.items():
+        base = canonical.get(key)
+        if isinstance(value, dict) and isinstance(base, dict):
+            nested = diff_payload(value, base)
+            if nested:
+                delta[key] = nested
+        elif key not in canonical or type(value) is not type(base) or value != base:
+            delta[key] = value
+    absent = [key for key in canonical if key not in original]
+    if absent:
+        delta[ABSENT_KEYS] = absent
+    return delta
+
+
+def apply_payload_diff(canonical: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    result = dict(canonical)
+    for key in delta.get(ABSENT_KEYS, []):
+        result.pop(key, None)
+    for key, value in delta.items():
+        if key == ABSENT_KEYS:
+            continue
+        base = result.get(key)
+        if isinstance(value, dict) and isinstance(base, dict):
+            result[key] = apply_payload_diff(base, value)
+        else:
+            result[key] = value
+    return result
+
+
+def encode_payload(payload: dict[str, Any], columns: dict[str, Any], mode: str | None = None) -> dict[str, Any]:
+    """Return the payload column values to store for an event in the given mode."""
+    mode = mode or get_payload_storage_mode()
+    encoding = _MODE_ENCODINGS[mode]
+    if encoding == ENCODING_NONE:
+        return {"payload": None, "payload_blob": None, "payload_encoding": encoding}
+    if encoding == ENCODING_ZLIB:
+        return {"payload": None, "payload_blob": compress_json(payload), "payload_encoding": encoding}
+    if encoding == ENCODING_DIFF:
+        delta = diff_payload(payload, canonical_payload(columns))
+        return {"payload": delta, "payload_blob": None, "payload_encoding": encoding}
+    return {"payload": payload, "payload_blob": None, "payload_encoding": encoding}
+
+
+def decode_payload(event) -> dict[str, Any] | None:
+    """Return the original message for a stored event, or None if it was not kept."""
+    encoding = event.payload_encoding
+    if encoding == ENCODING_NONE:
+        return None
+    if encoding == ENCODING_ZLIB:
+        return decompress_json(event.payload_blob) if event.payload_blob is not None else None
+    if encoding == ENCODING_DIFF:
+        columns = {field: getattr(event, field) for field in _COLUMN_FIELDS}
+        return apply_payload_diff(canonical_payload(columns), event.payload or {})
+    return event.payload
+
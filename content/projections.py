@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .calendar import note_change, widen_longest, widen_longest_from_projection
+from .keyset import iter_keyset
+from .models import Appointment, AppointmentEvent
+
+# Event columns copied onto the projection as-is.
+STATE_FIELDS = (
+    "user_id",
+    "start_time",
+    "end_time",
+    "duration_minutes",
+    "email",
+    "phone_e164",
+    "notify_email",
+    "notify_sms",
+)
+EVENT_COLUMNS = ("appointment_id", "event_id", "event_type", "occurred_at", "kafka_offset", *STATE_FIELDS)
+
+
+def _state(values: dict) -> dict:
+    state = {field: values[field] for field in STATE_FIELDS}
+    state.update(
+        status=values["event_type"],
+        last_event_id=values["event_id"],
+        last_occurred_at=values["occurred_at"],
+        last_offset=-1 if values["kafka_offset"] is None else values["kafka_offset"],
+        updated_at=timezone.now(),
+    )
+    return state
+
+
+def _applies_over(state: dict) -> Q:
+    """Projection rows the event is not older than, by (occurred_at, offset)."""
+    return Q(last_occurred_at__lt=state["last_occurred_at"]) | Q(
+        last_occurred_at=state["last_occurred_at"], last_offset__lte=state["last_offset"]
+    )
+
+
+def apply_event(event: AppointmentEvent, new: bool = True) -> None:
+    """Upsert the appointment's projection row with one stored event.
+
+    Events can arrive out of order; an event older than the row's last applied
+    one only counts towards event_count. Pass new=False for a redelivered event
+    so it is not counted twice. Usually a single guarded UPDATE; the row lock it
+    takes is what makes it wait for a rebuild holding the same row.
+    """
+    state = _state({column: getattr(event, column) for column in EVENT_COLUMNS})
+    widen_longest(event.end_time - event.start_time)
+    transaction.on_commit(lambda: note_change(event.start_time, event.end_time))
+    rows = Appointment.objects.filter(appointment_id=event.appointment_id)
+    counted = {"event_count": F("event_count") + 1} if new else {}
+    if rows.filter(_applies_over(state)).update(**state, **counted):
+        return
+    try:
+        with transaction.atomic():
+            Appointment.objects.create(
+                appointment_id=event.appointment_id,
+                event_count=1,
+                first_occurred_at=event.occurred_at,
+                **state,
+            )
+        return
+    except IntegrityError:
+        pass
+    # The row exists and already reflects a later event (or was created concurrently).
+    if not rows.filter(_applies_over(state)).update(**state, **counted) and counted:
+        # event_count is rendered (as the iCalendar SEQUENCE), so the row counts as changed.
+        rows.update(**counted, updated_at=state["updated_at"])
+    rows.filter(first_occurred_at__gt=event.occurred_at).update(first_occurred_at=event.occurred_at)
+
+
+# Projection columns a rebuild recomputes.
+REBUILT_FIELDS = (
+    *STATE_FIELDS,
+    "status",
+    "last_event_id",
+    "last_occurred_at",
+    "last_offset",
+    "updated_at",
+    "event_count",
+    "first_occurred_at",
+)
+
+
+def _rebuild_chunk(appointment_ids: list[str]) -> int:
+    """Recompute the rows of appointment_ids in place while holding their row locks.
+
+    The consumer stores an event and applies it in one transaction, so an
+    event this read misses is still uncommitted; its apply_event() waits on
+    the locked (or newly inserted) row and is applied on top of the rebuild.
+
+    History is archived (or its partition dropped) oldest first. When a row's
+    first_occurred_at predates every remaining event, that row keeps its
+    first_occurred_at and never lowers its event_count, so iCalendar SEQUENCE
+    numbers do not go backwards.
+    """
+    with transaction.atomic():
+        existing = {
+            row.appointment_id: row
+            for row in Appointment.objects.select_for_update().filter(appointment_id__in=appointment_ids)
+        }
+        events = (
+            AppointmentEvent.objects.filter(appointment_id__in=appointment_ids)
+            .order_by("appointment_id", "occurred_at", "kafka_offset", "id")
+            .values(*EVENT_COLUMNS)
+        )
+        rows: dict[str, Appointment] = {}
+        # (first_occurred_at, event_count) of existing rows whose oldest events are gone.
+        archived: dict[str, tuple] = {}
+        for values in events:
+            row = rows.get(values["appointment_id"])
+            if row is None:
+                row = existing.get(values["appointment_id"]) or Appointment(appointment_id=values["appointment_id"])
+                if row.pk and row.first_occurred_at < values["occurred_at"]:
+                    archived[row.appointment_id] = (row.first_occurred_at, row.event_count)
+                row.first_occurred_at = values["occurred_at"]
+                row.event_count = 0
+                rows[row.appointment_id] = row
+            for field, value in _state(values).items():
+                setattr(row, field, value)
+            row.event_count += 1
+        for appointment_id, (first_occurred_at, event_count) in archived.items():
+            row = rows[appointment_id]
+            row.first_occurred_at = first_occurred_at
+            row.event_count = max(row.event_count, event_count)
+        Appointment.objects.bulk_update([row for row in rows.values() if row.pk], REBUILT_FIELDS)
+        Appointment.objects.bulk_create([row for row in rows.values() if not row.pk])
+    return len(rows)
+
+
+def rebuild_projection(chunk_size: int = 1000) -> int:
+    """Recompute every projection row from the event log, chunk_size appointments per transaction.
+
+    Appointment ids are paged by key, and each chunk's rows are updated in place
+    under row locks, so the consumer can keep running. Rows of appointments
+    whose events have all been archived are left as they are.
+    """
+    appointment_ids = (
+        appointment_id
+        for appointment_id, in iter_keyset(
+            AppointmentEvent.objects.distinct(), ("appointment_id",), order=("appointment_id",), chunk_size=chunk_size
+        )
+    )
+    rebuilt = 0
+    while chunk := list(islice(appointment_ids, chunk_size)):
+        try:
+            rebuilt += _rebuild_chunk(chunk)
+        except IntegrityError:
+            # The consumer created one of the rows after the lock was taken; the retry locks it too.
+            rebuilt += _rebuild_chunk(chunk)
+    widen_longest_from_projection()
+    note_change()
+    return rebuilt
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+from django.db import connections, transaction
+
+from .cache import bump_content_version
+from .changes import record_changes
+
+logger = logging.getLogger(__name__)
+
+# Ranks are strings over these digits, compared lexicographically. Lowercase
+# digits and letters sort the same way in Python and in case-insensitive
+# database collations. A rank never ends in the lowest digit, so there is
+# always room for a key below it.
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+# Repeated insertions at one spot lengthen keys; past this length the model is rebalanced in the background.
+REBALANCE_LENGTH = 8
+
+
+class RankError(ValueError):
+    pass
+
+
+def rank_between(low: str | None, high: str | None) -> str:
+    """A key strictly between low and high; None leaves that side open ("" is the lowest key)."""
+    low = low or ""
+    if high is not None and low >= high:
+        raise RankError(f"No rank fits between {low!r} and {high!r}.")
+    digits = []
+    index = 0
+    while True:
+        lo = DIGITS.index(low[index]) if index < len(low) else 0
+        hi = DIGITS.index(high[index]) if high is not None and index < len(high) else BASE
+        if hi - lo > 1:
+            digits.append(DIGITS[(lo + hi) // 2])
+            return "".join(digits)
+        digits.append(DIGITS[lo])
+        if hi - lo == 1:
+            # This prefix is already below high; the remaining digits are unbounded above.
+            high = None
+        index += 1
+
+
+def evenly_spaced(count: int) -> list[str]:
+    """count increasing keys spread over the key space, as short as possible."""
+    width = 1
+    while BASE**width <= count:
+        width += 1
+    step = BASE**width // (count + 1)
+    keys = []
+    for position in range(1, count + 1):
+        value = step * position
+        key = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            key.append(DIGITS[digit])
+        keys.append("".join(reversed(key)).rstrip(DIGITS[0]))
+    return keys
+
+
+def _max_length(model) -> int:
+    return model._meta.get_field("rank").max_length
+
+
+def rank_for_order(model, order: int, exclude_pk: int | None = None) -> str:
+    """Rank placing a row after every row whose order is <= order, for rows created or renumbered by order."""
+    others = model.objects.exclude(pk=exclude_pk) if exclude_pk is not None else model.objects.all()
+    low = others.filter(order__lte=order).exclude(rank="").order_by("-rank").values_list("rank", flat=True).first()
+    high = others.filter(rank__gt=low or "").order_by("rank").values_list("rank", flat=True).first()
+    return rank_between(low, high)
+
+
+def rerank(model, order_by: tuple[str, ...] = ("rank", "id")) -> int:
+    """Rewrite every row's rank with evenly spaced keys, keeping order_by's order."""
+    with transaction.atomic():
+        ids = list(model.objects.select_for_update().order_by(*order_by).values_list("pk", flat=True))
+        rows = [model(pk=pk, rank=rank) for pk, rank in zip(ids, evenly_spaced(len(ids)))]
+        model.objects.bulk_update(rows, ["rank"], batch_size=500)
+        # bulk_update() skips signals; every row's rank changed for delta-syncing clients.
+        record_changes(model, ids)
+    bump_content_version()
+    return len(rows)
+
+
+_rebalancing: set[type] = set()
+_rebalancing_lock = threading.Lock()
+
+
+def schedule_rebalance(model) -> None:
+    """Rebalance model's ranks in a background thread, once at a time per model."""
+    with _rebalancing_lock:
+        if model in _rebalancing:
+            return
+        _rebalancing.add(model)
+
+    def run():
+        try:
+            rerank(model)
+        except Exception:
+            logger.exception("Rebalancing %s ranks failed.", model.__name__)
+        finally:
+            with _rebalancing_lock:
+                _rebalancing.discard(model)
+            connections.close_all()
+
+    threading.Thread(target=run, name=f"rank-rebalance:{model.__name__}", daemon=True).start()
+
+
+def _neighbours(model, pk: int, before: int | None, after: int | None) -> tuple[str | None, str | None]:
+    others = model.objects.exclude(pk=pk).order_by("rank", "pk")
+    if before is not None:
+        anchor = others.values_list("rank", flat=True).get(pk=before)
+        return others.filter(rank__lt=anchor).order_by("-rank").values_list("rank", flat=True).first(), anchor
+    if after is not None:
+        anchor = others.values_list("rank", flat=True).get(pk=after)
+        return anchor, others.filter(rank__gt=anchor).values_list("rank", flat=True).first()
+    raise RankError("Either before or after is required.")
+
+
+def move(instance, before: int | None = None, after: int | None = None) -> str:
+    """Place instance directly before or after another row of its model with a single row update.
+
+    Raises model.DoesNotExist when the anchor row is missing.
+    """
+    model = type(instance)
+    for attempt in range(2):
+        low, high = _neighbours(model, instance.pk, before, after)
+        try:
+            rank = rank_between(low, high)
+        except RankError:
+            rank = None
+        if rank is not None and len(rank) <= _max_length(model):
+            break
+        if attempt:
+            raise RankError(f"Could not place {model.__name__} {instance.pk}.")
+        # Duplicate or exhausted keys around the anchor: renumber now, then place again.
+        rerank(model)
+    instance.rank = rank
+    instance.save(update_fields=["rank"])
+    if len(rank) > REBALANCE_LENGTH:
+        transaction.on_commit(lambda: schedule_rebalance(model))
+    return rank
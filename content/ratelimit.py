@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .encoding import json_response
+
+# Scopes and the settings holding their quotas.
+LOGIN_IP = "login-ip"
+LOGIN_USER = "login-user"
+PUBLIC = "public"
+SCOPE_SETTINGS = {
+    LOGIN_IP: "RATE_LIMIT_LOGIN_IP",
+    LOGIN_USER: "RATE_LIMIT_LOGIN_USER",
+    PUBLIC: "RATE_LIMIT_PUBLIC",
+}
+# Buckets kept per scope (on average) before the least recently used is evicted.
+MAX_LOCAL_KEYS = 10000
+
+
+class QuotaError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Quota:
+    limit: int
+    period: float
+
+    @classmethod
+    def parse(cls, value: str) -> Quota | None:
+        """Parse "20/60" (20 requests per 60 seconds); an empty value means no limit."""
+        value = (value or "").strip()
+        if not value:
+            return None
+        limit, _, period = value.partition("/")
+        try:
+            quota = cls(int(limit), float(period or 1))
+        except ValueError:
+            raise QuotaError(f"Invalid rate limit {value!r}; expected <requests>/<seconds>.") from None
+        if quota.limit < 1 or quota.period <= 0:
+            raise QuotaError(f"Invalid rate limit {value!r}; expected <requests>/<seconds>.")
+        return quota
+
+
+def quota_for(scope: str) -> Quota | None:
+    return Quota.parse(getattr(settings, SCOPE_SETTINGS[scope], ""))
+
+
+class LocalBuckets:
+    """Token buckets in this process's memory: no I/O, so rejecting costs microseconds.
+
+    At most MAX_LOCAL_KEYS * len(SCOPE_SETTINGS) buckets are kept; past that
+    the least recently used one is evicted, in O(1).
+    """
+
+    name = "local"
+
+    def __init__(self):
+        self._buckets: OrderedDict[tuple[str, str], tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, scope: str, key: str, quota: Quota) -> float:
+        """Take one token; returns 0 when allowed, else the seconds until a token is available."""
+        now = time.monotonic()
+        rate = quota.limit / quota.period
+        with self._lock:
+            tokens, updated = self._buckets.pop((scope, key), (quota.limit, now))
+            tokens = min(quota.limit, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            self._buckets[(scope, key)] = (tokens - 1 if allowed else tokens, now)
+            if len(self._buckets) > MAX_LOCAL_KEYS * len(SCOPE_SETTINGS):
+                self._buckets.popitem(last=False)
+            return 0.0 if allowed else (1 - tokens) / rate
+
+    def key_count(self, scope: str) -> int | None:
+        with self._lock:
+            return sum(1 for bucket_scope, _ in self._buckets if bucket_scope == scope)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBuckets:
+    """Sliding-window counters in the shared cache (Redis), so limits hold across workers.
+
+    The count is the current fixed window plus the previous one weighted by
+    how much of it still overlaps the sliding window: two cache round trips.
+    """
+
+    name = "cache"
+
+    def _key(self, scope: str, key: str, window: int) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return f"ratelimit:{scope}:{digest}:{window}"
+
+    def take(self, scope: str, key: str, quota: Quota) -> float:
+        now = time.time()
+        window, elapsed = divmod(now, quota.period)
+        current_key = self._key(scope, key, int(window))
+        previous_key = self._key(scope, key, int(window) - 1)
+        cache.add(current_key, 0, timeout=int(quota.period * 2) + 1)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Expired between add() and incr().
+            cache.set(current_key, 1, timeout=int(quota.period * 2) + 1)
+            current = 1
+        previous = cache.get(previous_key, 0)
+        weight = 1 - elapsed / quota.period
+        if previous * weight + current <= quota.limit:
+            return 0.0
+        if previous and current <= quota.limit:
+            # Wait until enough of the previous window has slid out.
+            return max((previous * weight + current - quota.limit) / previous * quota.period, 0.001)
+        return quota.period - elapsed
+
+    def key_count(self, scope: str) -> int | None:
+        return None
+
+    def reset(self) -> None:
+        pass
+
+
+BACKENDS = {"local": LocalBuckets, "cache": CacheBuckets}
+
+_backend: LocalBuckets | CacheBuckets | None = None
+_counters: dict[str, dict[str, int]] = {}
+_counters_lock = threading.Lock()
+
+
+def get_backend() -> LocalBuckets | CacheBuckets:
+    global _backend
+    name = getattr(settings, "RATE_LIMIT_BACKEND", "local")
+    if _backend is None or _backend.name != name:
+        _backend = BACKENDS[name]()
+    return _backend
+
+
+def _count(scope: str, outcome: str) -> None:
+    with _counters_lock:
+        counters = _counters.setdefault(scope, {"allowed": 0, "rejected": 0})
+        counters[outcome] += 1
+
+
+def check(scope: str, key: str) -> float:
+    """Count one request for key against scope's quota.
+
+    Returns 0 when it may proceed, else the seconds to wait (for Retry-After).
+    """
+    quota = quota_for(scope)
+    if quota is None:
+        return 0.0
+    retry_after = get_backend().take(scope, key, quota)
+    _count(scope, "rejected" if retry_after else "allowed")
+    return retry_after
+
+
+def too_many_requests(retry_after: float) -> HttpResponse:
+    response = json_response({"errors": ["Too many requests. Try again later."]}, status=429)
+    response["Retry-After"] = str(max(math.ceil(retry_after), 1))
+    return response
+
+
+def client_ip(request) -> str:
+    """The client address, skipping RATE_LIMIT_PROXY_COUNT trusted proxies in X-Forwarded-For."""
+    proxies = getattr(settings, "RATE_LIMIT_PROXY_COUNT", 0)
+    if proxies > 0:
+        hops = [hop.strip() for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if hop.strip()]
+        if len(hops) >= proxies:
+            return hops[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def snapshot() -> dict:
+    """This process's counters per scope, with the configured quotas."""
+    backend = get_backend()
+    with _counters_lock:
+        counters = {scope: dict(values) for scope, values in _counters.items()}
+    scopes = {}
+    for scope in SCOPE_SETTINGS:
+        quota = quota_for(scope)
+        scopes[scope] = {
+            "limit": quota.limit if quota else None,
+            "period": quota.period if quota else None,
+            **counters.get(scope, {"allowed": 0, "rejected": 0}),
+            "trackedKeys": backend.key_count(scope),
+        }
+    return {"backend": backend.name, "scopes": scopes}
+
+
+def reset() -> None:
+    """Forget every bucket and counter in this process."""
+    get_backend().reset()
+    with _counters_lock:
+        _counters.clear()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .keyset import iter_keyset
+from .models import AppointmentEvent, Page, Project, SearchToken
+from .serializers import ADMIN_APPOINTMENT, ADMIN_PAGE, ADMIN_PROJECT, Serializer
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+MAX_TOKEN_LENGTH = 64
+MAX_QUERY_TERMS = 8
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """A searchable model: the columns that feed the index, their weights and the result serializer."""
+
+    model: type
+    serializer: Serializer
+    weights: tuple[tuple[str, int], ...]
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(column for column, _ in self.weights)
+
+
+SEARCH_SOURCES: dict[str, SearchSource] = {
+    "project": SearchSource(Project, ADMIN_PROJECT, (("title", 3), ("tags", 2), ("slug", 2), ("description", 1))),
+    "page": SearchSource(Page, ADMIN_PAGE, (("title", 3), ("slug", 2), ("body", 1))),
+    "appointment": SearchSource(
+        AppointmentEvent,
+        ADMIN_APPOINTMENT,
+        (("email", 3), ("appointment_id", 3), ("event_type", 1)),
+    ),
+}
+SOURCE_KINDS = {source.model: kind for kind, source in SEARCH_SOURCES.items()}
+
+
+def tokenize(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        value = " ".join(str(item) for item in value)
+    return [token[:MAX_TOKEN_LENGTH] for token in TOKEN_PATTERN.findall(str(value).lower())]
+
+
+def _weighted_tokens(source: SearchSource, values: Iterable[Any]) -> Counter:
+    weights: Counter = Counter()
+    for (_, weight), value in zip(source.weights, values):
+        for token in tokenize(value):
+            weights[token] += weight
+    return weights
+
+
+def _token_rows(kind: str, object_id: int, weights: Counter) -> list[SearchToken]:
+    return [SearchToken(kind=kind, object_id=object_id, token=token, weight=weight) for token, weight in weights.items()]
+
+
+_state = threading.local()
+
+
+@contextmanager
+def suspend_indexing() -> Iterator[None]:
+    """Skip per-instance signal indexing, for bulk jobs that maintain the index themselves."""
+    previous = getattr(_state, "suspended", False)
+    _state.suspended = True
+    try:
+        yield
+    finally:
+        _state.suspended = previous
+
+
+def indexing_suspended() -> bool:
+    return getattr(_state, "suspended", False)
+
+
+def index_instance(instance) -> None:
+    """Replace the index entries for one saved instance."""
+    kind = SOURCE_KINDS[type(instance)]
+    source = SEARCH_SOURCES[kind]
+    weights = _weighted_tokens(source, (getattr(instance, column) for column in source.columns))
+    with transaction.atomic():
+        SearchToken.objects.filter(kind=kind, object_id=instance.pk).delete()
+        SearchToken.objects.bulk_create(_token_rows(kind, instance.pk, weights))
+
+
+def unindex_instance(instance) -> None:
+    unindex_ids(SOURCE_KINDS[type(instance)], [instance.pk])
+
+
+def unindex_ids(kind: str, ids: Iterable[int]) -> None:
+    SearchToken.objects.filter(kind=kind, object_id__in=list(ids)).delete()
+
+
+def rebuild_index(kind: str, chunk_size: int = 2000) -> int:
+    """Rebuild one source's entries from scratch, reading the rows in primary-key chunks."""
+    source = SEARCH_SOURCES[kind]
+    rows = iter_keyset(source.model.objects.all(), ("pk", *source.columns), order=("pk",), chunk_size=chunk_size)
+    indexed = 0
+    with transaction.atomic():
+        SearchToken.objects.filter(kind=kind).delete()
+        batch: list[SearchToken] = []
+        for pk, *values in rows:
+            batch.extend(_token_rows(kind, pk, _weighted_tokens(source, values)))
+            indexed += 1
+            if len(batch) >= chunk_size:
+                SearchToken.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SearchToken.objects.bulk_create(batch)
+    return indexed
+
+
+def search(query: str, kinds: Iterable[str] | None = None, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> dict:
+    """Rank objects that contain every query term by their summed field weights.
+
+    Only the requested page of matches is loaded, one values_list() query per
+    result type.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    kinds = list(kinds or SEARCH_SOURCES)
+    page = max(page, 1)
+    page_size = min(max(page_size, 1), MAX_PAGE_SIZE)
+    if not terms:
+        return {"page": page, "pageSize": page_size, "total": 0, "results": []}
+
+    matches = (
+        SearchToken.objects.filter(token__in=terms, kind__in=kinds)
+        .values("kind", "object_id")
+        .annotate(score=Sum("weight"), hits=Count("token"))
+        .filter(hits=len(terms))
+    )
+    total = matches.count()
+    offset = (page - 1) * page_size
+    ranked = list(matches.order_by("-score", "-object_id")[offset : offset + page_size])
+
+    ids_by_kind: dict[str, list[int]] = {}
+    for match in ranked:
+        ids_by_kind.setdefault(match["kind"], []).append(match["object_id"])
+    items: dict[tuple[str, int], dict] = {}
+    for kind, ids in ids_by_kind.items():
+        source = SEARCH_SOURCES[kind]
+        for row in source.serializer.serialize_rows(source.model.objects.filter(pk__in=ids)):
+            items[(kind, row["id"])] = row
+
+    results = [
+        {"type": match["kind"], "id": match["object_id"], "score": match["score"], "item": items[key]}
+        for match in ranked
+        if (key := (match["kind"], match["object_id"])) in items
+    ]
+    return {"page": page, "pageSize": page_size, "total": total, "results": results}
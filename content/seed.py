@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.text import slugify
+
+from .models import ContactLink, Project, Skill, SocialLink, Stat
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DATA_PATH = REPO_ROOT / "content" / "data" / "portfolio-content.json"
+OPS_REPO_NAMES = ("ntakemori-deploy", "ntakemori-deployment")
+OPS_SEED_FILENAME = "portfolio-content.json"
+
+SITE_NAME_KEY = "site.name"
+DISPLAY_NAME_KEY = "site.display_name"
+CONTACT_EMAIL_KEY = "site.contact_email"
+
+
+class SeedValidationError(ValueError):
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+# Section -> (item fields, required fields, unique key, model the values end up in).
+# Each field maps to the accepted JSON type(s).
+SEED_SCHEMA: dict[str, tuple[dict[str, tuple[type, ...]], tuple[str, ...], str, Any]] = {
+    "projects": (
+        {
+            "slug": (str,),
+            "title": (str,),
+            "description": (str,),
+            "tags": (list,),
+            "link": (str,),
+            "github": (str,),
+        },
+        ("title",),
+        "slug",
+        Project,
+    ),
+    "stats": (
+        {"number": (str,), "label": (str,), "icon": (str,)},
+        ("number", "label"),
+        "label",
+        Stat,
+    ),
+    "socialLinks": (
+        {"name": (str,), "url": (str,), "icon": (str,)},
+        ("name", "url"),
+        "name",
+        SocialLink,
+    ),
+    "contactLinks": (
+        {"icon": (str,), "title": (str,), "description": (str,), "href": (str,)},
+        ("title", "href"),
+        "title",
+        ContactLink,
+    ),
+}
+SITE_FIELDS = ("name", "displayName", "contactEmail")
+
+
+def resolve_seed_path() -> Path:
+    env_path = os.getenv("BFF_SEED_DATA_PATH")
+    if env_path:
+        candidate = Path(env_path).expanduser()
+        if candidate.is_file():
+            return candidate
+
+    bases = [REPO_ROOT.parent.parent, REPO_ROOT.parent]
+    for base in bases:
+        for repo_name in OPS_REPO_NAMES:
+            candidate = base / repo_name / OPS_SEED_FILENAME
+            if candidate.is_file():
+                return candidate
+
+    return DATA_PATH
+
+
+def load_seed_data(path: Path) -> dict[str, Any]:
+    """Read and validate a seed file, raising SeedValidationError on schema problems."""
+    with path.open("r", encoding="utf-8") as handle:
+        try:
+            data = json.load(handle)
+        except json.JSONDecodeError as exc:
+            raise SeedValidationError([f"Invalid JSON: {exc}"]) from exc
+    errors = validate_seed_data(data)
+    if errors:
+        raise SeedValidationError(errors)
+    return data
+
+
+def _max_length(model, field_name: str) -> int | None:
+    try:
+        return model._meta.get_field(field_name).max_length
+    except FieldDoesNotExist:
+        return None
+
+
+def validate_seed_data(data: Any) -> list[str]:
+    if not isinstance(data, dict):
+        return ["Seed data must be a JSON object."]
+
+    errors: list[str] = []
+    site = data.get("site", {})
+    if not isinstance(site, dict):
+        errors.append("site must be an object.")
+    else:
+        for key in SITE_FIELDS:
+            if key in site and not isinstance(site[key], str):
+                errors.append(f"site.{key} must be a string.")
+
+    skills = data.get("skills", [])
+    if not isinstance(skills, list):
+        errors.append("skills must be a list.")
+    else:
+        max_length = Skill._meta.get_field("name").max_length
+        for index, name in enumerate(skills):
+            if not isinstance(name, str) or not name.strip():
+                errors.append(f"skills[{index}] must be a non-empty string.")
+            elif len(name) > max_length:
+                errors.append(f"skills[{index}] is longer than {max_length} characters.")
+        if all(isinstance(name, str) for name in skills) and len(set(skills)) != len(skills):
+            errors.append("skills must not contain duplicates.")
+
+    for section, (fields, required, unique_key, model) in SEED_SCHEMA.items():
+        items = data.get(section, [])
+        if not isinstance(items, list):
+            errors.append(f"{section} must be a list.")
+            continue
+        seen: set[Any] = set()
+        for index, item in enumerate(items):
+            prefix = f"{section}[{index}]"
+            if not isinstance(item, dict):
+                errors.append(f"{prefix} must be an object.")
+                continue
+            for key in required:
+                if not str(item.get(key, "") or "").strip():
+                    errors.append(f"{prefix}.{key} is required.")
+            for key, value in item.items():
+                if key not in fields:
+                    errors.append(f"{prefix}.{key} is not a known field.")
+                    continue
+                if not isinstance(value, fields[key]) or isinstance(value, bool):
+                    errors.append(f"{prefix}.{key} has the wrong type.")
+                    continue
+                max_length = _max_length(model, key) if isinstance(value, str) else None
+                if max_length and len(value) > max_length:
+                    errors.append(f"{prefix}.{key} is longer than {max_length} characters.")
+            if section == "projects":
+                tags = item.get("tags", [])
+                if isinstance(tags, list) and not all(isinstance(tag, str) for tag in tags):
+                    errors.append(f"{prefix}.tags must be a list of strings.")
+                slug = item.get("slug")
+                if isinstance(slug, str) and slug and slugify(slug) != slug:
+                    errors.append(f"{prefix}.slug is not a valid slug.")
+            key_value = _unique_value(section, item, unique_key)
+            if key_value in seen:
+                errors.append(f"{prefix}.{unique_key} duplicates an earlier entry.")
+            seen.add(key_value)
+
+    return errors
+
+
+def _unique_value(section: str, item: dict[str, Any], unique_key: str) -> Any:
+    if section == "projects":
+        return item.get("slug") or slugify(str(item.get("title", "")))
+    return item.get(unique_key)
+
+
+def seed_rows(data: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Map the seed JSON onto model field values, keyed by section."""
+    site = data.get("site", {})
+    site_rows = [
+        {"key": SITE_NAME_KEY, "value": site.get("name", "Portfolio")},
+        {"key": DISPLAY_NAME_KEY, "value": site.get("displayName", "Your Name")},
+        {"key": CONTACT_EMAIL_KEY, "value": site.get("contactEmail", "hello@example.com")},
+    ]
+    project_rows = [
+        {
+            "slug": project.get("slug") or slugify(project.get("title", "")),
+            "title": project.get("title", ""),
+            "description": project.get("description", ""),
+            "tags": project.get("tags", []),
+            "link": project.get("link", ""),
+            "github": project.get("github", ""),
+            "is_published": True,
+            "order": index,
+        }
+        for index, project in enumerate(data.get("projects", []))
+    ]
+    stat_rows = [
+        {
+            "label": stat.get("label", ""),
+            "number": stat.get("number", ""),
+            "icon": stat.get("icon", ""),
+            "order": index,
+        }
+        for index, stat in enumerate(data.get("stats", []))
+    ]
+    skill_rows = [{"name": name, "order": index} for index, name in enumerate(data.get("skills", []))]
+    social_rows = [
+        {
+            "name": link.get("name", ""),
+            "url": link.get("url", ""),
+            "icon": link.get("icon", ""),
+            "order": index,
+        }
+        for index, link in enumerate(data.get("socialLinks", []))
+    ]
+    contact_rows = [
+        {
+            "title": link.get("title", ""),
+            "icon": link.get("icon", ""),
+            "description": link.get("description", ""),
+            "href": link.get("href", ""),
+            "order": index,
+        }
+        for index, link in enumerate(data.get("contactLinks", []))
+    ]
+    return {
+        "site": site_rows,
+        "projects": project_rows,
+        "stats": stat_rows,
+        "skills": skill_rows,
+        "socialLinks": social_rows,
+        "contactLinks": contact_rows,
+    }
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import (
+    Appointment,
+    AppointmentEvent,
+    ContactLink,
+    Page,
+    Project,
+    SiteSetting,
+    Skill,
+    SocialLink,
+    Stat,
+)
+
+
+FIELDS_PARAM = "fields"
+
+
+class FieldSelectionError(ValueError):
+    pass
+
+
+def _list_or_empty(value: Any) -> list:
+    return value or []
+
+
+@dataclass(frozen=True)
+class Serializer:
+    """Maps model columns to response keys once, for both instances and value rows.
+
+    List endpoints go through serialize_rows(), which selects only the mapped
+    columns with values_list() and never builds model instances.
+    """
+
+    model: type
+    fields: tuple[tuple[str, str], ...]
+    transforms: dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return tuple(key for key, _ in self.fields)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(column for _, column in self.fields)
+
+    def extend(self, *fields: tuple[str, str], **transforms: Callable[[Any], Any]) -> Serializer:
+        return Serializer(self.model, self.fields + fields, {**self.transforms, **transforms})
+
+    def select(self, keys: Iterable[str]) -> Serializer:
+        """Restrict to the requested response keys, keeping the declared order."""
+        requested = {key.strip() for key in keys if key.strip()}
+        unknown = sorted(requested - set(self.keys))
+        if unknown:
+            raise FieldSelectionError(
+                f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(self.keys)}."
+            )
+        if not requested or len(requested) == len(self.fields):
+            return self
+        return Serializer(
+            self.model,
+            tuple(item for item in self.fields if item[0] in requested),
+            {key: value for key, value in self.transforms.items() if key in requested},
+        )
+
+    def from_request(self, request) -> Serializer:
+        """Apply a sparse fieldset from ?fields=a,b,c, raising FieldSelectionError on unknown keys."""
+        raw = request.GET.get(FIELDS_PARAM)
+        if raw is None:
+            return self
+        return self.select(raw.split(","))
+
+    def serialize(self, obj) -> dict[str, Any]:
+        transforms = self.transforms
+        result = {}
+        for key, column in self.fields:
+            value = getattr(obj, column)
+            result[key] = transforms[key](value) if key in transforms else value
+        return result
+
+    def serialize_rows(self, queryset) -> list[dict[str, Any]]:
+        keys = self.keys
+        transforms = [(index, self.transforms[key]) for index, key in enumerate(keys) if key in self.transforms]
+        rows = queryset.values_list(*self.columns)
+        if not transforms:
+            return [dict(zip(keys, row)) for row in rows]
+        serialized = []
+        for row in rows:
+            values = list(row)
+            for index, transform in transforms:
+                values[index] = transform(values[index])
+            serialized.append(dict(zip(keys, values)))
+        return serialized
+
+
+PUBLIC_PROJECT = Serializer(
+    Project,
+    (
+        ("id", "id"),
+        ("slug", "slug"),
+        ("title", "title"),
+        ("description", "description"),
+        ("tags", "tags"),
+        ("link", "link"),
+        ("github", "github"),
+    ),
+    {"tags": _list_or_empty},
+)
+PUBLIC_STAT = Serializer(Stat, (("number", "number"), ("label", "label"), ("icon", "icon")))
+PUBLIC_SOCIAL_LINK = Serializer(SocialLink, (("name", "name"), ("url", "url"), ("icon", "icon")))
+PUBLIC_CONTACT_LINK = Serializer(
+    ContactLink,
+    (("icon", "icon"), ("title", "title"), ("description", "description"), ("href", "href")),
+)
+
+# Static content mode has no database ids to match; bundled projects are identified by slug.
+BUNDLED_PROJECT = Serializer(Project, tuple(item for item in PUBLIC_PROJECT.fields if item[0] != "id"))
+ADMIN_PROJECT = PUBLIC_PROJECT.extend(
+    ("isPublished", "is_published"),
+    ("order", "order"),
+    ("rank", "rank"),
+    ("createdAt", "created_at"),
+    ("updatedAt", "updated_at"),
+)
+# rank is the sort key; clients applying ?since= deltas re-sort by it.
+_ORDERING = (("order", "order"), ("rank", "rank"))
+ADMIN_STAT = Serializer(Stat, (("id", "id"),) + PUBLIC_STAT.fields + _ORDERING)
+ADMIN_SKILL = Serializer(Skill, (("id", "id"), ("name", "name")) + _ORDERING)
+ADMIN_SOCIAL_LINK = Serializer(SocialLink, (("id", "id"),) + PUBLIC_SOCIAL_LINK.fields + _ORDERING)
+ADMIN_CONTACT_LINK = Serializer(ContactLink, (("id", "id"),) + PUBLIC_CONTACT_LINK.fields + _ORDERING)
+ADMIN_PAGE = Serializer(
+    Page,
+    (
+        ("id", "id"),
+        ("slug", "slug"),
+        ("title", "title"),
+        ("body", "body"),
+        ("isPublished", "is_published"),
+        ("createdAt", "created_at"),
+        ("updatedAt", "updated_at"),
+    ),
+)
+ADMIN_SITE_SETTING = Serializer(SiteSetting, (("id", "id"), ("key", "key"), ("value", "value")))
+# Never selects the payload columns; the admin list has no use for them.
+ADMIN_APPOINTMENT = Serializer(
+    AppointmentEvent,
+    (
+        ("id", "id"),
+        ("eventId", "event_id"),
+        ("eventType", "event_type"),
+        ("occurredAt", "occurred_at"),
+        ("appointmentId", "appointment_id"),
+        ("userId", "user_id"),
+        ("startTime", "start_time"),
+        ("endTime", "end_time"),
+        ("durationMinutes", "duration_minutes"),
+        ("email", "email"),
+        ("phoneE164", "phone_e164"),
+        ("notifyEmail", "notify_email"),
+        ("notifySms", "notify_sms"),
+        ("kafkaTopic", "kafka_topic"),
+        ("kafkaPartition", "kafka_partition"),
+        ("kafkaOffset", "kafka_offset"),
+        ("receivedAt", "received_at"),
+    ),
+)
+ADMIN_APPOINTMENT_STATE = Serializer(
+    Appointment,
+    (
+        ("id", "id"),
+        ("appointmentId", "appointment_id"),
+        ("status", "status"),
+        ("userId", "user_id"),
+        ("startTime", "start_time"),
+        ("endTime", "end_time"),
+        ("durationMinutes", "duration_minutes"),
+        ("email", "email"),
+        ("phoneE164", "phone_e164"),
+        ("notifyEmail", "notify_email"),
+        ("notifySms", "notify_sms"),
+        ("eventCount", "event_count"),
+        ("firstOccurredAt", "first_occurred_at"),
+        ("lastEventId", "last_event_id"),
+        ("lastOccurredAt", "last_occurred_at"),
+    ),
+)
+
+SERIALIZERS: dict[tuple[str, str], Serializer] = {
+    ("public", "project"): PUBLIC_PROJECT,
+    ("public", "stat"): PUBLIC_STAT,
+    ("public", "social-link"): PUBLIC_SOCIAL_LINK,
+    ("public", "contact-link"): PUBLIC_CONTACT_LINK,
+    ("admin", "project"): ADMIN_PROJECT,
+    ("admin", "stat"): ADMIN_STAT,
+    ("admin", "skill"): ADMIN_SKILL,
+    ("admin", "social-link"): ADMIN_SOCIAL_LINK,
+    ("admin", "contact-link"): ADMIN_CONTACT_LINK,
+    ("admin", "page"): ADMIN_PAGE,
+    ("admin", "site-setting"): ADMIN_SITE_SETTING,
+    ("admin", "appointment"): ADMIN_APPOINTMENT,
+    ("admin", "appointment-state"): ADMIN_APPOINTMENT_STATE,
+}
+
+
+def get_serializer(scope: str, name: str) -> Serializer:
+    return SERIALIZERS[(scope, name)]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.auth.signals import user_logged_out
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+
+from .auth_cache import forget_session_user, invalidate_user
+from .cache import bump_content_version
+from .changes import record_changes
+from .models import ContactLink, Page, Project, SiteSetting, Skill, SocialLink, Stat
+from .ranking import rank_for_order
+from .search import SEARCH_SOURCES, SOURCE_KINDS, index_instance, indexing_suspended, unindex_instance
+from .tags import sync_project_tags
+
+# Models whose rows feed the cached public payloads.
+CONTENT_MODELS = (Page, SiteSetting, Project, Stat, Skill, SocialLink, ContactLink)
+# Models sorted by a rank key (content.ranking).
+RANKED_MODELS = (Project, Stat, Skill, SocialLink, ContactLink)
+
+
+def _content_changed(sender, **kwargs) -> None:
+    bump_content_version()
+
+
+def _change_saved(sender, instance, **kwargs) -> None:
+    record_changes(sender, [instance.pk])
+
+
+def _change_deleted(sender, instance, **kwargs) -> None:
+    record_changes(sender, [instance.pk], deleted=True)
+
+
+def _ranked_adding(sender, instance, **kwargs) -> None:
+    if instance._state.adding and not instance.rank:
+        instance.rank = rank_for_order(sender, instance.order)
+
+
+def _searchable_saved(sender, instance, update_fields=None, **kwargs) -> None:
+    if indexing_suspended():
+        return
+    # Saves of unindexed columns only (e.g. a reorder) leave the tokens as they are.
+    if update_fields is not None and not set(update_fields) & set(SEARCH_SOURCES[SOURCE_KINDS[sender]].columns):
+        return
+    index_instance(instance)
+
+
+def _searchable_deleted(sender, instance, **kwargs) -> None:
+    if not indexing_suspended():
+        unindex_instance(instance)
+
+
+def _project_saved(sender, instance, update_fields=None, **kwargs) -> None:
+    if update_fields is None or "tags" in update_fields:
+        sync_project_tags(instance)
+
+
+def _user_changed(sender, instance, **kwargs) -> None:
+    invalidate_user(instance.pk)
+
+
+def _user_relations_changed(sender, instance, action, reverse, model, pk_set, **kwargs) -> None:
+    if reverse and action == "pre_clear":
+        # Changed from the group or permission side; clear() sends no pk_set.
+        pk_set = instance.user_set.values_list("pk", flat=True)
+    elif not action.startswith("post_") or (reverse and action == "post_clear"):
+        return
+    if not reverse:
+        invalidate_user(instance.pk)
+    else:
+        for user_id in pk_set or ():
+            invalidate_user(user_id)
+
+
+def _group_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs) -> None:
+    if not action.startswith("post_"):
+        return
+    groups = [instance] if not reverse else Group.objects.filter(pk__in=pk_set or ())
+    for user_id in get_user_model().objects.filter(groups__in=groups).values_list("pk", flat=True).distinct():
+        invalidate_user(user_id)
+
+
+def _user_logged_out(sender, request, user, **kwargs) -> None:
+    forget_session_user(request)
+
+
+def connect_signals() -> None:
+    for model in CONTENT_MODELS:
+        post_save.connect(_content_changed, sender=model, dispatch_uid=f"content-version-save-{model.__name__}")
+        post_delete.connect(_content_changed, sender=model, dispatch_uid=f"content-version-delete-{model.__name__}")
+        post_save.connect(_change_saved, sender=model, dispatch_uid=f"change-log-save-{model.__name__}")
+        post_delete.connect(_change_deleted, sender=model, dispatch_uid=f"change-log-delete-{model.__name__}")
+
+    for model in SOURCE_KINDS:
+        post_save.connect(_searchable_saved, sender=model, dispatch_uid=f"search-index-save-{model.__name__}")
+        post_delete.connect(_searchable_deleted, sender=model, dispatch_uid=f"search-index-delete-{model.__name__}")
+    post_save.connect(_project_saved, sender=Project, dispatch_uid="tag-index-project-save")
+    for model in RANKED_MODELS:
+        pre_save.connect(_ranked_adding, sender=model, dispatch_uid=f"rank-new-{model.__name__}")
+
+    user_model = get_user_model()
+    post_save.connect(_user_changed, sender=user_model, dispatch_uid="auth-cache-user-save")
+    post_delete.connect(_user_changed, sender=user_model, dispatch_uid="auth-cache-user-delete")
+    m2m_changed.connect(_user_relations_changed, sender=user_model.groups.through, dispatch_uid="auth-cache-user-groups")
+    m2m_changed.connect(
+        _user_relations_changed,
+        sender=user_model.user_permissions.through,
+        dispatch_uid="auth-cache-user-permissions",
+    )
+    m2m_changed.connect(_group_permissions_changed, sender=Group.permissions.through, dispatch_uid="auth-cache-group-perms")
+    user_logged_out.connect(_user_logged_out, dispatch_uid="auth-cache-logout")
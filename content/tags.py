@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils.text import slugify
+
+from .models import Project, ProjectTag, Tag
+
+TAG_PARAM = "tag"
+
+
+def tag_slug(name: str) -> str:
+    return slugify(str(name))
+
+
+def normalize_tags(tags: Iterable[str] | None) -> dict[str, str]:
+    """Map tag slug -> display name, keeping the first spelling of each slug."""
+    normalized: dict[str, str] = {}
+    for name in tags or ():
+        slug = tag_slug(name)
+        if slug and slug not in normalized:
+            normalized[slug] = str(name).strip()
+    return normalized
+
+
+def _tag_ids(names: dict[str, str]) -> dict[str, int]:
+    if not names:
+        return {}
+    Tag.objects.bulk_create([Tag(slug=slug, name=name) for slug, name in names.items()], ignore_conflicts=True)
+    return dict(Tag.objects.filter(slug__in=names).values_list("slug", "id"))
+
+
+def sync_project_tags(project: Project) -> None:
+    """Bring the project's ProjectTag rows in line with its tags list."""
+    desired = _tag_ids(normalize_tags(project.tags))
+    with transaction.atomic():
+        current = dict(ProjectTag.objects.filter(project=project).values_list("tag_id", "id"))
+        stale = [link_id for tag_id, link_id in current.items() if tag_id not in desired.values()]
+        if stale:
+            ProjectTag.objects.filter(id__in=stale).delete()
+        missing = [ProjectTag(project=project, tag_id=tag_id) for tag_id in desired.values() if tag_id not in current]
+        if missing:
+            ProjectTag.objects.bulk_create(missing)
+
+
+def rebuild_tag_index() -> int:
+    """Rebuild every ProjectTag row from Project.tags, for bulk writes that skip signals."""
+    projects = list(Project.objects.order_by().values_list("id", "tags"))
+    names: dict[str, str] = {}
+    for _, tags in projects:
+        for slug, name in normalize_tags(tags).items():
+            names.setdefault(slug, name)
+    with transaction.atomic():
+        tag_ids = _tag_ids(names)
+        ProjectTag.objects.all().delete()
+        links = [
+            ProjectTag(project_id=project_id, tag_id=tag_ids[slug])
+            for project_id, tags in projects
+            for slug in normalize_tags(tags)
+        ]
+        ProjectTag.objects.bulk_create(links)
+    return len(links)
+
+
+def tag_cloud() -> list[dict]:
+    """Published project counts per tag, most used first."""
+    rows = (
+        ProjectTag.objects.filter(project__is_published=True)
+        .values_list("tag__slug", "tag__name")
+        .annotate(count=Count("id"))
+        .order_by("-count", "tag__slug")
+    )
+    return [{"slug": slug, "name": name, "count": count} for slug, name, count in rows]
+
+
+def tag_cloud_from_projects(projects: Iterable[dict]) -> list[dict]:
+    """The same cloud computed from serialized projects, for the content bundle."""
+    counts: Counter = Counter()
+    names: dict[str, str] = {}
+    for project in projects:
+        for slug, name in normalize_tags(project.get("tags")).items():
+            counts[slug] += 1
+            names.setdefault(slug, name)
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [{"slug": slug, "name": names[slug], "count": count} for slug, count in ranked]
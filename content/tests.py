@@ -1,9 +1,128 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import runpy
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-from .models import ContactLink, Project, SiteSetting, Skill, SocialLink, Stat
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import CommandError, call_command
+from django.conf import settings
+from django.db import connection, connections
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
+from .admin_api import SKILLS
+from .management.commands.consume_appointments import Command as ConsumeAppointmentsCommand
+from .models import (
+    Appointment,
+    AppointmentDurationBound,
+    AppointmentEvent,
+    AppointmentEventArchive,
+    AppointmentEventKey,
+    ChangeLog,
+    ContactLink,
+    ContentVersion,
+    Page,
+    Project,
+    ProjectTag,
+    SearchToken,
+    SiteSetting,
+    Skill,
+    SocialLink,
+    Stat,
+)
+from .exports import iter_appointment_rows
+from .partitions import add_months
+from .payload_storage import decode_payload, decompress_json
+from .encoding import ENCODERS, encode_json, get_encoder
+from .db_router import ReplicaRouter
+from .middleware import (
+    PRIMARY_PIN_COOKIE,
+    FastPathAuthenticationMiddleware,
+    FastPathCsrfViewMiddleware,
+    FastPathSessionMiddleware,
+    ReplicaRoutingMiddleware,
+)
+from .search import search
+from .seed import validate_seed_data
+from . import cache as content_cache, calendar, ics, live, partitions, ranking, ratelimit, warmup
+from .cache import get_or_build, get_or_build_entry
+from .compression import cached_json_response
+from .tags import rebuild_tag_index
+from .serializers import ADMIN_PROJECT, PUBLIC_PROJECT
 
-class ContentApiTests(TestCase):
+
+class ContentTestCase(TestCase):
+    """Clears the cache between tests: rolled-back rows reset the content version, so entries an
+    earlier test cached under the same version number would be served again."""
+
+    databases = {"default", *settings.DATABASE_REPLICAS}
+
+    @classmethod
+    def setUpClass(cls):
+        # Replicas (DB_REPLICAS) share the default test connection so they see each test's uncommitted rows.
+        for alias in cls.databases - {"default"}:
+            connections[alias] = connections["default"]
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        for alias in cls.databases - {"default"}:
+            del connections[alias]
+
+    def _pre_setup(self):
+        super()._pre_setup()
+        cache.clear()
+        content_cache.forget_content_version()
+        ratelimit.reset()
+
+
+def _appointment_message(event_id="evt-1", occurred_at="2026-02-16T11:29:00Z", offset=1, **extra):
+    payload = {
+        "event_id": event_id,
+        "event_type": "appointments.created",
+        "occurred_at": occurred_at,
+        "appointment": {
+            "appointment_id": f"appt-{event_id}",
+            "user_id": "user-1",
+            "start_time": "2026-03-01T10:00:00Z",
+            "end_time": "2026-03-01T10:30:00Z",
+            "duration_minutes": 30,
+            "email": "guest@example.com",
+            "phone_e164": "+15555550100",
+        },
+        "notify": {"email": True, "sms": False},
+        **extra,
+    }
+    return SimpleNamespace(
+        value=json.dumps(payload).encode("utf-8"),
+        topic="appointments.created",
+        partition=0,
+        offset=offset,
+    ), payload
+
+
+def _store_appointment(**kwargs):
+    message, payload = _appointment_message(**kwargs)
+    ConsumeAppointmentsCommand(stdout=io.StringIO())._handle_message(message)
+    return AppointmentEvent.objects.get(event_id=payload["event_id"]), payload
+
+
+class ContentApiTests(ContentTestCase):
     def setUp(self):
         SiteSetting.objects.create(key="site.name", value="Portfolio")
         SiteSetting.objects.create(key="site.display_name", value="Nick")
@@ -80,3 +199,1439 @@ class ContentApiTests(TestCase):
     def test_project_detail_not_found(self):
         response = self.client.get("/projects/does-not-exist")
         self.assertEqual(response.status_code, 404)
+
+    def test_project_detail_shares_one_entry_per_slug(self):
+        self.client.get("/projects/Contact-Meeting-Scheduler")
+        with self.assertNumQueries(0):
+            response = self.client.get("/projects/contact-meeting-scheduler")
+        self.assertEqual(response.json()["slug"], self.project.slug)
+
+    def test_project_detail_misses_are_cached_until_the_next_edit(self):
+        self.client.get("/projects/later")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/projects/later").status_code, 404)
+
+        Project.objects.create(slug="later", title="Later", order=2)
+        content_cache.forget_content_version()
+        self.assertEqual(self.client.get("/projects/later").status_code, 200)
+
+    def test_unknown_tags_do_not_get_cache_entries(self):
+        self.client.get("/api/projects", {"tag": "django"})
+        before = set(cache._cache)
+        for tag in ("nope", "also-nope", "Still Nope"):
+            self.assertEqual(self.client.get("/api/projects", {"tag": tag}).json()["projects"], [])
+        self.assertEqual(set(cache._cache), before)
+
+
+class AppointmentPayloadStorageTests(ContentTestCase):
+    def test_full_mode_keeps_payload(self):
+        event, payload = _store_appointment(source="calendar")
+        self.assertEqual(event.payload_encoding, "json")
+        self.assertEqual(decode_payload(event), payload)
+
+    @override_settings(APPOINTMENT_PAYLOAD_STORAGE="none")
+    def test_none_mode_drops_payload(self):
+        event, _ = _store_appointment()
+        self.assertIsNone(event.payload)
+        self.assertIsNone(decode_payload(event))
+        self.assertEqual(event.email, "guest@example.com")
+
+    @override_settings(APPOINTMENT_PAYLOAD_STORAGE="compressed")
+    def test_compressed_mode_round_trips(self):
+        event, payload = _store_appointment(source="calendar")
+        self.assertIsNone(event.payload)
+        self.assertEqual(decode_payload(event), payload)
+
+    @override_settings(APPOINTMENT_PAYLOAD_STORAGE="diff")
+    def test_diff_mode_stores_only_unextracted_fields(self):
+        event, payload = _store_appointment(source="calendar", occurred_at="2026-02-16T11:29:00.123+00:00")
+        self.assertEqual(event.payload["source"], "calendar")
+        self.assertNotIn("appointment", event.payload)
+        self.assertEqual(decode_payload(event), payload)
+
+
+class ArchiveAppointmentsCommandTests(ContentTestCase):
+    def setUp(self):
+        old = (timezone.now() - timedelta(days=120)).isoformat()
+        recent = timezone.now().isoformat()
+        for index in range(3):
+            _store_appointment(event_id=f"old-{index}", occurred_at=old, offset=index)
+        _store_appointment(event_id="recent", occurred_at=recent, offset=10)
+
+    def test_moves_expired_events_into_archive_batches(self):
+        with CaptureQueriesContext(connection) as queries:
+            call_command("archive_appointments", older_than_days=90, batch_size=2, stdout=io.StringIO())
+        deletes = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("DELETE")]
+        # Per batch: one token delete and one event delete, never one per event.
+        self.assertEqual(len(deletes), 4)
+        self.assertFalse(SearchToken.objects.filter(kind="appointment", token="old").exists())
+
+        self.assertEqual(list(AppointmentEvent.objects.values_list("event_id", flat=True)), ["recent"])
+        archives = list(AppointmentEventArchive.objects.all())
+        self.assertEqual([archive.event_count for archive in archives], [2, 1])
+        records = decompress_json(archives[0].data)
+        self.assertEqual(records[0]["payload"]["event_id"], records[0]["event_id"])
+
+    def test_dry_run_keeps_events(self):
+        call_command("archive_appointments", older_than_days=90, dry_run=True, stdout=io.StringIO())
+        self.assertEqual(AppointmentEvent.objects.count(), 4)
+
+
+class AppointmentProjectionTests(ContentTestCase):
+    def _event(self, event_id, occurred_at, offset, event_type="appointments.created", **appointment):
+        message, _ = _appointment_message(
+            event_id=event_id,
+            occurred_at=occurred_at,
+            offset=offset,
+            event_type=event_type,
+            appointment={
+                "appointment_id": "appt-1",
+                "start_time": "2026-03-01T10:00:00Z",
+                "end_time": "2026-03-01T10:30:00Z",
+                **appointment,
+            },
+        )
+        ConsumeAppointmentsCommand(stdout=io.StringIO())._handle_message(message)
+
+    def test_consumer_keeps_latest_state_per_appointment(self):
+        self._event("evt-1", "2026-02-16T11:00:00Z", 1, email="first@example.com")
+        self._event("evt-3", "2026-02-16T13:00:00Z", 3, "appointments.cancelled", email="latest@example.com")
+        # Out of order and redelivered events only count once and never overwrite newer state.
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.updated", email="middle@example.com")
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.updated", email="middle@example.com")
+
+        appointment = Appointment.objects.get()
+        self.assertEqual(appointment.status, "appointments.cancelled")
+        self.assertEqual(appointment.email, "latest@example.com")
+        self.assertEqual(appointment.last_event_id, "evt-3")
+        self.assertEqual(appointment.event_count, 3)
+        self.assertEqual(appointment.first_occurred_at, datetime(2026, 2, 16, 11, tzinfo=dt_timezone.utc))
+
+    def test_rebuild_recomputes_projection_in_chunks(self):
+        self._event("evt-1", "2026-02-16T11:00:00Z", 1)
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.updated", email="new@example.com")
+        _store_appointment(event_id="other", offset=3)
+        Appointment.objects.all().delete()
+
+        call_command("rebuild_appointments", chunk_size=1, stdout=io.StringIO())
+
+        states = {row.appointment_id: row for row in Appointment.objects.all()}
+        self.assertEqual(set(states), {"appt-1", "appt-other"})
+        self.assertEqual(states["appt-1"].status, "appointments.updated")
+        self.assertEqual(states["appt-1"].email, "new@example.com")
+        self.assertEqual(states["appt-1"].event_count, 2)
+
+    def test_rebuild_updates_rows_in_place(self):
+        self._event("evt-1", "2026-02-16T11:00:00Z", 1)
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.updated", email="new@example.com")
+        stale = Appointment.objects.get()
+        Appointment.objects.filter(pk=stale.pk).update(status="stale", email="old@example.com", event_count=7)
+
+        call_command("rebuild_appointments", chunk_size=1, stdout=io.StringIO())
+
+        # The row the consumer may be waiting on is kept, not deleted and re-created.
+        appointment = Appointment.objects.get()
+        self.assertEqual(appointment.pk, stale.pk)
+        self.assertEqual(appointment.status, "appointments.updated")
+        self.assertEqual(appointment.email, "new@example.com")
+        self.assertEqual(appointment.event_count, 2)
+
+    def test_rebuild_keeps_counts_of_archived_history(self):
+        self._event("evt-1", "2026-02-16T11:00:00Z", 1)
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.updated")
+        self._event("evt-3", "2026-02-16T13:00:00Z", 3, "appointments.updated", email="new@example.com")
+        AppointmentEvent.objects.filter(event_id="evt-1").delete()
+
+        call_command("rebuild_appointments", chunk_size=1, stdout=io.StringIO())
+
+        appointment = Appointment.objects.get()
+        self.assertEqual(appointment.email, "new@example.com")
+        self.assertEqual(appointment.event_count, 3)
+        self.assertEqual(appointment.first_occurred_at, datetime(2026, 2, 16, 11, tzinfo=dt_timezone.utc))
+
+    def test_dashboard_reads_one_row_per_appointment(self):
+        self._event("evt-1", "2026-02-16T11:00:00Z", 1)
+        self._event("evt-2", "2026-02-16T12:00:00Z", 2, "appointments.cancelled")
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+        response = self.client.get("/api/admin/appointments/current", {"fields": "appointmentId,status,eventCount"})
+
+        self.assertEqual(
+            response.json()["appointments"],
+            [{"appointmentId": "appt-1", "status": "appointments.cancelled", "eventCount": 2}],
+        )
+
+
+class AppointmentCalendarTests(ContentTestCase):
+    def setUp(self):
+        calendar._hot = None
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        self.day = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    def _book(self, name, start, end, event_type="appointments.created"):
+        message, _ = _appointment_message(
+            event_id=name,
+            event_type=event_type,
+            appointment={"appointment_id": name, "start_time": start.isoformat(), "end_time": end.isoformat()},
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            ConsumeAppointmentsCommand(stdout=io.StringIO())._handle_message(message)
+
+    def _calendar(self, start, end, path="calendar"):
+        response = self.client.get(
+            f"/api/admin/appointments/{path}", {"start": start.isoformat(), "end": end.isoformat()}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_overlapping_appointments_from_hot_index_and_database(self):
+        hour = timedelta(hours=1)
+        self._book("long", self.day - timedelta(days=30), self.day + timedelta(days=30))
+        self._book("a", self.day + 10 * hour, self.day + 11 * hour)
+        self._book("b", self.day + 10.5 * hour, self.day + 12 * hour)
+        self._book("later", self.day + timedelta(days=2), self.day + timedelta(days=2) + hour)
+        self._book("dropped", self.day + 10 * hour, self.day + 11 * hour, "appointments.cancelled")
+
+        start, end = self.day + 9 * hour, self.day + 11 * hour
+        hot = [row["appointmentId"] for row in self._calendar(start, end)["appointments"]]
+        with CaptureQueriesContext(connection) as queries:
+            self._calendar(start, end)
+        self.assertFalse([query for query in queries if "content_appointment" in query["sql"]])
+        with override_settings(APPOINTMENT_HOT_WINDOW_DAYS=0):
+            cold = [row["appointmentId"] for row in self._calendar(start, end)["appointments"]]
+
+        self.assertEqual(hot, ["long", "a", "b"])
+        self.assertEqual(cold, hot)
+
+    def test_longest_bound_expires_after_another_process_books(self):
+        hour = timedelta(hours=1)
+        self._book("a", self.day + 10 * hour, self.day + 11 * hour)
+        self.assertEqual(calendar.longest_appointment(), hour)
+        # The consumer process widens the bound in its own cache only; this process never runs its note_change().
+        message, _ = _appointment_message(
+            event_id="long",
+            appointment={
+                "appointment_id": "long",
+                "start_time": (self.day - timedelta(days=30)).isoformat(),
+                "end_time": (self.day + timedelta(days=30)).isoformat(),
+            },
+        )
+        ConsumeAppointmentsCommand(stdout=io.StringIO())._handle_message(message)
+
+        start, end = self.day + 9 * hour, self.day + 11 * hour
+        self.assertEqual([row["appointmentId"] for row in calendar.query_overlapping(start, end)], ["a"])
+        expired = time.time() + settings.APPOINTMENT_HOT_INDEX_TTL + 1
+        with mock.patch("django.core.cache.backends.locmem.time.time", return_value=expired):
+            rows = calendar.query_overlapping(start, end)
+        self.assertEqual([row["appointmentId"] for row in rows], ["long", "a"])
+
+    def test_hot_index_sees_new_bookings(self):
+        hour = timedelta(hours=1)
+        self._book("a", self.day + 10 * hour, self.day + 11 * hour)
+        self.assertEqual(len(self._calendar(self.day, self.day + 24 * hour)["appointments"]), 1)
+        self._book("b", self.day + 12 * hour, self.day + 13 * hour)
+        self.assertEqual(len(self._calendar(self.day, self.day + 24 * hour)["appointments"]), 2)
+
+    def test_conflict_report_lists_overlapping_pairs(self):
+        hour = timedelta(hours=1)
+        self._book("a", self.day + 10 * hour, self.day + 11 * hour)
+        self._book("b", self.day + 10.5 * hour, self.day + 12 * hour)
+        self._book("c", self.day + 11.5 * hour, self.day + 13 * hour)
+        self._book("d", self.day + 13 * hour, self.day + 14 * hour)
+
+        report = self._calendar(self.day, self.day + 24 * hour, path="conflicts")
+
+        self.assertEqual(report["total"], 2)
+        self.assertEqual([conflict["appointmentIds"] for conflict in report["conflicts"]], [["a", "b"], ["b", "c"]])
+
+    def test_conflicts_are_ordered_by_start_not_by_end(self):
+        hour = timedelta(hours=1)
+        rows = [
+            {"id": 1, "appointmentId": "a", "startTime": self.day + 10 * hour, "endTime": self.day + 14 * hour},
+            {"id": 2, "appointmentId": "b", "startTime": self.day + 11 * hour, "endTime": self.day + 12 * hour},
+            {"id": 3, "appointmentId": "c", "startTime": self.day + 11.5 * hour, "endTime": self.day + 13 * hour},
+        ]
+        pairs = [conflict["appointmentIds"] for conflict in calendar.find_conflicts(reversed(rows))]
+        self.assertEqual(pairs, [["a", "b"], ["a", "c"], ["b", "c"]])
+
+    def test_longest_bound_is_stored_by_writers(self):
+        hour = timedelta(hours=1)
+        self._book("long", self.day, self.day + 5 * hour)
+        cache.delete(calendar.LONGEST_KEY)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(calendar.longest_appointment(), 5 * hour)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("content_appointment\"", queries[0]["sql"])
+        with self.assertNumQueries(0):
+            calendar.widen_longest(hour)
+
+        # A rebuild only widens the bound, so no process caches a value above the stored one.
+        AppointmentDurationBound.objects.update(longest=10 * hour)
+        call_command("rebuild_appointments", stdout=io.StringIO())
+        cache.delete(calendar.LONGEST_KEY)
+        self.assertEqual(calendar.longest_appointment(), 10 * hour)
+
+    def test_rejects_invalid_ranges(self):
+        response = self.client.get("/api/admin/appointments/calendar", {"start": "2026-03-02", "end": "2026-03-01"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get("/api/admin/appointments/calendar", {"start": "soon", "end": "2026-03-01"})
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(APPOINTMENT_FEED_SETTLE_SECONDS=0)
+class AppointmentFeedTests(ContentTestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user("admin", password="pw", is_staff=True)
+        start = timezone.now() + timedelta(days=1)
+        self.appointment = {
+            "appointment_id": "appt-1",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=30)).isoformat(),
+            "email": "guest@example.com",
+        }
+        _store_appointment(event_id="evt-1", appointment=self.appointment)
+
+    def _feed_url(self):
+        self.client.force_login(self.admin)
+        url = self.client.get("/api/admin/appointments/feed-url").json()["url"]
+        self.client.logout()
+        return url
+
+    def test_token_feed_streams_vevents_then_serves_cache_and_304(self):
+        url = self._feed_url()
+
+        response = self.client.get(url)
+        self.assertTrue(response.streaming)
+        body = b"".join(response.streaming_content).decode()
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertIn("UID:appt-1@portfolio-bff\r\n", body)
+        self.assertIn("SUMMARY:Appointment with guest@example.com\r\n", body)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(2):  # token user and newest projection change
+            cached = self.client.get(url)
+        self.assertFalse(cached.streaming)
+        self.assertEqual(cached.content.decode(), body)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        _store_appointment(event_id="evt-2", offset=2)
+        refreshed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertNotEqual(refreshed["ETag"], etag)
+
+    def test_rebuilds_and_late_events_move_the_etag(self):
+        url = self._feed_url()
+        etag = self.client.get(url)["ETag"]
+
+        call_command("rebuild_appointments", stdout=io.StringIO())
+        rebuilt = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(rebuilt.status_code, 200)
+
+        # An older, late event only bumps event_count, which the feed renders as SEQUENCE.
+        _store_appointment(event_id="evt-0", occurred_at="2026-02-01T00:00:00Z", appointment=self.appointment)
+        late = self.client.get(url, HTTP_IF_NONE_MATCH=rebuilt["ETag"])
+        self.assertEqual(late.status_code, 200)
+        self.assertIn("SEQUENCE:1\r\n", b"".join(late.streaming_content).decode())
+
+    def test_unsettled_changes_are_not_cached(self):
+        url = self._feed_url()
+        with self.settings(APPOINTMENT_FEED_SETTLE_SECONDS=60):
+            first = self.client.get(url)
+            b"".join(first.streaming_content)
+            second = self.client.get(url)
+        self.assertFalse(first.has_header("ETag"))
+        self.assertTrue(second.streaming)
+
+    def test_feed_requires_valid_token_or_admin_session(self):
+        url = self._feed_url()
+        self.assertEqual(self.client.get("/api/admin/appointments/feed.ics").status_code, 401)
+        self.assertEqual(self.client.get(url + "0").status_code, 401)
+        self.admin.set_password("changed")
+        self.admin.save()
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+    def test_feed_pages_by_start_time_and_id(self):
+        # Both new appointments start at the same time, so paging between them relies on the id tie-breaker.
+        _store_appointment(event_id="evt-2", offset=2)
+        _store_appointment(event_id="evt-3", offset=3)
+        with self.assertNumQueries(4):  # three full chunks of one, then an empty one
+            body = "".join(ics.iter_feed(datetime(2026, 1, 1, tzinfo=dt_timezone.utc), chunk_size=1))
+        uids = [line for line in body.split("\r\n") if line.startswith("UID:")]
+        self.assertEqual(
+            uids, ["UID:appt-evt-2@portfolio-bff", "UID:appt-evt-3@portfolio-bff", "UID:appt-1@portfolio-bff"]
+        )
+
+    def test_text_escapes_carriage_returns(self):
+        self.assertEqual(ics._escape("a\r\nb\rc;d"), "a\\nb\\nc\\;d")
+
+    def test_long_lines_are_folded(self):
+        self.assertEqual(ics._fold("X" * 80), "X" * 75 + "\r\n " + "X" * 5 + "\r\n")
+
+
+class AppointmentStreamTests(ContentTestCase):
+    def test_one_fetch_per_tick_fans_out_to_every_subscriber(self):
+        fetched = []
+        received = timezone.now() - timedelta(minutes=1)
+
+        def fetch(after, limit):
+            fetched.append(after)
+            return [{"id": after + 1, "receivedAt": received}, {"id": after + 2, "receivedAt": received}]
+
+        hub = live.EventBroadcaster(fetch, autostart=False)
+        first, second = hub.subscribe(cursor=10), hub.subscribe(cursor=10)
+        hub.poll_once()
+        hub.unsubscribe(second)
+        hub.poll_once()
+
+        self.assertEqual(fetched, [10, 12])
+        self.assertEqual(
+            [[row["id"] for row in first.queue.get_nowait()], [row["id"] for row in first.queue.get_nowait()]],
+            [[11, 12], [13, 14]],
+        )
+        self.assertEqual([row["id"] for row in second.queue.get_nowait()], [11, 12])
+        self.assertTrue(second.queue.empty())
+
+    def test_events_committed_below_the_cursor_are_still_delivered(self):
+        received = timezone.now()
+        stored = [{"id": 12, "receivedAt": received}]
+        hub = live.EventBroadcaster(
+            lambda after, limit: sorted((row for row in stored if row["id"] > after), key=lambda row: row["id"]),
+            autostart=False,
+        )
+        subscription = hub.subscribe(cursor=10)
+        hub.poll_once()
+        # A slower transaction commits the lower id after 12 was streamed.
+        stored.append({"id": 11, "receivedAt": received})
+        hub.poll_once()
+        hub.poll_once()
+
+        self.assertEqual([row["id"] for row in subscription.queue.get_nowait()], [12])
+        self.assertEqual([row["id"] for row in subscription.queue.get_nowait()], [11])
+        self.assertTrue(subscription.queue.empty())
+        self.assertEqual(subscription.cursor, 10)
+        with override_settings(APPOINTMENT_STREAM_SETTLE=0):
+            hub.poll_once()
+        self.assertEqual((subscription.cursor, subscription.sent), (12, set()))
+        self.assertTrue(subscription.queue.empty())
+
+    @override_settings(APPOINTMENT_STREAM_HEARTBEAT=0)
+    def test_stream_replays_missed_events_then_pushes_new_ones(self):
+        first, _ = _store_appointment(event_id="evt-1", offset=1)
+        second, _ = _store_appointment(event_id="evt-2", offset=2)
+        hub = live.EventBroadcaster(autostart=False)
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+        with mock.patch.object(live, "broadcaster", hub):
+            response = self.client.get("/api/admin/appointments/stream", HTTP_LAST_EVENT_ID=str(first.id))
+        chunks = iter(response.streaming_content)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertTrue(next(chunks).startswith(b"retry: "))
+        self.assertIn(f"id: {second.id}\nevent: appointment\n".encode(), next(chunks))
+        self.assertEqual(next(chunks), b": keep-alive\n\n")
+
+        hub.poll_once()
+        third, _ = _store_appointment(event_id="evt-3", offset=3)
+        hub.poll_once()
+        frame = next(chunks)
+        self.assertTrue(frame.startswith(f"id: {third.id}\n".encode()))
+        self.assertIn(b'"eventId":"evt-3"', frame)
+        response.close()
+        self.assertFalse(hub.subscribers)
+
+    @override_settings(APPOINTMENT_STREAM_HEARTBEAT=0)
+    def test_stream_resets_clients_that_missed_too_many_events(self):
+        first, _ = _store_appointment(event_id="evt-1", offset=1)
+        _store_appointment(event_id="evt-2", offset=2)
+        _store_appointment(event_id="evt-3", offset=3)
+        hub = live.EventBroadcaster(autostart=False)
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+        with mock.patch.object(live, "broadcaster", hub), mock.patch.object(live, "MAX_REPLAY", 1):
+            response = self.client.get("/api/admin/appointments/stream", HTTP_LAST_EVENT_ID=str(first.id))
+        chunks = iter(response.streaming_content)
+        next(chunks)
+        # Nothing has settled yet, so the client resumes from the start of the log.
+        self.assertEqual(next(chunks), b"id: 0\nevent: reset\ndata: {}\n\n")
+        self.assertEqual(next(chunks), b": keep-alive\n\n")
+        response.close()
+
+    async def test_asgi_stream_awaits_broadcasts(self):
+        received = timezone.now() - timedelta(minutes=1)
+        hub = live.EventBroadcaster(lambda after, limit: [{"id": after + 1, "receivedAt": received}], autostart=False)
+        user = await sync_to_async(get_user_model().objects.create_user)("admin", is_staff=True)
+        await sync_to_async(self.async_client.force_login)(user)
+
+        with mock.patch.object(live, "broadcaster", hub):
+            response = await self.async_client.get("/api/admin/appointments/stream")
+        chunks = response.streaming_content
+        self.assertTrue((await anext(chunks)).startswith(b"retry: "))
+        hub.poll_once()
+        hub.poll_once()
+        self.assertTrue((await anext(chunks)).startswith(b'id: 1\nevent: appointment\ndata: {"id":1,'))
+        await chunks.aclose()
+
+    def test_stream_requires_admin(self):
+        self.assertEqual(self.client.get("/api/admin/appointments/stream").status_code, 401)
+
+
+class AppointmentPartitionTests(ContentTestCase):
+    def test_monthly_partition_clauses_end_with_catch_all(self):
+        months = [date(2026, 11, 1), add_months(date(2026, 11, 1), 1)]
+        self.assertEqual(months[1], date(2026, 12, 1))
+        self.assertEqual(add_months(months[1], 1), date(2027, 1, 1))
+        self.assertEqual(
+            partitions._definitions(months),
+            "PARTITION p202611 VALUES LESS THAN ('2026-12-01 00:00:00'), "
+            "PARTITION p202612 VALUES LESS THAN ('2027-01-01 00:00:00'), "
+            "PARTITION pmax VALUES LESS THAN (MAXVALUE)",
+        )
+
+    def test_expired_partitions_keep_newest_month(self):
+        listed = [
+            partitions.Partition("p202601", date(2026, 2, 1)),
+            partitions.Partition("p202602", date(2026, 3, 1)),
+            partitions.Partition("pmax", None),
+        ]
+        with mock.patch.object(partitions, "list_partitions", return_value=listed):
+            expired = partitions.expired_partitions(datetime(2026, 6, 1, tzinfo=dt_timezone.utc))
+        self.assertEqual([partition.name for partition in expired], ["p202601"])
+
+    @skipUnless(connection.vendor != "mysql", "Checks the no-op on databases without partitioning.")
+    def test_command_is_a_no_op_without_mysql(self):
+        _store_appointment()
+        for action in ("init", "ensure", "prune", "status"):
+            out = io.StringIO()
+            call_command("partition_appointments", action, stdout=out)
+            self.assertIn("nothing to do", out.getvalue())
+        self.assertEqual(AppointmentEvent.objects.count(), 1)
+
+    def test_redeliveries_are_deduplicated_by_event_key(self):
+        _store_appointment(event_id="evt-1", occurred_at="2026-02-16T11:00:00Z", offset=1)
+        # Partitioned tables cannot keep event_id unique; a redelivery with another occurred_at still updates in place.
+        event, _ = _store_appointment(event_id="evt-1", occurred_at="2026-02-16T12:00:00Z", offset=2)
+        self.assertEqual(event.kafka_offset, 2)
+        self.assertEqual(AppointmentEvent.objects.filter(event_id="evt-1").count(), 1)
+        self.assertEqual(AppointmentEventKey.objects.get().event_pk, event.pk)
+        self.assertEqual(Appointment.objects.get().event_count, 1)
+
+        # Keys outlive archived events, so a late redelivery is not stored again.
+        AppointmentEvent.objects.all().delete()
+        message, _ = _appointment_message(event_id="evt-1", offset=3)
+        out = io.StringIO()
+        ConsumeAppointmentsCommand(stdout=out)._handle_message(message)
+        self.assertIn("already archived", out.getvalue())
+        self.assertFalse(AppointmentEvent.objects.exists())
+
+
+
+class AppointmentExportTests(ContentTestCase):
+    def setUp(self):
+        for index in range(3):
+            _store_appointment(event_id=f"evt-{index}", offset=index)
+        self.admin = get_user_model().objects.create_user("admin", is_staff=True)
+
+    def test_export_requires_admin(self):
+        response = self.client.get("/api/admin/appointments/export")
+        self.assertEqual(response.status_code, 401)
+
+    def test_export_streams_csv(self):
+        self.client.force_login(self.admin)
+        response = self.client.get("/api/admin/appointments/export?format=csv")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(lines[0].split(",")[:3], ["id", "eventId", "eventType"])
+        self.assertEqual(len(lines), 4)
+
+    def test_export_streams_gzipped_ndjson(self):
+        self.client.force_login(self.admin)
+        response = self.client.get("/api/admin/appointments/export?format=ndjson&gzip=1")
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        body = gzip.decompress(b"".join(response.streaming_content)).decode("utf-8")
+        records = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([record["eventId"] for record in records], ["evt-0", "evt-1", "evt-2"])
+
+    def test_export_rejects_unknown_format(self):
+        self.client.force_login(self.admin)
+        response = self.client.get("/api/admin/appointments/export?format=xml")
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_command_streams_to_stdout(self):
+        output = io.StringIO()
+        call_command("export_appointments", format="ndjson", stdout=output)
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+
+    def test_export_reads_in_bounded_chunks(self):
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(iter_appointment_rows(chunk_size=2))
+        self.assertEqual([row[1] for row in rows], ["evt-0", "evt-1", "evt-2"])
+        selects = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("SELECT")]
+        self.assertEqual(len(selects), 2)
+        self.assertTrue(all("LIMIT 2" in sql for sql in selects))
+
+
+class SeedPortfolioContentTests(ContentTestCase):
+    seed = {
+        "site": {"name": "Portfolio", "displayName": "Nick", "contactEmail": "hello@example.com"},
+        "projects": [
+            {"slug": "alpha", "title": "Alpha", "description": "First", "tags": ["Django"]},
+            {"slug": "beta", "title": "Beta", "description": "Second", "tags": []},
+        ],
+        "stats": [{"number": "10+", "label": "Projects Built", "icon": "rocket"}],
+        "skills": ["Python", "Django"],
+        "socialLinks": [{"name": "GitHub", "url": "https://github.com", "icon": "github"}],
+        "contactLinks": [{"icon": "email", "title": "Email", "description": "", "href": "mailto:a@b.c"}],
+    }
+
+    def _seed(self, data, **options):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as handle:
+            json.dump(data, handle)
+        self.addCleanup(os.unlink, handle.name)
+        output = io.StringIO()
+        env = {"BFF_SEED_DATA_PATH": handle.name, "BFF_ENV": "production"}
+        with mock.patch.dict(os.environ, env):
+            call_command("seed_portfolio_content", stdout=output, **options)
+        return output.getvalue()
+
+    def test_initial_seed_creates_rows(self):
+        output = self._seed(self.seed)
+        self.assertEqual(list(Project.objects.values_list("slug", flat=True)), ["alpha", "beta"])
+        self.assertEqual(list(Skill.objects.values_list("name", flat=True)), ["Python", "Django"])
+        self.assertIn("projects: 2 created", output)
+
+    def test_reseed_without_changes_is_a_no_op(self):
+        self._seed(self.seed)
+        with CaptureQueriesContext(connection) as queries:
+            output = self._seed(self.seed)
+        statements = [query["sql"].split()[0].upper() for query in queries.captured_queries]
+        self.assertEqual(statements.count("SELECT"), 6)
+        self.assertFalse({"INSERT", "UPDATE", "DELETE"} & set(statements))
+        self.assertIn("nothing changed", output)
+
+    def test_reseed_updates_only_changed_rows(self):
+        self._seed(self.seed)
+        data = json.loads(json.dumps(self.seed))
+        data["projects"][1]["title"] = "Beta v2"
+        output = self._seed(data)
+        self.assertEqual(Project.objects.get(slug="beta").title, "Beta v2")
+        self.assertIn("projects: 0 created, 1 updated, 0 deleted, 1 unchanged", output)
+
+    def test_reseed_keeps_admin_moves_and_places_new_rows_by_order(self):
+        self._seed(self.seed)
+        alpha, beta = Project.objects.get(slug="alpha"), Project.objects.get(slug="beta")
+        ranking.move(beta, before=alpha.pk)
+        data = json.loads(json.dumps(self.seed))
+        data["projects"][0]["title"] = "Alpha v2"
+        data["projects"].append({"slug": "gamma", "title": "Gamma"})
+        self._seed(data)
+        self.assertEqual(list(Project.objects.values_list("slug", flat=True)), ["beta", "alpha", "gamma"])
+
+    def test_duplicate_keys_in_the_database_fail_the_seed(self):
+        self._seed(self.seed)
+        Stat.objects.create(number="5", label="Projects Built", order=1)
+        data = json.loads(json.dumps(self.seed))
+        data["stats"][0]["number"] = "20+"
+        with self.assertRaisesMessage(CommandError, "several rows have label 'Projects Built'"):
+            self._seed(data)
+        self.assertEqual(set(Stat.objects.values_list("number", flat=True)), {"10+", "5"})
+
+    def test_reset_prunes_rows_missing_from_seed(self):
+        self._seed(self.seed)
+        data = json.loads(json.dumps(self.seed))
+        data["projects"] = data["projects"][:1]
+        output = self._seed(data, reset=True)
+        self.assertEqual(list(Project.objects.values_list("slug", flat=True)), ["alpha"])
+        self.assertIn("projects: 0 created, 0 updated, 1 deleted, 1 unchanged", output)
+
+
+class ContentBundleTests(ContentTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.bundle_path = os.path.join(self.tmpdir.name, "content.bundle")
+        call_command("build_content_bundle", output=self.bundle_path, stdout=io.StringIO())
+
+    def test_validate_seed_data_reports_schema_errors(self):
+        errors = validate_seed_data(
+            {
+                "projects": [{"title": "A", "slug": "Not A Slug"}, {"slug": "b"}, {"id": 3, "title": "C"}],
+                "skills": ["Python", "Python"],
+                "stats": "nope",
+            }
+        )
+        self.assertIn("projects[0].slug is not a valid slug.", errors)
+        self.assertIn("projects[1].title is required.", errors)
+        self.assertIn("projects[2].id is not a known field.", errors)
+        self.assertIn("skills must not contain duplicates.", errors)
+        self.assertIn("stats must be a list.", errors)
+
+    def test_shipped_seed_data_is_valid(self):
+        with open(os.path.join(os.path.dirname(__file__), "data", "portfolio-content.json")) as handle:
+            self.assertEqual(validate_seed_data(json.load(handle)), [])
+
+    def test_static_mode_serves_bundle_without_database(self):
+        with self.settings(CONTENT_BUNDLE_PATH=self.bundle_path), self.assertNumQueries(0):
+            content = self.client.get("/api/portfolio-content")
+            projects = self.client.get("/api/projects")
+            by_slug = self.client.get("/projects/grocery-list-app")
+            by_id = self.client.get("/projects/2")
+            missing = self.client.get("/projects/does-not-exist")
+            with_id = self.client.get("/api/projects", {"fields": "id,slug"})
+
+        self.assertEqual(content.status_code, 200)
+        self.assertEqual(content.json()["projects"][0]["slug"], "contact-meeting-scheduler")
+        self.assertEqual(len(projects.json()["projects"]), len(content.json()["projects"]))
+        # Database ids differ from anything a bundle could assign, so static mode serves none.
+        self.assertEqual(by_slug.json()["slug"], "grocery-list-app")
+        self.assertNotIn("id", by_slug.json())
+        self.assertNotIn("id", projects.json()["projects"][0])
+        self.assertEqual((by_id.status_code, missing.status_code, with_id.status_code), (400, 404, 400))
+        self.assertIn("look projects up by slug", by_id.json()["errors"][0])
+        self.assertIn("look projects up by slug", with_id.json()["errors"][0])
+
+    def test_static_mode_serves_tag_index_from_bundle(self):
+        with self.settings(CONTENT_BUNDLE_PATH=self.bundle_path), self.assertNumQueries(0):
+            cloud = self.client.get("/api/tags").json()["tags"]
+            tag = cloud[0]["slug"]
+            tagged = self.client.get("/api/projects", {"tag": tag}).json()["projects"]
+            unknown = self.client.get("/api/projects", {"tag": "no-such-tag"}).json()["projects"]
+        self.assertEqual(len(tagged), cloud[0]["count"])
+        self.assertEqual(unknown, [])
+
+
+def _upper_encoder(data):
+    return json.dumps(data).upper().encode("utf-8")
+
+
+class ResponseEncodingTests(ContentTestCase):
+    sample = {
+        "when": datetime(2026, 2, 16, 11, 29, 0, 123456, tzinfo=dt_timezone.utc),
+        "items": [1, "two", None, True],
+    }
+
+    def test_encoders_render_datetimes_identically(self):
+        outputs = {name: json.loads(encoder(self.sample)) for name, encoder in ENCODERS.items()}
+        for output in outputs.values():
+            self.assertEqual(output["when"], "2026-02-16T11:29:00.123456+00:00")
+            self.assertEqual(output, outputs["stdlib"])
+
+    @override_settings(RESPONSE_JSON_ENCODER="content.tests._upper_encoder")
+    def test_encoder_is_pluggable_by_dotted_path(self):
+        self.assertEqual(encode_json({"a": "b"}), b'{"A": "B"}')
+
+    @override_settings(RESPONSE_JSON_ENCODER="stdlib")
+    def test_views_use_configured_encoder(self):
+        self.assertIs(get_encoder(), ENCODERS["stdlib"])
+        response = self.client.get("/api/projects")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json(), {"projects": []})
+
+    def test_admin_appointments_render_datetimes(self):
+        _store_appointment()
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        appointment = self.client.get("/api/admin/appointments").json()["appointments"][0]
+        self.assertEqual(appointment["startTime"], "2026-03-01T10:00:00+00:00")
+
+
+class SerializerRegistryTests(ContentTestCase):
+    def setUp(self):
+        self.project = Project.objects.create(slug="alpha", title="Alpha", tags=[], order=0)
+
+    def test_row_and_instance_serialization_match(self):
+        rows = ADMIN_PROJECT.serialize_rows(Project.objects.all())
+        self.assertEqual(rows, [ADMIN_PROJECT.serialize(self.project)])
+        self.assertEqual(rows[0]["slug"], "alpha")
+
+    def test_public_fields_are_a_subset_of_admin_fields(self):
+        self.assertEqual(ADMIN_PROJECT.fields[: len(PUBLIC_PROJECT.fields)], PUBLIC_PROJECT.fields)
+
+    def test_admin_appointments_never_select_payload(self):
+        _store_appointment()
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/admin/appointments")
+        self.assertEqual(response.status_code, 200)
+        appointment_sql = [
+            query["sql"] for query in queries.captured_queries if "content_appointmentevent" in query["sql"]
+        ]
+        self.assertEqual(len(appointment_sql), 1)
+        self.assertNotIn("payload", appointment_sql[0])
+
+
+class SparseFieldsetTests(ContentTestCase):
+    def setUp(self):
+        Project.objects.create(slug="alpha", title="Alpha", description="Long text", tags=["Django"], order=0)
+
+    def test_projects_list_returns_only_requested_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/projects?fields=slug,title")
+        self.assertEqual(response.json(), {"projects": [{"slug": "alpha", "title": "Alpha"}]})
+        self.assertNotIn("description", queries.captured_queries[-1]["sql"])
+
+    def test_portfolio_content_applies_fields_to_projects(self):
+        payload = self.client.get("/api/portfolio-content?fields=slug").json()
+        self.assertEqual(payload["projects"], [{"slug": "alpha"}])
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get("/api/projects?fields=slug,secret")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", response.json()["errors"][0])
+
+    def test_admin_lists_accept_fields(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        response = self.client.get("/api/admin/projects?fields=id,slug,isPublished")
+        self.assertEqual(list(response.json()["projects"][0]), ["id", "slug", "isPublished"])
+
+    def test_static_bundle_honours_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle_path = os.path.join(tmpdir, "content.bundle")
+            call_command("build_content_bundle", output=bundle_path, stdout=io.StringIO())
+            with self.settings(CONTENT_BUNDLE_PATH=bundle_path):
+                projects = self.client.get("/api/projects?fields=slug").json()["projects"]
+        self.assertTrue(projects)
+        self.assertEqual(set(projects[0]), {"slug"})
+
+
+class ResponseCompressionTests(ContentTestCase):
+    def setUp(self):
+        for index in range(5):
+            Project.objects.create(slug=f"project-{index}", title=f"Project {index}", description="x" * 200, order=index)
+
+    def test_public_payload_is_gzipped_when_accepted(self):
+        response = self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))["projects"]), 5)
+
+    def test_identity_when_not_accepted(self):
+        response = self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip;q=0")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(len(response.json()["projects"]), 5)
+
+    def test_compressed_variant_is_built_once_per_content_version(self):
+        with mock.patch("content.compression.COMPRESSORS", {"gzip": mock.Mock(return_value=b"z")}) as compressors:
+            self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+            self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+            self.assertEqual(compressors["gzip"].call_count, 1)
+
+            Project.objects.filter(slug="project-0").first().save()
+            self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+            self.assertEqual(compressors["gzip"].call_count, 2)
+
+    def test_edits_invalidate_cached_payload(self):
+        self.client.get("/api/projects")
+        project = Project.objects.get(slug="project-0")
+        project.title = "Renamed"
+        project.save()
+        self.assertEqual(self.client.get("/api/projects").json()["projects"][0]["title"], "Renamed")
+
+    def test_edits_from_other_processes_invalidate_cached_payload(self):
+        self.client.get("/api/projects")
+        # Another process (e.g. the seed command) edits the rows and bumps the shared counter.
+        Project.objects.filter(slug="project-0").update(title="Elsewhere")
+        ContentVersion.objects.update_or_create(pk=1, defaults={"version": 99})
+        self.assertEqual(self.client.get("/api/projects").json()["projects"][0]["title"], "Project 0")
+        with mock.patch.object(content_cache.time, "monotonic", return_value=time.monotonic() + 2):
+            self.assertEqual(self.client.get("/api/projects").json()["projects"][0]["title"], "Elsewhere")
+
+    def test_stale_body_variant_does_not_replace_newer_variant(self):
+        request = RequestFactory().get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+        body = json.dumps({"padding": "x" * 1000}).encode()
+        compressor = mock.Mock(side_effect=gzip.compress)
+        with mock.patch("content.compression.COMPRESSORS", {"gzip": compressor}):
+            newer = cached_json_response(request, "k", lambda: body).content
+            # A request served the previous version's body while another one rebuilds it.
+            with mock.patch("content.compression.get_or_build_entry", return_value=(b"old" * 400, -1)):
+                cached_json_response(request, "k", lambda: body)
+            self.assertEqual(cached_json_response(request, "k", lambda: body).content, newer)
+            self.assertEqual(compressor.call_count, 2)
+
+    def test_edits_replace_the_compressed_variant(self):
+        self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+        Project.objects.filter(slug="project-0").first().save()
+        self.client.get("/api/projects", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(len([key for key in cache._cache if key.endswith(":gzip") or ":gzip:" in key]), 1)
+
+    def test_admin_json_is_compressed_by_middleware(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        response = self.client.get("/api/admin/projects", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))["projects"]), 5)
+
+
+class PublicFastPathMiddlewareTests(ContentTestCase):
+    def _run(self, request):
+        seen = {}
+
+        def view(request):
+            seen["session"] = hasattr(request, "session")
+            seen["user"] = hasattr(request, "user")
+            return HttpResponse("ok")
+
+        handler = FastPathSessionMiddleware(FastPathAuthenticationMiddleware(view))
+        handler(request)
+        return seen
+
+    def test_public_get_skips_session_and_auth(self):
+        seen = self._run(RequestFactory().get("/api/projects"))
+        self.assertEqual(seen, {"session": False, "user": False})
+
+    def test_admin_and_unsafe_requests_keep_full_stack(self):
+        self.assertEqual(self._run(RequestFactory().get("/api/admin/projects")), {"session": True, "user": True})
+        self.assertEqual(self._run(RequestFactory().post("/api/projects")), {"session": True, "user": True})
+
+    def test_csrf_is_not_enforced_on_public_gets_only(self):
+        middleware = FastPathCsrfViewMiddleware(lambda request: HttpResponse())
+        view = lambda request: HttpResponse()  # noqa: E731
+        self.assertIsNone(middleware.process_view(RequestFactory().get("/api/projects"), view, (), {}))
+        rejected = middleware.process_view(RequestFactory().post("/api/admin/projects"), view, (), {})
+        self.assertEqual(rejected.status_code, 403)
+
+    def test_public_response_carries_no_cookie_vary_or_session_cookie(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        response = self.client.get("/api/projects")
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+        self.assertNotIn("sessionid", response.cookies)
+        self.assertEqual(self.client.get("/api/admin/session").json()["authenticated"], True)
+
+
+class SessionSettingsTests(ContentTestCase):
+    def _settings(self, **env):
+        # Empty values unset the variable.
+        with mock.patch.dict(os.environ):
+            for name, value in env.items():
+                if value:
+                    os.environ[name] = value
+                else:
+                    os.environ.pop(name, None)
+            return runpy.run_path(str(Path(settings.BASE_DIR) / "portfolio_bff" / "settings.py"))
+
+    def test_cached_sessions_only_default_on_with_a_shared_cache(self):
+        local = self._settings(REDIS_URL="", SESSION_BACKEND="", ADMIN_USER_CACHE_TIMEOUT="")
+        self.assertEqual(local["SESSION_ENGINE"], "django.contrib.sessions.backends.db")
+        self.assertEqual(local["ADMIN_USER_CACHE_TIMEOUT"], 0)
+        shared = self._settings(REDIS_URL="redis://cache:6379/0", SESSION_BACKEND="", ADMIN_USER_CACHE_TIMEOUT="")
+        self.assertEqual(shared["SESSION_ENGINE"], "django.contrib.sessions.backends.cached_db")
+        self.assertEqual(shared["ADMIN_USER_CACHE_TIMEOUT"], 60)
+
+    def test_rejects_unknown_or_unshared_session_backends(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "Unknown SESSION_BACKEND 'redis'"):
+            self._settings(SESSION_BACKEND="redis")
+        with self.assertRaisesMessage(ImproperlyConfigured, "needs REDIS_URL"):
+            self._settings(REDIS_URL="", SESSION_BACKEND="cache")
+
+
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db", ADMIN_USER_CACHE_TIMEOUT=60)
+class AdminUserCacheTests(ContentTestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user("admin", password="secret", is_staff=True)
+        self.client.force_login(self.admin)
+
+    def test_repeat_admin_calls_skip_session_and_user_queries(self):
+        self.client.get("/api/admin/session")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/admin/session")
+        self.assertEqual(response.json()["user"]["username"], "admin")
+
+    def test_permission_change_invalidates_cached_user(self):
+        self.assertEqual(self.client.get("/api/admin/skills").status_code, 200)
+        self.admin.is_staff = False
+        self.admin.save()
+        self.assertEqual(self.client.get("/api/admin/skills").status_code, 403)
+
+    def test_group_membership_change_invalidates_cached_user(self):
+        self.client.get("/api/admin/session")
+        group = Group.objects.create(name="editors")
+        group.user_set.add(self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get("/api/admin/session")
+        self.assertTrue(any("auth_user" in query["sql"] for query in queries.captured_queries))
+
+    def test_logout_drops_cached_user(self):
+        self.client.get("/api/admin/session")
+        self.client.post("/api/admin/logout")
+        self.assertEqual(self.client.get("/api/admin/session").json(), {"authenticated": False})
+
+
+@override_settings(ADMIN_UI_ORIGINS=["http://admin.test"])
+class AdminCorsTests(ContentTestCase):
+    def test_preflight_is_answered_before_dispatch(self):
+        # The views no longer accept OPTIONS, so a 204 means dispatch never happened.
+        with self.assertNumQueries(0):
+            response = self.client.options(
+                "/api/admin/projects",
+                HTTP_ORIGIN="http://admin.test",
+                HTTP_ACCESS_CONTROL_REQUEST_METHOD="POST",
+            )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response["Access-Control-Allow-Origin"], "http://admin.test")
+        self.assertEqual(response["Access-Control-Max-Age"], "7200")
+        self.assertIn("PATCH", response["Access-Control-Allow-Methods"])
+
+    def test_admin_responses_carry_cors_headers_for_allowed_origin_only(self):
+        response = self.client.get("/api/admin/session", HTTP_ORIGIN="http://admin.test")
+        self.assertEqual(response["Access-Control-Allow-Credentials"], "true")
+        self.assertIn("Origin", response["Vary"])
+        denied = self.client.get("/api/admin/projects", HTTP_ORIGIN="http://evil.test")
+        self.assertEqual(denied.status_code, 401)
+        self.assertFalse(denied.has_header("Access-Control-Allow-Origin"))
+
+    def test_public_routes_are_untouched(self):
+        response = self.client.get("/api/projects", HTTP_ORIGIN="http://admin.test")
+        self.assertFalse(response.has_header("Access-Control-Allow-Origin"))
+
+
+class RateLimitTests(ContentTestCase):
+    def _login(self, username="admin", password="wrong", **extra):
+        return self.client.post(
+            "/api/admin/login",
+            data=json.dumps({"username": username, "password": password}),
+            content_type="application/json",
+            **extra,
+        )
+
+    @override_settings(RATE_LIMIT_LOGIN_USER="2/60", RATE_LIMIT_LOGIN_IP="")
+    def test_login_rejected_per_username_before_authenticating(self):
+        get_user_model().objects.create_user("admin", password="secret", is_staff=True)
+        self.assertEqual(self._login().status_code, 401)
+        self.assertEqual(self._login(username=" Admin ").status_code, 401)
+        with mock.patch("content.admin_api.authenticate") as authenticate, self.assertNumQueries(0):
+            response = self._login(password="secret")
+        authenticate.assert_not_called()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "30")
+        self.assertEqual(self._login(username="other").status_code, 401)
+
+    @override_settings(RATE_LIMIT_LOGIN_IP="1/60", RATE_LIMIT_PROXY_COUNT=1)
+    def test_login_rejected_per_client_ip(self):
+        self.assertEqual(self._login(HTTP_X_FORWARDED_FOR="198.51.100.7").status_code, 401)
+        self.assertEqual(self._login(username="x", HTTP_X_FORWARDED_FOR="198.51.100.7").status_code, 429)
+        self.assertEqual(self._login(HTTP_X_FORWARDED_FOR="198.51.100.8").status_code, 401)
+
+    @override_settings(RATE_LIMIT_PUBLIC="2/1")
+    def test_public_quota_and_counters(self):
+        with mock.patch.object(ratelimit.time, "monotonic", return_value=1000.0):
+            self.assertEqual(self.client.get("/api/tags").status_code, 200)
+            self.assertEqual(self.client.get("/api/projects").status_code, 200)
+            with self.assertNumQueries(0):
+                self.assertEqual(self.client.get("/api/tags").status_code, 429)
+        with mock.patch.object(ratelimit.time, "monotonic", return_value=1000.5):
+            self.assertEqual(self.client.get("/api/tags").status_code, 200)
+
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        report = self.client.get("/api/admin/rate-limits").json()
+        self.assertEqual(report["backend"], "local")
+        self.assertEqual(
+            report["scopes"]["public"], {"limit": 2, "period": 1.0, "allowed": 3, "rejected": 1, "trackedKeys": 1}
+        )
+
+    @override_settings(RATE_LIMIT_PUBLIC="1/60")
+    def test_readiness_probe_is_not_limited(self):
+        self.assertEqual(self.client.get("/api/tags").status_code, 200)
+        self.assertEqual(self.client.get("/api/tags").status_code, 429)
+        for _ in range(3):
+            self.assertEqual(self.client.get("/api/ready").status_code, 200)
+
+    def test_local_buckets_evict_least_recently_used(self):
+        buckets = ratelimit.LocalBuckets()
+        quota = ratelimit.Quota(1, 60)
+        with mock.patch.object(ratelimit, "MAX_LOCAL_KEYS", 1):
+            for address in ("10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.1", "10.0.0.4"):
+                buckets.take(ratelimit.PUBLIC, address, quota)
+        cap = len(ratelimit.SCOPE_SETTINGS)
+        self.assertEqual(len(buckets._buckets), cap)
+        # .1 was used again after .2, so .2 went first; .1 is still out of tokens.
+        self.assertNotIn((ratelimit.PUBLIC, "10.0.0.2"), buckets._buckets)
+        self.assertGreater(buckets.take(ratelimit.PUBLIC, "10.0.0.1", quota), 0)
+
+    @override_settings(RATE_LIMIT_BACKEND="cache")
+    def test_cache_backend_counts_a_sliding_window(self):
+        quota = ratelimit.Quota.parse("3/10")
+        backend = ratelimit.get_backend()
+        with mock.patch.object(ratelimit.time, "time", return_value=1005.0):
+            self.assertEqual([backend.take("test", "k", quota) for _ in range(4)][:3], [0.0, 0.0, 0.0])
+        # Halfway through the next window, half of the previous window's 4 requests still count.
+        with mock.patch.object(ratelimit.time, "time", return_value=1015.0):
+            self.assertEqual(backend.take("test", "k", quota), 0.0)
+            self.assertGreater(backend.take("test", "k", quota), 0)
+        with self.assertRaises(ratelimit.QuotaError):
+            ratelimit.Quota.parse("ten/minute")
+
+
+class AdminResourceTests(ContentTestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+    def _send(self, method, path, payload):
+        return getattr(self.client, method)(path, data=json.dumps(payload), content_type="application/json")
+
+    def test_create_cleans_values_derives_slug_and_validates(self):
+        response = self._send("post", "/api/admin/projects", {"title": "New Thing", "tags": "a, b", "order": "3"})
+        project = response.json()["project"]
+        self.assertEqual((project["slug"], project["tags"], project["order"]), ("new-thing", ["a", "b"], 3))
+        self.assertTrue(project["isPublished"])
+
+        duplicate = self._send("post", "/api/admin/projects", {"title": "New Thing"})
+        self.assertEqual(duplicate.json()["project"]["slug"], "new-thing-1")
+
+        missing = self._send("post", "/api/admin/social-links", {"name": "GitHub"})
+        self.assertEqual(missing.json(), {"errors": ["name and url are required."]})
+        invalid = self._send("post", "/api/admin/skills", {"name": "Go", "order": "first"})
+        self.assertEqual(invalid.json(), {"errors": ["order must be an integer."]})
+
+    def test_update_saves_only_sent_columns(self):
+        stat = Stat.objects.create(number="1", label="One", icon="x", order=0)
+        with CaptureQueriesContext(connection) as queries:
+            response = self._send("patch", f"/api/admin/stats/{stat.id}", {"label": "Uno"})
+        self.assertEqual(response.json()["stat"]["label"], "Uno")
+        update = next(query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE"))
+        self.assertIn('"label"', update)
+        self.assertNotIn('"number"', update)
+
+    def test_detail_read_and_delete(self):
+        skill = Skill.objects.create(name="Python", order=0)
+        with self.assertNumQueries(1):
+            response = SKILLS.retrieve(SimpleNamespace(GET={}), skill.id)
+        self.assertEqual(json.loads(response.content)["skill"]["name"], "Python")
+        self.assertEqual(self.client.delete(f"/api/admin/skills/{skill.id}").json(), {"ok": True})
+        missing = self.client.get(f"/api/admin/skills/{skill.id}")
+        self.assertEqual((missing.status_code, missing.json()), (404, {"errors": ["Skill not found."]}))
+
+
+@override_settings(CHANGE_LOG_SETTLE_SECONDS=0)
+class DeltaSyncTests(ContentTestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+    def test_since_returns_changed_rows_and_tombstones(self):
+        python = Skill.objects.create(name="Python", order=0)
+        rust = Skill.objects.create(name="Rust", order=1)
+        Skill.objects.create(name="Go", order=2)
+        full = self.client.get("/api/admin/skills").json()
+        self.assertEqual(len(full["skills"]), 3)
+
+        self.client.patch(
+            f"/api/admin/skills/{python.id}", data=json.dumps({"order": 5}), content_type="application/json"
+        )
+        self.client.delete(f"/api/admin/skills/{rust.id}")
+        delta = self.client.get("/api/admin/skills", {"since": full["cursor"], "fields": "id,order"}).json()
+
+        self.assertEqual(delta["skills"], [{"id": python.id, "order": 5}])
+        self.assertEqual(delta["deleted"], [rust.id])
+        self.assertGreater(delta["cursor"], full["cursor"])
+        unchanged = self.client.get("/api/admin/skills", {"since": delta["cursor"]}).json()
+        self.assertEqual((unchanged["skills"], unchanged["deleted"]), ([], []))
+
+    @override_settings(CHANGE_LOG_SETTLE_SECONDS=60)
+    def test_cursor_stops_short_of_unsettled_changes(self):
+        python = Skill.objects.create(name="Python", order=0)
+        go = Skill.objects.create(name="Go", order=1)
+        rust = Skill.objects.create(name="Rust", order=2)
+        ChangeLog.objects.filter(object_id=python.id).update(changed_at=timezone.now() - timedelta(minutes=5))
+        # Go's change is still committing; its entry holds an id below Rust's.
+        late = ChangeLog.objects.get(kind="content.skill", object_id=go.id)
+        ChangeLog.objects.filter(pk=late.pk).delete()
+        full = self.client.get("/api/admin/skills").json()
+        self.assertEqual(full["cursor"], ChangeLog.objects.get(object_id=python.id).id)
+
+        late.save()
+        delta = self.client.get("/api/admin/skills", {"since": full["cursor"], "fields": "name"}).json()
+        self.assertLess(late.id, ChangeLog.objects.get(object_id=rust.id).id)
+        self.assertEqual(delta["skills"], [{"id": go.id, "name": "Go"}, {"id": rust.id, "name": "Rust"}])
+
+    def test_change_log_keeps_one_entry_per_object(self):
+        skill = Skill.objects.create(name="Python", order=0)
+        for order in range(3):
+            skill.order = order
+            skill.save()
+        self.assertEqual(ChangeLog.objects.filter(object_id=skill.id, kind="content.skill").count(), 1)
+
+    def test_seed_bulk_writes_are_logged(self):
+        call_command("seed_portfolio_content", stdout=io.StringIO())
+        logged = ChangeLog.objects.filter(kind="content.stat").values_list("object_id", flat=True)
+        self.assertEqual(set(logged), set(Stat.objects.values_list("id", flat=True)))
+        self.assertGreater(self.client.get("/api/admin/stats").json()["cursor"], 0)
+
+    def test_rejects_malformed_cursor(self):
+        self.assertEqual(self.client.get("/api/admin/site-settings", {"since": "yesterday"}).status_code, 400)
+
+
+class RankingTests(ContentTestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+
+    def _names(self):
+        return [skill["name"] for skill in self.client.get("/api/admin/skills").json()["skills"]]
+
+    def test_rank_between_stays_ordered_under_repeated_inserts(self):
+        keys = ranking.evenly_spaced(50)
+        self.assertEqual(keys, sorted(set(keys)))
+        self.assertLessEqual(max(map(len, keys)), 2)
+        low, high = keys[0], keys[1]
+        for _ in range(30):
+            middle = ranking.rank_between(low, high)
+            self.assertTrue(low < middle < high)
+            high = middle
+        self.assertLess(ranking.rank_between(None, "1"), "1")
+        self.assertGreater(ranking.rank_between("zz", None), "zz")
+        with self.assertRaises(ranking.RankError):
+            ranking.rank_between("b", "b")
+
+    def _move(self, pk, **anchor):
+        return self.client.post(f"/api/admin/skills/{pk}/move", data=anchor, content_type="application/json")
+
+    def test_move_updates_a_single_row(self):
+        python, rust, go = (
+            Skill.objects.create(name=name, order=index) for index, name in enumerate(("Py", "Rs", "Go"))
+        )
+        self.assertEqual(self._names(), ["Py", "Rs", "Go"])
+        with CaptureQueriesContext(connection) as queries:
+            response = self._move(go.id, before=python.id)
+        self.assertEqual(response.status_code, 200)
+        updates = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len([sql for sql in updates if '"content_skill"' in sql]), 1)
+        self.assertNotIn('"name"', updates[0])
+        self.assertEqual(self._names(), ["Go", "Py", "Rs"])
+
+        self._move(python.id, after=rust.id)
+        self.assertEqual(self._names(), ["Go", "Rs", "Py"])
+        self.assertEqual(self._move(go.id, before=rust.id, after=python.id).status_code, 400)
+        self.assertEqual(self._move(go.id, after=0).json(), {"errors": ["after skill not found."]})
+
+    def test_order_still_places_rows(self):
+        for index, name in enumerate(("Python", "Rust", "Go")):
+            Skill.objects.create(name=name, order=index * 10)
+        go = Skill.objects.get(name="Go")
+        self.client.patch(f"/api/admin/skills/{go.id}", data={"order": 5}, content_type="application/json")
+        self.assertEqual(self._names(), ["Python", "Go", "Rust"])
+        self.client.post("/api/admin/skills", data={"name": "C", "order": 0}, content_type="application/json")
+        self.assertEqual(self._names(), ["Python", "C", "Go", "Rust"])
+
+    def test_long_ranks_schedule_a_rebalance(self):
+        first = Skill.objects.create(name="First", order=0)
+        second = Skill.objects.create(name="Second", order=1)
+        Skill.objects.filter(pk=first.pk).update(rank="a" * ranking.REBALANCE_LENGTH)
+        Skill.objects.filter(pk=second.pk).update(rank="a" * (ranking.REBALANCE_LENGTH - 1) + "b")
+        third = Skill.objects.create(name="Third", order=2)
+        with mock.patch.object(ranking, "schedule_rebalance") as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                ranking.move(third, after=first.pk)
+        schedule.assert_called_once_with(Skill)
+
+        ranking.rerank(Skill)
+        self.assertEqual(self._names(), ["First", "Third", "Second"])
+        self.assertEqual(sorted(Skill.objects.values_list("rank", flat=True)), ranking.evenly_spaced(3))
+
+
+class AdminSearchTests(ContentTestCase):
+    def setUp(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        self.scheduler = Project.objects.create(
+            slug="scheduler", title="Meeting Scheduler", description="Books calendar slots", tags=["Django"]
+        )
+        Project.objects.create(slug="blog", title="Blog", description="Django calendar notes", tags=[])
+        Page.objects.create(slug="about", title="About", body="I build a scheduler for meetings.")
+
+    def test_ranks_matches_containing_every_term(self):
+        payload = self.client.get("/api/admin/search", {"q": "Calendar Django"}).json()
+        self.assertEqual(payload["total"], 2)
+        # Title and tag hits outweigh description-only hits.
+        self.assertEqual(payload["results"][0]["id"], self.scheduler.id)
+        self.assertEqual(payload["results"][0]["item"]["slug"], "scheduler")
+
+        pages = self.client.get("/api/admin/search", {"q": "scheduler", "type": "page"}).json()
+        self.assertEqual([result["type"] for result in pages["results"]], ["page"])
+
+    def test_index_follows_saves_and_deletes(self):
+        self.scheduler.title = "Booking tool"
+        self.scheduler.save()
+        self.assertEqual(search("meeting", ["project"])["total"], 0)
+        self.assertEqual(search("booking")["results"][0]["id"], self.scheduler.id)
+        self.scheduler.delete()
+        self.assertEqual(search("booking")["total"], 0)
+
+    def test_finds_appointment_by_email_and_paginates(self):
+        for index in range(3):
+            event, _ = _store_appointment(event_id=f"evt-{index}", offset=index)
+            event.email = f"guest{index}@example.com"
+            event.save()
+        result = self.client.get("/api/admin/search", {"q": "guest1@example.com"}).json()
+        self.assertEqual([row["item"]["eventId"] for row in result["results"]], ["evt-1"])
+
+        page = self.client.get("/api/admin/search", {"q": "example com", "type": "appointment", "pageSize": 2, "page": 2})
+        self.assertEqual((page.json()["total"], len(page.json()["results"])), (3, 1))
+
+    def test_rebuild_command_and_unknown_type(self):
+        SearchToken.objects.all().delete()
+        call_command("rebuild_search_index", stdout=io.StringIO())
+        self.assertEqual(search("scheduler")["total"], 2)
+        response = self.client.get("/api/admin/search", {"q": "x", "type": "user"})
+        self.assertEqual(response.status_code, 400)
+
+
+class TagIndexTests(ContentTestCase):
+    def setUp(self):
+        self.api = Project.objects.create(slug="api", title="API", tags=["Django", "Next.js"])
+        Project.objects.create(slug="site", title="Site", tags=["django", "CSS"], order=1)
+        Project.objects.create(slug="draft", title="Draft", tags=["Django"], is_published=False, order=2)
+
+    def test_tag_filter_and_cloud_use_the_index(self):
+        tagged = self.client.get("/api/projects", {"tag": "Django"}).json()["projects"]
+        self.assertEqual([project["slug"] for project in tagged], ["api", "site"])
+        self.assertEqual(self.client.get("/api/projects", {"tag": "nextjs"}).json()["projects"][0]["slug"], "api")
+
+        cloud = self.client.get("/api/tags").json()["tags"]
+        self.assertEqual(cloud[0], {"slug": "django", "name": "Django", "count": 2})
+        self.assertEqual({tag["slug"] for tag in cloud}, {"django", "nextjs", "css"})
+
+    def test_admin_tag_edits_resync_the_index(self):
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        self.client.patch(
+            f"/api/admin/projects/{self.api.id}", data=json.dumps({"tags": "Go"}), content_type="application/json"
+        )
+        self.assertEqual(
+            list(ProjectTag.objects.filter(project=self.api).values_list("tag__slug", flat=True)), ["go"]
+        )
+        self.assertEqual(self.client.get("/api/projects", {"tag": "go"}).json()["projects"][0]["slug"], "api")
+
+    def test_rebuild_matches_signal_maintained_index(self):
+        before = sorted(ProjectTag.objects.values_list("project_id", "tag__slug"))
+        ProjectTag.objects.all().delete()
+        rebuild_tag_index()
+        self.assertEqual(sorted(ProjectTag.objects.values_list("project_id", "tag__slug")), before)
+
+
+class WarmupTests(ContentTestCase):
+    def setUp(self):
+        Project.objects.create(slug="api", title="API", tags=["Django"], description="x" * 600)
+        Project.objects.create(slug="draft", title="Draft", is_published=False, order=1)
+
+    def test_warm_up_prebuilds_public_payloads(self):
+        self.addCleanup(setattr, warmup, "_report", warmup._report)
+        out = io.StringIO()
+        call_command("warm_up", stdout=out)
+        self.assertIn("1 projects", out.getvalue())
+        with self.assertNumQueries(0):
+            self.client.get("/api/portfolio-content", HTTP_ACCEPT_ENCODING="gzip")
+            self.client.get("/api/tags")
+            detail = self.client.get("/projects/api")
+        self.assertEqual(detail.json()["slug"], "api")
+
+    @override_settings(WARMUP_ON_START=True)
+    def test_readiness_waits_for_warm_up(self):
+        self.addCleanup(setattr, warmup, "_report", warmup._report)
+        warmup._report = None
+        response = self.client.get("/api/ready")
+        self.assertEqual((response.status_code, response.json()["ready"]), (503, False))
+        warmup.warm_up()
+        response = self.client.get("/api/ready")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["warmup"]["projects"], 1)
+
+
+class ContentCacheCoalescingTests(ContentTestCase):
+    def test_concurrent_cold_requests_share_one_build(self):
+        release = threading.Event()
+        calls = []
+
+        def build():
+            calls.append(1)
+            release.wait(2)
+            return b"payload"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_or_build("k", build, 1))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual((len(calls), results), (1, [b"payload"] * 5))
+
+    @override_settings(CONTENT_CACHE_SOFT_TTL=0)
+    def test_soft_expired_entry_is_served_while_refreshing_in_background(self):
+        get_or_build("k", lambda: b"old", 1)
+        self.assertEqual(get_or_build("k", lambda: b"new", 1), b"old")
+        flight = content_cache._flights.get("k")
+        if flight is not None:
+            flight.done.wait(2)
+        with override_settings(CONTENT_CACHE_SOFT_TTL=60):
+            self.assertEqual(get_or_build("k", lambda: b"unused", 1), b"new")
+
+    def test_stale_version_is_served_while_another_request_rebuilds(self):
+        get_or_build("k", lambda: b"v1", 1)
+        content_cache._flights["k"] = content_cache._Flight(2)
+        self.addCleanup(content_cache._flights.pop, "k", None)
+        self.assertEqual(get_or_build_entry("k", lambda: b"unused", 2), (b"v1", 1))
+        content_cache._flights.pop("k")
+        self.assertEqual(get_or_build_entry("k", lambda: b"v2", 2), (b"v2", 2))
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"], REPLICA_READ_PREFIXES=("/api/projects", "/api/admin/search"))
+class ReplicaRoutingTests(ContentTestCase):
+    def _route(self, request, write=False):
+        seen = {}
+
+        def view(request):
+            router = ReplicaRouter()
+            if write:
+                router.db_for_write(Project)
+            seen["read"] = router.db_for_read(Project)
+            return HttpResponse()
+
+        response = ReplicaRoutingMiddleware(view)(request)
+        return seen["read"], response
+
+    def test_public_and_dashboard_reads_use_replica(self):
+        self.assertEqual(self._route(RequestFactory().get("/api/projects"))[0], "replica1")
+        self.assertEqual(self._route(RequestFactory().get("/api/admin/search"))[0], "replica1")
+        self.assertEqual(self._route(RequestFactory().get("/api/admin/skills"))[0], "default")
+        self.assertEqual(self._route(RequestFactory().post("/api/projects"))[0], "default")
+        self.assertEqual(ReplicaRouter().db_for_read(Project), "default")
+
+    def test_writes_pin_reads_to_primary(self):
+        read, response = self._route(RequestFactory().post("/api/admin/skills"), write=True)
+        self.assertEqual(read, "default")
+        pin = response.cookies[PRIMARY_PIN_COOKIE].value
+
+        # The writer's next read follows the cookie; other clients keep reading replicas.
+        request = RequestFactory().get("/api/projects")
+        request.COOKIES[PRIMARY_PIN_COOKIE] = pin
+        self.assertEqual(self._route(request)[0], "default")
+        self.assertEqual(self._route(RequestFactory().get("/api/projects"))[0], "replica1")
+
+    def test_cached_content_is_built_from_primary(self):
+        def view(request):
+            return HttpResponse(get_or_build("k", lambda: ReplicaRouter().db_for_read(Project).encode(), 1))
+
+        response = ReplicaRoutingMiddleware(view)(RequestFactory().get("/api/projects"))
+        self.assertEqual(response.content, b"default")
+
+    def test_replicas_are_never_migrated(self):
+        self.assertFalse(ReplicaRouter().allow_migrate("replica1", "content"))
+        self.assertTrue(ReplicaRouter().allow_migrate("default", "content"))
+
+
+@skipUnless("replica1" in settings.DATABASES, "set DB_REPLICAS to run against a real replica alias")
+class ReplicaDatabaseTests(ContentTestCase):
+    def test_dashboard_reads_replica_until_an_admin_write(self):
+        Project.objects.create(slug="api", title="API")
+        routed = []
+        db_for_read = ReplicaRouter.db_for_read
+
+        def record(router, model, **hints):
+            routed.append(db_for_read(router, model, **hints))
+            return routed[-1]
+
+        self.client.force_login(get_user_model().objects.create_user("admin", is_staff=True))
+        with mock.patch.object(ReplicaRouter, "db_for_read", record):
+            self.assertEqual(self.client.get("/api/projects").json()["projects"][0]["slug"], "api")
+            self.assertNotIn("replica1", routed)
+            self.assertEqual(self.client.get("/api/admin/search", {"q": "api"}).json()["total"], 1)
+            self.assertIn("replica1", routed)
+
+            self.client.post("/api/admin/skills", data=json.dumps({"name": "Go"}), content_type="application/json")
+            routed.clear()
+            self.client.get("/api/admin/search", {"q": "api"})
+        self.assertEqual(set(routed), {"default"})
@@ -1,20 +1,45 @@
 from __future__ import annotations
 
+import json
+
 from django.db.models import Q
-from django.http import Http404, JsonResponse
+from django.http import Http404, HttpResponse
 from django.utils.text import slugify
 from django.views.decorators.http import require_GET
 
+from .bundle import (
+    PORTFOLIO_CONTENT_KEY,
+    PROJECTS_KEY,
+    TAGS_KEY,
+    get_content_bundle,
+    project_slug_key,
+    projects_tag_key,
+)
+from .cache import get_content_version, get_or_build, is_known_missing, remember_missing
+from .compression import cached_json_response
+from .encoding import encode_json, json_response
 from .models import ContactLink, Project, SiteSetting, Skill, SocialLink, Stat
+from .serializers import (
+    BUNDLED_PROJECT,
+    PUBLIC_CONTACT_LINK,
+    PUBLIC_PROJECT,
+    PUBLIC_SOCIAL_LINK,
+    PUBLIC_STAT,
+    FIELDS_PARAM,
+    FieldSelectionError,
+    Serializer,
+)
+from .tags import TAG_PARAM, tag_cloud, tag_slug
+from .warmup import is_ready, last_report
 
 
 SITE_NAME_KEY = "site.name"
 DISPLAY_NAME_KEY = "site.display_name"
 CONTACT_EMAIL_KEY = "site.contact_email"
+STATIC_ID_ERROR = "Static content mode has no project ids; look projects up by slug."
 
 
-def _get_site_settings():
-    settings = {item.key: item.value for item in SiteSetting.objects.all()}
+def _site_payload(settings: dict[str, str]) -> dict:
     return {
         "name": settings.get(SITE_NAME_KEY, "Portfolio"),
         "displayName": settings.get(DISPLAY_NAME_KEY, "Your Name"),
@@ -22,61 +47,190 @@ def _get_site_settings():
     }
 
 
-def _serialize_project(project: Project) -> dict:
+def _get_site_settings():
+    return _site_payload(dict(SiteSetting.objects.values_list("key", "value")))
+
+
+def _portfolio_payload(site, projects, stats, skills, social_links, contact_links) -> dict:
     return {
-        "id": project.id,
-        "slug": project.slug,
-        "title": project.title,
-        "description": project.description,
-        "tags": project.tags or [],
-        "link": project.link,
-        "github": project.github,
+        "site": site,
+        "projects": projects,
+        "stats": stats,
+        "skills": skills,
+        "socialLinks": social_links,
+        "contactLinks": contact_links,
     }
 
 
+def _project_serializer(request) -> Serializer:
+    """The requested project fields; static content mode has no id field and rejects ?fields=id."""
+    if get_content_bundle() is None:
+        return PUBLIC_PROJECT.from_request(request)
+    requested = {key.strip() for key in request.GET.get(FIELDS_PARAM, "").split(",")}
+    if "id" in requested:
+        raise FieldSelectionError(STATIC_ID_ERROR)
+    return BUNDLED_PROJECT.from_request(request)
+
+
+def _fields_error(exc: FieldSelectionError) -> HttpResponse:
+    return json_response({"errors": [str(exc)]}, status=400)
+
+
+def _select_bundled_projects(body: bytes, serializer: Serializer) -> dict:
+    payload = json.loads(body)
+    keys = serializer.keys
+    payload["projects"] = [{key: project[key] for key in keys} for project in payload["projects"]]
+    return payload
+
+
+def _cache_key(name: str, serializer: Serializer | None = None) -> str:
+    source = "bundle" if get_content_bundle() is not None else "db"
+    fields = ",".join(serializer.keys) if serializer is not None else ""
+    return f"{source}:{name}:{fields}"
+
+
+def _build_portfolio_content(project_serializer: Serializer) -> bytes:
+    bundle = get_content_bundle()
+    if bundle is not None:
+        body = bundle.get(PORTFOLIO_CONTENT_KEY)
+        if project_serializer is BUNDLED_PROJECT:
+            return body
+        return encode_json(_select_bundled_projects(body, project_serializer))
+
+    return encode_json(
+        _portfolio_payload(
+            _get_site_settings(),
+            project_serializer.serialize_rows(Project.objects.filter(is_published=True)),
+            PUBLIC_STAT.serialize_rows(Stat.objects.all()),
+            list(Skill.objects.values_list("name", flat=True)),
+            PUBLIC_SOCIAL_LINK.serialize_rows(SocialLink.objects.all()),
+            PUBLIC_CONTACT_LINK.serialize_rows(ContactLink.objects.all()),
+        )
+    )
+
+
+def _build_projects_list(serializer: Serializer, tag: str | None = None) -> bytes:
+    bundle = get_content_bundle()
+    if bundle is not None:
+        body = bundle.get(PROJECTS_KEY if tag is None else projects_tag_key(tag))
+        if body is None:
+            return encode_json({"projects": []})
+        if serializer is BUNDLED_PROJECT:
+            return body
+        return encode_json(_select_bundled_projects(body, serializer))
+
+    projects = Project.objects.filter(is_published=True)
+    if tag is not None:
+        projects = projects.filter(tag_links__tag__slug=tag)
+    return encode_json({"projects": serializer.serialize_rows(projects)})
+
+
+def _build_tag_cloud() -> bytes:
+    bundle = get_content_bundle()
+    if bundle is not None:
+        return bundle.get(TAGS_KEY) or encode_json({"tags": []})
+    return encode_json({"tags": tag_cloud()})
+
+
+def _is_known_tag(tag: str) -> bool:
+    """Whether any published project carries tag, answered from the bundle or the cached tag cloud."""
+    bundle = get_content_bundle()
+    if bundle is not None:
+        return bundle.get(projects_tag_key(tag)) is not None
+    cloud = json.loads(get_or_build(_cache_key(TAGS_KEY), _build_tag_cloud))
+    return any(item["slug"] == tag for item in cloud["tags"])
+
+
+def _build_project_detail(project: str) -> bytes:
+    slug = slugify(project)
+
+    bundle = get_content_bundle()
+    if bundle is not None:
+        body = bundle.get(project_slug_key(slug))
+        if body is None:
+            raise Http404("Project not found")
+        return body
+
+    project_query = Project.objects.filter(is_published=True).filter(Q(slug=slug))
+    if project.isdigit():
+        project_query = project_query | Project.objects.filter(is_published=True, id=int(project))
+
+    rows = PUBLIC_PROJECT.serialize_rows(project_query[:1])
+    if not rows:
+        raise Http404("Project not found")
+
+    return encode_json(rows[0])
+
+
 @require_GET
 def portfolio_content(request):
-    return JsonResponse(
-        {
-            "site": _get_site_settings(),
-            "projects": [_serialize_project(p) for p in Project.objects.filter(is_published=True)],
-            "stats": [
-                {"number": stat.number, "label": stat.label, "icon": stat.icon}
-                for stat in Stat.objects.all()
-            ],
-            "skills": [skill.name for skill in Skill.objects.all()],
-            "socialLinks": [
-                {"name": link.name, "url": link.url, "icon": link.icon}
-                for link in SocialLink.objects.all()
-            ],
-            "contactLinks": [
-                {
-                    "icon": link.icon,
-                    "title": link.title,
-                    "description": link.description,
-                    "href": link.href,
-                }
-                for link in ContactLink.objects.all()
-            ],
-        }
+    try:
+        project_serializer = _project_serializer(request)
+    except FieldSelectionError as exc:
+        return _fields_error(exc)
+
+    return cached_json_response(
+        request,
+        _cache_key(PORTFOLIO_CONTENT_KEY, project_serializer),
+        lambda: _build_portfolio_content(project_serializer),
     )
 
 
 @require_GET
 def projects_list(request):
-    return JsonResponse({"projects": [_serialize_project(p) for p in Project.objects.filter(is_published=True)]})
+    try:
+        serializer = _project_serializer(request)
+    except FieldSelectionError as exc:
+        return _fields_error(exc)
+
+    tag = request.GET.get(TAG_PARAM)
+    if tag is None:
+        return cached_json_response(
+            request, _cache_key(PROJECTS_KEY, serializer), lambda: _build_projects_list(serializer)
+        )
+    tag = tag_slug(tag)
+    if not _is_known_tag(tag):
+        # One shared answer instead of a cache entry per made-up tag.
+        return json_response({"projects": []})
+    return cached_json_response(
+        request,
+        _cache_key(f"{PROJECTS_KEY}:tag={tag}", serializer),
+        lambda: _build_projects_list(serializer, tag),
+    )
+
+
+@require_GET
+def tags_list(request):
+    return cached_json_response(request, _cache_key(TAGS_KEY), _build_tag_cloud)
 
 
 @require_GET
 def project_detail(request, project: str):
-    slug = slugify(project)
-    project_query = Project.objects.filter(is_published=True).filter(Q(slug=slug))
-    if project.isdigit():
-        project_query = project_query | Project.objects.filter(is_published=True, id=int(project))
+    bundle = get_content_bundle()
+    if bundle is not None and project.isdigit() and bundle.get(project_slug_key(project)) is None:
+        return json_response({"errors": [STATIC_ID_ERROR]}, status=400)
 
-    project_obj = project_query.first()
+    # The lookup only depends on the slugified segment, so Foo and foo share one entry.
+    slug = slugify(project)
+    key = _cache_key(f"project:{slug}")
+    if bundle is not None:
+        return cached_json_response(request, key, lambda: _build_project_detail(slug))
 
-    if project_obj is None:
+    version = get_content_version()
+    if is_known_missing(key, version):
         raise Http404("Project not found")
+    try:
+        return cached_json_response(request, key, lambda: _build_project_detail(slug))
+    except Http404:
+        remember_missing(key, version)
+        raise
 
-    return JsonResponse(_serialize_project(project_obj))
+
+@require_GET
+def readiness(request):
+    """200 once this worker has warmed up (or warm-up is disabled), 503 before that."""
+    report = last_report()
+    payload = {"ready": is_ready(), "warmedUp": report is not None}
+    if report is not None:
+        payload["warmup"] = {"payloads": report.payloads, "projects": report.projects, "seconds": round(report.seconds, 3)}
+    return json_response(payload, status=200 if payload["ready"] else 503)
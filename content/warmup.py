@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import get_resolver
+
+from .bundle import PROJECTS_KEY, get_content_bundle
+from .models import Project
+
+logger = logging.getLogger(__name__)
+
+# Request variants pre-built for every public payload: identity and gzip.
+WARMUP_ACCEPT_ENCODINGS = ("", "gzip")
+
+
+@dataclass
+class WarmupReport:
+    connections: list[str] = field(default_factory=list)
+    payloads: int = 0
+    projects: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.connections)} database connection(s), {self.payloads} payloads "
+            f"({self.projects} projects) in {self.seconds:.2f}s"
+        )
+
+
+_lock = threading.Lock()
+_report: WarmupReport | None = None
+
+
+def is_ready() -> bool:
+    """A worker is ready once warmed up, or immediately when startup warm-up is off."""
+    return _report is not None or not getattr(settings, "WARMUP_ON_START", False)
+
+
+def last_report() -> WarmupReport | None:
+    return _report
+
+
+def _published_project_slugs() -> list[str]:
+    bundle = get_content_bundle()
+    if bundle is not None:
+        return [project["slug"] for project in json.loads(bundle.get(PROJECTS_KEY))["projects"]]
+    return list(Project.objects.filter(is_published=True).values_list("slug", flat=True))
+
+
+def warm_up() -> WarmupReport:
+    """Open database connections, load the URLconf and views, and build every public payload.
+
+    Payloads go through the views themselves, so the cache entries (and their
+    compressed variants) are exactly the ones requests will look up.
+    """
+    global _report
+    with _lock:
+        started = time.perf_counter()
+        report = WarmupReport()
+        for alias in connections:
+            connections[alias].ensure_connection()
+            report.connections.append(alias)
+
+        # Resolving the URLconf imports every view module.
+        get_resolver().url_patterns
+        from . import views  # views import this module for the readiness check
+
+        factory = RequestFactory()
+        slugs = _published_project_slugs()
+        targets = [
+            (views.portfolio_content, "/api/portfolio-content", {}),
+            (views.projects_list, "/api/projects", {}),
+            (views.tags_list, "/api/tags", {}),
+        ]
+        targets += [(views.project_detail, f"/projects/{slug}", {"project": slug}) for slug in slugs]
+        for view, path, kwargs in targets:
+            for encoding in WARMUP_ACCEPT_ENCODINGS:
+                view(factory.get(path, HTTP_ACCEPT_ENCODING=encoding), **kwargs)
+                report.payloads += 1
+
+        report.projects = len(slugs)
+        report.seconds = time.perf_counter() - started
+        _report = report
+        return report
+
+
+def warm_up_on_start() -> None:
+    """Worker-start hook: a failed warm-up leaves the worker not ready instead of crashing it."""
+    try:
+        report = warm_up()
+    except Exception:
+        logger.exception("Startup warm-up failed; /api/ready will keep answering 503.")
+        return
+    logger.info("Warmed up %s.", report)
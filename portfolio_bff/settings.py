@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 
 import pymysql
+from django.core.exceptions import ImproperlyConfigured
 
 pymysql.install_as_MySQLdb()
 
@@ -34,6 +35,8 @@ ENABLE_DJANGO_ADMIN = os.getenv("ENABLE_DJANGO_ADMIN", "").strip().lower() in {"
 
 admin_ui_origins_raw = os.getenv("ADMIN_UI_ORIGINS", "http://localhost:3001")
 ADMIN_UI_ORIGINS = [origin.strip() for origin in admin_ui_origins_raw.split(",") if origin.strip()]
+# Seconds browsers may cache an admin API preflight response.
+ADMIN_CORS_MAX_AGE = int(os.getenv("ADMIN_CORS_MAX_AGE", "7200"))
 
 allowed_hosts_raw = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1,portfolio-bff")
 if allowed_hosts_raw.strip() == "*":
@@ -66,14 +69,26 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # Answers admin API preflights before the rest of the stack runs.
+    "content.middleware.AdminCorsMiddleware",
+    # Turns away clients over RATE_LIMIT_PUBLIC before any cache or database access.
+    "content.middleware.PublicRateLimitMiddleware",
+    "content.middleware.ReplicaRoutingMiddleware",
+    "content.middleware.JsonCompressionMiddleware",
+    # Session, CSRF, auth and messages are skipped for GETs to PUBLIC_FAST_PATH_PREFIXES.
+    "content.middleware.FastPathSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "content.middleware.FastPathCsrfViewMiddleware",
+    "content.middleware.FastPathAuthenticationMiddleware",
+    "content.middleware.FastPathMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+PUBLIC_FAST_PATH_PREFIXES = ("/api/portfolio-content", "/api/projects", "/api/tags", "/api/ready", "/projects/")
+# Safe requests under these prefixes read from DB_REPLICAS when configured: the appointment
+# dashboard and search. Public content is cached and always rebuilt from the primary.
+REPLICA_READ_PREFIXES = ("/api/admin/appointments", "/api/admin/search")
+
 ROOT_URLCONF = "portfolio_bff.urls"
 
 TEMPLATES = [
@@ -98,19 +113,187 @@ WSGI_APPLICATION = "portfolio_bff.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.mysql",
-        "NAME": os.getenv("DB_NAME", "portfolio_bff"),
-        "USER": os.getenv("DB_USER", "portfolio"),
-        "PASSWORD": os.getenv("DB_PASSWORD", "portfolio"),
-        "HOST": os.getenv("DB_HOST", "127.0.0.1"),
-        "PORT": os.getenv("DB_PORT", "3306"),
-        "OPTIONS": {
-            "charset": "utf8mb4",
-        },
+# DB_ENGINE=sqlite runs on local SQLite files (DB_NAME is then a path relative to
+# the project root), e.g. to try replica routing without MySQL.
+DB_ENGINE = os.getenv("DB_ENGINE", "mysql").strip().lower() or "mysql"
+
+if DB_ENGINE == "sqlite":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / os.getenv("DB_NAME", "db.sqlite3"),
+        }
     }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.mysql",
+            "NAME": os.getenv("DB_NAME", "portfolio_bff"),
+            "USER": os.getenv("DB_USER", "portfolio"),
+            "PASSWORD": os.getenv("DB_PASSWORD", "portfolio"),
+            "HOST": os.getenv("DB_HOST", "127.0.0.1"),
+            "PORT": os.getenv("DB_PORT", "3306"),
+            "OPTIONS": {
+                "charset": "utf8mb4",
+            },
+        }
+    }
+
+# Read replicas
+# DB_REPLICAS lists replica hosts ("host" or "host:port") for MySQL, or file paths
+# for SQLite. They become the aliases replica1, replica2, ... and serve reads for
+# REPLICA_READ_PREFIXES; writes always go to default.
+
+DATABASE_REPLICAS = []
+replicas_raw = os.getenv("DB_REPLICAS", "")
+for index, replica in enumerate([entry.strip() for entry in replicas_raw.split(",") if entry.strip()], start=1):
+    if DB_ENGINE == "sqlite":
+        replica_config = {**DATABASES["default"], "NAME": BASE_DIR / replica}
+    else:
+        replica_host, _, replica_port = replica.partition(":")
+        replica_config = {
+            **DATABASES["default"],
+            "HOST": replica_host,
+            "PORT": replica_port or DATABASES["default"]["PORT"],
+            "USER": os.getenv("DB_REPLICA_USER", DATABASES["default"]["USER"]),
+            "PASSWORD": os.getenv("DB_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]),
+        }
+    # Tests read replicas through the primary's test database.
+    replica_config["TEST"] = {"MIRROR": "default"}
+    DATABASES[f"replica{index}"] = replica_config
+    DATABASE_REPLICAS.append(f"replica{index}")
+
+DATABASE_ROUTERS = ["content.db_router.ReplicaRouter"]
+
+# Seconds reads stay on the primary after a write, so a session (and any content
+# rebuild) reads its own writes while replicas catch up.
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
+
+# Cache
+# Local memory by default; set REDIS_URL to share cached content across workers.
+
+redis_url = os.getenv("REDIS_URL", "").strip()
+if redis_url:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": redis_url}}
+else:
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Cached public payloads older than the soft TTL are served while one background
+# thread per key rebuilds them; the hard TTL is when they drop out of the cache.
+CONTENT_CACHE_SOFT_TTL = int(os.getenv("CONTENT_CACHE_SOFT_TTL", "300"))
+CONTENT_CACHE_HARD_TTL = int(os.getenv("CONTENT_CACHE_HARD_TTL", "86400"))
+# Project detail lookups that found nothing are remembered this long (seconds) per content version.
+CONTENT_CACHE_NEGATIVE_TTL = int(os.getenv("CONTENT_CACHE_NEGATIVE_TTL", "30"))
+content_cache_background_raw = os.getenv("CONTENT_CACHE_BACKGROUND_REFRESH", "true")
+CONTENT_CACHE_BACKGROUND_REFRESH = content_cache_background_raw.strip().lower() in {"1", "true", "yes"}
+# The content version counter lives in the database; each process re-reads it at
+# most this often (seconds), so edits made elsewhere show up within this delay.
+CONTENT_VERSION_CHECK_INTERVAL = float(os.getenv("CONTENT_VERSION_CHECK_INTERVAL", "1"))
+
+
+# Warm-up
+# Build public payloads and open DB connections when a WSGI worker starts;
+# /api/ready answers 503 until that has finished.
+
+WARMUP_ON_START = os.getenv("WARMUP_ON_START", "").strip().lower() in {"1", "true", "yes"}
+
+
+# Sessions
+# "cached_db" reads sessions from the cache and falls back to the database;
+# "signed_cookies" keeps them client-side; "db" is Django's default. The cached
+# backends need a cache shared by every worker, or a logout in one worker
+# leaves the session valid in the others: they default on only with REDIS_URL,
+# and "cache" (which has no database copy) is refused without it.
+
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
 }
+session_backend = os.getenv("SESSION_BACKEND", "").strip() or ("cached_db" if redis_url else "db")
+if session_backend not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"Unknown SESSION_BACKEND {session_backend!r}; expected one of {', '.join(SESSION_ENGINES)}."
+    )
+if session_backend == "cache" and not redis_url:
+    raise ImproperlyConfigured("SESSION_BACKEND=cache needs REDIS_URL; local memory is not shared between workers.")
+SESSION_ENGINE = SESSION_ENGINES[session_backend]
+
+# Seconds the authenticated user is cached per session; 0 disables the cache.
+# Logouts and user edits only invalidate it across workers with REDIS_URL, so it is off without.
+ADMIN_USER_CACHE_TIMEOUT = int(os.getenv("ADMIN_USER_CACHE_TIMEOUT", "60" if redis_url else "0"))
+
+# Delta-sync cursors stop short of change-log entries from the last
+# CHANGE_LOG_SETTLE_SECONDS, so a slow transaction committing a lower id is not skipped.
+CHANGE_LOG_SETTLE_SECONDS = int(os.getenv("CHANGE_LOG_SETTLE_SECONDS", "30"))
+
+
+# Rate limiting
+# Quotas are "<requests>/<seconds>"; an empty value disables that limit. Logins
+# are limited per client IP and per username before the password is hashed;
+# RATE_LIMIT_PUBLIC applies per client IP to RATE_LIMIT_PUBLIC_PREFIXES: the
+# public fast-path prefixes except the /api/ready readiness probe.
+# "local" keeps token buckets in each process; "cache" shares sliding-window
+# counters across workers through the cache (set REDIS_URL).
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "local").strip().lower() or "local"
+RATE_LIMIT_LOGIN_IP = os.getenv("RATE_LIMIT_LOGIN_IP", "20/60")
+RATE_LIMIT_LOGIN_USER = os.getenv("RATE_LIMIT_LOGIN_USER", "5/60")
+RATE_LIMIT_PUBLIC = os.getenv("RATE_LIMIT_PUBLIC", "")
+RATE_LIMIT_PUBLIC_PREFIXES = tuple(prefix for prefix in PUBLIC_FAST_PATH_PREFIXES if prefix != "/api/ready")
+# Reverse proxies in front of the app that append to X-Forwarded-For; 0 uses REMOTE_ADDR.
+RATE_LIMIT_PROXY_COUNT = int(os.getenv("RATE_LIMIT_PROXY_COUNT", "0"))
+
+
+# Appointment calendar
+# Appointments overlapping the next APPOINTMENT_HOT_WINDOW_DAYS are kept in a
+# per-process interval index, rebuilt when the projection changes or after
+# APPOINTMENT_HOT_INDEX_TTL seconds (changes made by another process are only
+# seen through a shared cache such as Redis). The longest appointment duration
+# bounding overlap queries is re-read from the database on the same TTL.
+
+APPOINTMENT_HOT_WINDOW_DAYS = int(os.getenv("APPOINTMENT_HOT_WINDOW_DAYS", "14"))
+APPOINTMENT_HOT_INDEX_TTL = int(os.getenv("APPOINTMENT_HOT_INDEX_TTL", "30"))
+
+# iCalendar feed: appointments that ended more than APPOINTMENT_FEED_PAST_DAYS
+# ago are left out; rendered feeds are cached per newest projection change, once
+# that change is APPOINTMENT_FEED_SETTLE_SECONDS old.
+APPOINTMENT_FEED_PAST_DAYS = int(os.getenv("APPOINTMENT_FEED_PAST_DAYS", "90"))
+APPOINTMENT_FEED_CACHE_TIMEOUT = int(os.getenv("APPOINTMENT_FEED_CACHE_TIMEOUT", "3600"))
+APPOINTMENT_FEED_SETTLE_SECONDS = int(os.getenv("APPOINTMENT_FEED_SETTLE_SECONDS", "5"))
+
+# Live dashboard stream: one query for new events per interval (seconds) per
+# process, fanned out to every connected client; idle streams get a comment
+# every APPOINTMENT_STREAM_HEARTBEAT seconds. Events received in the last
+# APPOINTMENT_STREAM_SETTLE seconds are re-read every tick, since a slower
+# transaction can still commit an event with a lower id.
+APPOINTMENT_STREAM_INTERVAL = float(os.getenv("APPOINTMENT_STREAM_INTERVAL", "2"))
+APPOINTMENT_STREAM_HEARTBEAT = int(os.getenv("APPOINTMENT_STREAM_HEARTBEAT", "15"))
+APPOINTMENT_STREAM_SETTLE = float(os.getenv("APPOINTMENT_STREAM_SETTLE", "10"))
+
+
+# JSON responses
+# "auto" uses orjson when installed and falls back to the stdlib encoder.
+# Also accepts "orjson", "stdlib" or a dotted path to a callable(data) -> bytes.
+
+RESPONSE_JSON_ENCODER = os.getenv("RESPONSE_JSON_ENCODER", "auto").strip() or "auto"
+
+# JSON bodies smaller than this are sent uncompressed.
+RESPONSE_COMPRESSION_MIN_LENGTH = int(os.getenv("RESPONSE_COMPRESSION_MIN_LENGTH", "512"))
+
+
+# Static content mode
+# When set, public content endpoints serve the precompiled bundle written by
+# `manage.py build_content_bundle` instead of querying the database.
+
+CONTENT_BUNDLE_PATH = os.getenv("CONTENT_BUNDLE_PATH", "").strip()
+
+
+# Appointment events
+# How the raw Kafka message is kept per event: full, none, compressed or diff.
+
+APPOINTMENT_PAYLOAD_STORAGE = os.getenv("APPOINTMENT_PAYLOAD_STORAGE", "full").strip().lower() or "full"
 
 
 # Password validation
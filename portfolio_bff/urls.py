@@ -7,29 +7,53 @@ from content import admin_api, views as content_views
 urlpatterns = [
     path("api/portfolio-content", content_views.portfolio_content, name="portfolio-content"),
     path("api/projects", content_views.projects_list, name="projects-list"),
+    path("api/tags", content_views.tags_list, name="tags-list"),
+    path("api/ready", content_views.readiness, name="readiness"),
     path("projects/<slug:project>", content_views.project_detail, name="project-detail"),
     path("api/admin/csrf", admin_api.admin_csrf, name="admin-csrf"),
     path("api/admin/session", admin_api.admin_session, name="admin-session"),
     path("api/admin/login", admin_api.admin_login, name="admin-login"),
     path("api/admin/logout", admin_api.admin_logout, name="admin-logout"),
+    path("api/admin/rate-limits", admin_api.admin_rate_limits, name="admin-rate-limits"),
     path("api/admin/site-settings", admin_api.admin_site_settings, name="admin-site-settings"),
-    path("api/admin/pages", admin_api.admin_pages, name="admin-pages"),
-    path("api/admin/pages/<int:page_id>", admin_api.admin_page_detail, name="admin-page-detail"),
-    path("api/admin/projects", admin_api.admin_projects, name="admin-projects"),
-    path("api/admin/projects/<int:project_id>", admin_api.admin_project_detail, name="admin-project-detail"),
-    path("api/admin/stats", admin_api.admin_stats, name="admin-stats"),
-    path("api/admin/stats/<int:stat_id>", admin_api.admin_stat_detail, name="admin-stat-detail"),
-    path("api/admin/skills", admin_api.admin_skills, name="admin-skills"),
-    path("api/admin/skills/<int:skill_id>", admin_api.admin_skill_detail, name="admin-skill-detail"),
-    path("api/admin/social-links", admin_api.admin_social_links, name="admin-social-links"),
-    path("api/admin/social-links/<int:link_id>", admin_api.admin_social_link_detail, name="admin-social-link-detail"),
-    path("api/admin/contact-links", admin_api.admin_contact_links, name="admin-contact-links"),
+    *[pattern for resource in admin_api.ADMIN_RESOURCES for pattern in resource.urls()],
+    path("api/admin/appointments", admin_api.admin_appointments, name="admin-appointments"),
     path(
-        "api/admin/contact-links/<int:link_id>",
-        admin_api.admin_contact_link_detail,
-        name="admin-contact-link-detail",
+        "api/admin/appointments/current",
+        admin_api.admin_appointments_current,
+        name="admin-appointments-current",
+    ),
+    path(
+        "api/admin/appointments/calendar",
+        admin_api.admin_appointments_calendar,
+        name="admin-appointments-calendar",
+    ),
+    path(
+        "api/admin/appointments/conflicts",
+        admin_api.admin_appointments_conflicts,
+        name="admin-appointments-conflicts",
+    ),
+    path(
+        "api/admin/appointments/feed.ics",
+        admin_api.admin_appointments_feed,
+        name="admin-appointments-feed",
+    ),
+    path(
+        "api/admin/appointments/feed-url",
+        admin_api.admin_appointments_feed_url,
+        name="admin-appointments-feed-url",
+    ),
+    path(
+        "api/admin/appointments/stream",
+        admin_api.admin_appointments_stream,
+        name="admin-appointments-stream",
+    ),
+    path("api/admin/search", admin_api.admin_search, name="admin-search"),
+    path(
+        "api/admin/appointments/export",
+        admin_api.admin_appointments_export,
+        name="admin-appointments-export",
     ),
-    path("api/admin/appointments", admin_api.admin_appointments, name="admin-appointments"),
 ]
 
 
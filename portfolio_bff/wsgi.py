@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "portfolio_bff.settings")
 
 application = get_wsgi_application()
+
+# Build caches and open connections before this worker takes traffic.
+from django.conf import settings  # noqa: E402
+
+if settings.WARMUP_ON_START:
+    from content.warmup import warm_up_on_start
+
+    warm_up_on_start()